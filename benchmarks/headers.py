@@ -0,0 +1,101 @@
+"""Benchmark common :class:`~werkzeug.datastructures.Headers` operations on a
+response sized header set, compared to scanning a plain list of tuples, which
+is how lookups worked before keys were indexed.
+
+Run with ``python benchmarks/headers.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from werkzeug.datastructures import Headers
+
+SIZES = (5, 20, 50)
+NUMBER = 20_000
+
+
+def make_items(size: int) -> list[tuple[str, str]]:
+    return [(f"X-Header-{i}", str(i)) for i in range(size)]
+
+
+def scan_get(items: list[tuple[str, str]], key: str) -> str | None:
+    ikey = key.lower()
+
+    for k, v in items:
+        if k.lower() == ikey:
+            return v
+
+    return None
+
+
+def scan_set(items: list[tuple[str, str]], key: str, value: str) -> None:
+    ikey = key.lower()
+
+    for idx, (k, _) in enumerate(items):
+        if k.lower() == ikey:
+            items[idx] = (key, value)
+            return
+
+    items.append((key, value))
+
+
+def middleware(headers: Headers) -> None:
+    # What a few middleware layers typically do to a response.
+    _ = "Content-Encoding" in headers
+    headers.get("Cache-Control")
+    headers.get("X-Header-3")
+    headers.set("Vary", "Accept-Encoding")
+    headers.setdefault("X-Frame-Options", "DENY")
+    headers.getlist("Set-Cookie")
+
+
+def scan_middleware(items: list[tuple[str, str]]) -> None:
+    _ = scan_get(items, "Content-Encoding") is not None
+    scan_get(items, "Cache-Control")
+    scan_get(items, "X-Header-3")
+    scan_set(items, "Vary", "Accept-Encoding")
+
+    if scan_get(items, "X-Frame-Options") is None:
+        items.append(("X-Frame-Options", "DENY"))
+
+    [v for k, v in items if k.lower() == "set-cookie"]
+
+
+def run(size: int) -> None:
+    items = make_items(size)
+    headers = Headers(items)
+    cases = {
+        "get miss": (
+            lambda: scan_get(items, "X-Missing"),
+            lambda: headers.get("X-Missing"),
+        ),
+        "get last": (
+            lambda: scan_get(items, f"x-header-{size - 1}"),
+            lambda: headers.get(f"x-header-{size - 1}"),
+        ),
+        "middleware": (
+            lambda: scan_middleware(items),
+            lambda: middleware(headers),
+        ),
+    }
+
+    for name, (baseline, indexed) in cases.items():
+        base_time = min(timeit.repeat(baseline, number=NUMBER, repeat=3))
+        index_time = min(timeit.repeat(indexed, number=NUMBER, repeat=3))
+        print(
+            f"{size:>8} {name:<12}"
+            f" {base_time / NUMBER * 1e6:>10.2f}us"
+            f" {index_time / NUMBER * 1e6:>10.2f}us"
+        )
+
+
+def main() -> None:
+    print(f"{'headers':>8} {'operation':<12} {'list scan':>12} {'indexed':>12}")
+
+    for size in SIZES:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
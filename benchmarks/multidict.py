@@ -0,0 +1,80 @@
+"""Benchmark :class:`~werkzeug.datastructures.CompactImmutableMultiDict`
+against :class:`~werkzeug.datastructures.ImmutableMultiDict` for parsed query
+strings, measuring memory used and the time to build and read them.
+
+Run with ``python benchmarks/multidict.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from urllib.parse import parse_qsl
+
+from werkzeug.datastructures import CompactImmutableMultiDict
+from werkzeug.datastructures import ImmutableMultiDict
+
+SIZES = (5, 20, 50)
+NUMBER = 10_000
+CLASSES = (ImmutableMultiDict, CompactImmutableMultiDict)
+
+
+def make_query(size: int) -> str:
+    # Every fifth key is repeated, as with checkbox or multi-select fields.
+    parts = [f"key{i}=value{i}" for i in range(size)]
+    parts.extend(f"key{i}=other{i}" for i in range(0, size, 5))
+    return "&".join(parts)
+
+
+def memory(
+    cls: type[ImmutableMultiDict[str, str]], items: list[tuple[str, str]]
+) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    d = cls(items)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del d
+    return after - before
+
+
+def read(d: ImmutableMultiDict[str, str], keys: list[str]) -> None:
+    for key in keys:
+        d[key]
+
+    d.getlist("key0")
+    list(d.items(multi=True))
+
+
+def measure(
+    cls: type[ImmutableMultiDict[str, str]],
+    items: list[tuple[str, str]],
+    keys: list[str],
+) -> tuple[int, float, float]:
+    d = cls(items)
+    build_time = min(timeit.repeat(lambda: cls(items), number=NUMBER, repeat=3))
+    read_time = min(timeit.repeat(lambda: read(d, keys), number=NUMBER, repeat=3))
+    return memory(cls, items), build_time / NUMBER, read_time / NUMBER
+
+
+def run(size: int) -> None:
+    items = parse_qsl(make_query(size), keep_blank_values=True)
+    keys = [f"key{i}" for i in range(size)]
+
+    for cls in CLASSES:
+        size_bytes, build_time, read_time = measure(cls, items, keys)
+        print(
+            f"{size:>5} {cls.__name__:<26} {size_bytes:>8}B"
+            f" {build_time * 1e6:>9.2f}us {read_time * 1e6:>9.2f}us"
+        )
+
+
+def main() -> None:
+    print(f"{'keys':>5} {'class':<26} {'memory':>9} {'build':>11} {'read':>11}")
+
+    for size in SIZES:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
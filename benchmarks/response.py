@@ -0,0 +1,66 @@
+"""Benchmark calling a :class:`~werkzeug.wrappers.Response` as a WSGI
+application with JSON sized bodies, compared to going through
+:meth:`~werkzeug.wrappers.Response.get_wsgi_response`, which is how every
+response was sent before simple responses were detected.
+
+Run with ``python benchmarks/response.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import typing as t
+
+from werkzeug.test import create_environ
+from werkzeug.wrappers import Response
+
+SIZES = (2, 20, 200)
+NUMBER = 20_000
+
+
+def start_response(status: str, headers: list[tuple[str, str]]) -> None:
+    pass
+
+
+def make_body(size: int) -> str:
+    return json.dumps([{"id": i, "name": f"item {i}", "ok": True} for i in range(size)])
+
+
+def call(body: str, environ: dict[str, t.Any]) -> None:
+    response = Response(body, mimetype="application/json")
+    b"".join(response(environ, start_response))
+
+
+def call_full(body: str, environ: dict[str, t.Any]) -> None:
+    response = Response(body, mimetype="application/json")
+    app_iter, status, headers = response.get_wsgi_response(environ)
+    start_response(status, headers)
+    b"".join(app_iter)
+
+
+def measure(func: t.Callable[[str, dict[str, t.Any]], None], size: int) -> float:
+    body = make_body(size)
+    environ = create_environ()
+    return min(timeit.repeat(lambda: func(body, environ), number=NUMBER, repeat=3))
+
+
+def run(size: int) -> None:
+    length = len(make_body(size))
+    full = measure(call_full, size)
+    fast = measure(call, size)
+    print(
+        f"{length:>7}B {NUMBER / full:>12,.0f}/s {NUMBER / fast:>12,.0f}/s"
+        f" {full / fast:>7.2f}x"
+    )
+
+
+def main() -> None:
+    print(f"{'body':>8} {'full':>14} {'simple':>14} {'speedup':>8}")
+
+    for size in SIZES:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
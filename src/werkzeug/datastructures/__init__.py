@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing as t
 
 from .accept import Accept as Accept
+from .accept import AcceptOffers as AcceptOffers
 from .accept import LanguageAccept as LanguageAccept
 from .accept import MIMEAccept as MIMEAccept
 from .auth import Authorization as Authorization
@@ -25,6 +26,7 @@ from .range import IfRange as IfRange
 from .range import Range as Range
 from .structures import CallbackDict as CallbackDict
 from .structures import CombinedMultiDict as CombinedMultiDict
+from .structures import CompactImmutableMultiDict as CompactImmutableMultiDict
 from .structures import HeaderSet as HeaderSet
 from .structures import ImmutableDict as ImmutableDict
 from .structures import ImmutableList as ImmutableList
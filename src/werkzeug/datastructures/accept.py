@@ -5,6 +5,7 @@ import collections.abc as cabc
 import re
 import typing as t
 
+from ..http import _parse_cache
 from ..http import dump_options_header
 from ..http import parse_list_header
 from ..http import parse_options_header
@@ -16,6 +17,85 @@ if t.TYPE_CHECKING:
 _q_value_re = re.compile(r"-?\d+(\.\d+)?", re.ASCII)
 
 
+@_parse_cache
+def _accept_from_header(cls: type[Accept], value: str) -> Accept:
+    return cls._from_header(value)
+
+
+class AcceptOffers(cabc.Sequence[str]):
+    """A fixed list of values offered by the server, such as the mimetypes
+    a view can render, prepared for repeated negotiation. Create it once
+    and pass it to :meth:`Accept.best_match` in place of a list.
+
+    .. code-block:: python
+
+        offers = AcceptOffers(["application/json", "text/html"])
+
+        def view(request):
+            mimetype = request.accept_mimetypes.best_match(offers)
+
+    The first time it is used with a type of :class:`Accept`, the offers
+    are normalized and indexed for that type's matching rules. Matching is
+    then a single pass over the client's values, looking up the offers each
+    value matches instead of comparing every pair. The result is the same
+    as passing a list.
+
+    :param values: The values offered by the server, in order of
+        preference.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(self, values: cabc.Iterable[str]) -> None:
+        self._values = tuple(values)
+        self._indexes: dict[type[Accept], dict[t.Hashable, list[int]]] = {}
+        self._primary: AcceptOffers | None = None
+
+    @t.overload
+    def __getitem__(self, index: int) -> str: ...
+    @t.overload
+    def __getitem__(self, index: slice) -> tuple[str, ...]: ...
+    def __getitem__(self, index: int | slice) -> str | tuple[str, ...]:
+        return self._values[index]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> cabc.Iterator[str]:
+        return iter(self._values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._values)!r})"
+
+    def _index(self, cls: type[Accept]) -> dict[t.Hashable, list[int]]:
+        """Map each match key to the positions of the offers it matches, for
+        the given accept class.
+        """
+        index = self._indexes.get(cls)
+
+        if index is None:
+            index = {}
+
+            for pos, value in enumerate(self._values):
+                for key in cls._offer_keys(value):
+                    index.setdefault(key, []).append(pos)
+
+            self._indexes[cls] = index
+
+        return index
+
+    def _primary_offers(self) -> AcceptOffers:
+        """The primary language tags of the offers, used as a fallback by
+        :meth:`LanguageAccept.best_match`.
+        """
+        if self._primary is None:
+            self._primary = AcceptOffers(
+                _locale_delim_re.split(value, 1)[0] for value in self._values
+            )
+
+        return self._primary
+
+
 class Accept(ImmutableList[tuple[str, float]]):
     """An :class:`Accept` object is just a list subclass for lists of
     ``(value, quality)`` tuples.  It is automatically sorted by specificity
@@ -42,6 +122,9 @@ class Accept(ImmutableList[tuple[str, float]]):
     >>> a['utf7']
     0
 
+    .. versionchanged:: 3.2
+        :meth:`best_match` accepts :class:`AcceptOffers`.
+
     .. versionchanged:: 0.5
        :class:`Accept` objects are forced immutable now.
 
@@ -72,10 +155,48 @@ class Accept(ImmutableList[tuple[str, float]]):
         """Returns a tuple describing the value's specificity."""
         return (value != "*",)
 
+    # The match keys and specificity of each item, see _match_items.
+    _match_cache: list[tuple[list[t.Hashable], tuple[bool, ...]]] | None = None
+
     def _value_matches(self, value: str, item: str) -> bool:
         """Check if a value matches a given accept item."""
         return item == "*" or item.lower() == value.lower()
 
+    # _offer_keys and _item_keys express _value_matches as lookups. A value
+    # matches an item if they have a key in common. A subclass that overrides
+    # _value_matches must override both for AcceptOffers to be used.
+
+    @classmethod
+    def _offer_keys(cls, value: str) -> list[t.Hashable]:
+        """The keys an offered value is indexed under."""
+        return [("value", value.lower()), ("any",)]
+
+    def _item_keys(self, item: str) -> list[t.Hashable]:
+        """The keys to look up for an accept item."""
+        if item == "*":
+            return [("any",)]
+
+        return [("value", item.lower())]
+
+    @classmethod
+    def _uses_offer_keys(cls) -> bool:
+        """Check that the same class defines the matching rules and the keys."""
+        for base in cls.__mro__:
+            if "_value_matches" in base.__dict__:
+                return "_item_keys" in base.__dict__
+
+        return False
+
+    def _match_items(self) -> list[tuple[list[t.Hashable], tuple[bool, ...]]]:
+        rv = self._match_cache
+
+        if rv is None:
+            rv = self._match_cache = [
+                (self._item_keys(item), self._specificity(item)) for item, _ in self
+            ]
+
+        return rv
+
     @t.overload
     def __getitem__(self, key: str) -> float: ...
     @t.overload
@@ -150,11 +271,18 @@ class Accept(ImmutableList[tuple[str, float]]):
     def from_header(cls, value: str | None) -> te.Self:
         """Parse an ``Accept`` header value and create an instance of this class.
 
+        The result is cached and shared between calls with the same value, as
+        it is immutable. See :func:`.parse_cache_info`.
+
         .. versionadded:: 3.2
         """
         if not value:
             return cls(None)
 
+        return t.cast("te.Self", _accept_from_header(cls, value))
+
+    @classmethod
+    def _from_header(cls, value: str) -> te.Self:
         result = []
 
         for item in parse_list_header(value):
@@ -214,9 +342,16 @@ class Accept(ImmutableList[tuple[str, float]]):
         on the specificity and quality of the client. If two items have the
         same quality and specificity, the one is returned that comes first.
 
-        :param matches: a list of matches to check for
+        :param matches: a list of matches to check for, or
+            :class:`AcceptOffers` to avoid normalizing them on every call
         :param default: the value that is returned if none match
+
+        .. versionchanged:: 3.2
+            ``matches`` can be :class:`AcceptOffers`.
         """
+        if isinstance(matches, AcceptOffers) and self._uses_offer_keys():
+            return self._best_match_offers(matches, default)
+
         result = default
         best_quality: float = -1
         best_specificity: tuple[float, ...] = (-1,)
@@ -235,6 +370,51 @@ class Accept(ImmutableList[tuple[str, float]]):
                 best_specificity = specificity
         return result
 
+    def _best_match_offers(
+        self, offers: AcceptOffers, default: str | None
+    ) -> str | None:
+        if not self or not offers:
+            return default
+
+        index = offers._index(type(self))
+        # The first client item matching each offer, found in one pass over
+        # the client items, which are sorted by specificity and quality.
+        found: list[tuple[float, tuple[bool, ...]] | None] = [None] * len(offers)
+        remaining = len(offers)
+
+        for (_, quality), (keys, specificity) in zip(
+            self, self._match_items(), strict=True
+        ):
+            for key in keys:
+                for pos in index.get(key, ()):
+                    if found[pos] is None:
+                        found[pos] = (quality, specificity)
+                        remaining -= 1
+
+            if not remaining:
+                break
+
+        result = default
+        best_quality: float = -1
+        best_specificity: tuple[float, ...] = (-1,)
+
+        for server_item, match in zip(offers, found, strict=True):
+            if match is None:
+                continue
+
+            quality, specificity = match
+
+            if quality <= 0 or quality < best_quality:
+                continue
+
+            # better quality or same quality but more specific => better match
+            if quality > best_quality or specificity > best_specificity:
+                result = server_item
+                best_quality = quality
+                best_specificity = specificity
+
+        return result
+
     @property
     def best(self) -> str | None:
         """The best match as value."""
@@ -299,6 +479,46 @@ class MIMEAccept(Accept):
             )
         )
 
+    @classmethod
+    def _offer_keys(cls, value: str) -> list[t.Hashable]:
+        if "/" not in value:
+            raise ValueError(f"invalid mimetype {value!r}")
+
+        value_type, value_subtype, *value_params = _normalize_mime(value)
+
+        if value_type == "*":
+            if value_subtype != "*":
+                raise ValueError(f"invalid mimetype {value!r}")
+
+            return [("*/*",), ("any",)]
+
+        if value_subtype == "*":
+            return [("type", value_type), ("type/*", value_type), ("any",)]
+
+        return [
+            ("mime", value_type, value_subtype, tuple(sorted(value_params))),
+            ("type", value_type),
+            ("any",),
+        ]
+
+    def _item_keys(self, item: str) -> list[t.Hashable]:
+        if "/" not in item:
+            return []
+
+        item_type, item_subtype, *item_params = _normalize_mime(item)
+
+        if item_type == "*":
+            return [("any",)] if item_subtype == "*" else []
+
+        if item_subtype == "*":
+            return [("type", item_type), ("*/*",)]
+
+        return [
+            ("mime", item_type, item_subtype, tuple(sorted(item_params))),
+            ("type/*", item_type),
+            ("*/*",),
+        ]
+
     @property
     def accept_html(self) -> bool:
         """True if this object accepts HTML."""
@@ -326,9 +546,22 @@ def _normalize_lang(value: str) -> list[str]:
 class LanguageAccept(Accept):
     """Like :class:`Accept` but with normalization for language tags."""
 
+    # The client's primary language tags, see best_match.
+    _primary_cache: Accept | None = None
+
     def _value_matches(self, value: str, item: str) -> bool:
         return item == "*" or _normalize_lang(value) == _normalize_lang(item)
 
+    @classmethod
+    def _offer_keys(cls, value: str) -> list[t.Hashable]:
+        return [("lang", *_normalize_lang(value)), ("any",)]
+
+    def _item_keys(self, item: str) -> list[t.Hashable]:
+        if item == "*":
+            return [("any",)]
+
+        return [("lang", *_normalize_lang(item))]
+
     @t.overload
     def best_match(self, matches: cabc.Iterable[str]) -> str | None: ...
     @t.overload
@@ -349,8 +582,12 @@ class LanguageAccept(Accept):
 
         The default is returned if no exact or fallback match is found.
 
-        :param matches: A list of supported languages to find a match.
+        :param matches: A list of supported languages to find a match, or
+            :class:`AcceptOffers`.
         :param default: The value that is returned if none match.
+
+        .. versionchanged:: 3.2
+            ``matches`` can be :class:`AcceptOffers`.
         """
         # Look for an exact match first. If a client accepts "en-US",
         # "en-US" is a valid match at this point.
@@ -362,9 +599,13 @@ class LanguageAccept(Accept):
         # Fall back to accepting primary tags. If a client accepts
         # "en-US", "en" is a valid match at this point. Need to use
         # re.split to account for 2 or 3 letter codes.
-        fallback = Accept(
-            [(_locale_delim_re.split(item[0], 1)[0], item[1]) for item in self]
-        )
+        fallback = self._primary_cache
+
+        if fallback is None:
+            fallback = self._primary_cache = Accept(
+                [(_locale_delim_re.split(item[0], 1)[0], item[1]) for item in self]
+            )
+
         result = fallback.best_match(matches)
 
         if result is not None:
@@ -372,7 +613,13 @@ class LanguageAccept(Accept):
 
         # Fall back to matching primary tags. If the client accepts
         # "en", "en-US" is a valid match at this point.
-        fallback_matches = [_locale_delim_re.split(item, 1)[0] for item in matches]
+        fallback_matches: cabc.Iterable[str]
+
+        if isinstance(matches, AcceptOffers):
+            fallback_matches = matches._primary_offers()
+        else:
+            fallback_matches = [_locale_delim_re.split(item, 1)[0] for item in matches]
+
         result = super().best_match(fallback_matches)
 
         # Return a value from the original match list. Find the first
@@ -387,13 +634,24 @@ class _CharsetAccept(Accept):
     """Like :class:`Accept` but with normalization for charsets."""
 
     def _value_matches(self, value: str, item: str) -> bool:
-        def _normalize(name: str) -> str:
-            try:
-                return codecs.lookup(name).name
-            except LookupError:
-                return name.lower()
+        return item == "*" or _normalize_charset(value) == _normalize_charset(item)
+
+    @classmethod
+    def _offer_keys(cls, value: str) -> list[t.Hashable]:
+        return [("charset", _normalize_charset(value)), ("any",)]
+
+    def _item_keys(self, item: str) -> list[t.Hashable]:
+        if item == "*":
+            return [("any",)]
+
+        return [("charset", _normalize_charset(item))]
+
 
-        return item == "*" or _normalize(value) == _normalize(item)
+def _normalize_charset(name: str) -> str:
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return name.lower()
 
 
 def __getattr__(name: str) -> t.Any:
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import collections.abc as cabc
 import mimetypes
+import mmap
 import os
 import typing as t
 from io import BytesIO
+from io import UnsupportedOperation
 from os import fsdecode
 from os import fspath
+from tempfile import SpooledTemporaryFile
 
 from .._internal import _plain_int
 from ..http import parse_options_header
@@ -121,6 +124,60 @@ class FileStorage:
             if close_dst:
                 dst.close()
 
+    def as_memoryview(self) -> memoryview:
+        """Get the data of the file as a read-only :class:`memoryview`,
+        without copying it into a :class:`bytes` object. This is useful to
+        parse, hash, or slice a large upload.
+
+        If the stream is a :class:`~io.BytesIO`, the view is of its buffer.
+        If the file is on disk, it is mapped into memory with :mod:`mmap`.
+        Other streams, including a :class:`~tempfile.SpooledTemporaryFile`
+        that is still in memory, are read into memory.
+
+        The view covers all the data, regardless of the stream's current
+        position, unless the stream can't seek, in which case it is read
+        from its current position. While the view exists, a ``BytesIO``
+        can't be resized. Call :meth:`~memoryview.release`, or use the view
+        in a ``with`` block, once it's no longer needed.
+
+        .. versionadded:: 3.2
+        """
+        stream = self.stream
+
+        if isinstance(stream, BytesIO):
+            return stream.getbuffer().toreadonly()
+
+        fileno = None
+
+        # A spooled file that is still in memory has no name, calling fileno
+        # would move it to disk.
+        if not (isinstance(stream, SpooledTemporaryFile) and stream.name is None):
+            try:
+                fileno = stream.fileno()
+            except (AttributeError, OSError, UnsupportedOperation):
+                pass
+
+        if fileno is None:
+            if not stream.seekable():
+                return memoryview(stream.read())
+
+            position = stream.tell()
+
+            try:
+                stream.seek(0)
+                return memoryview(stream.read())
+            finally:
+                stream.seek(position)
+
+        # Buffered data may not have been written to the file yet.
+        stream.flush()
+
+        if os.fstat(fileno).st_size == 0:
+            # An empty file can't be mapped.
+            return memoryview(b"")
+
+        return memoryview(mmap.mmap(fileno, 0, access=mmap.ACCESS_READ))
+
     def close(self) -> None:
         """Close the underlying file if possible."""
         try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections.abc as cabc
+import functools
 import re
 import typing as t
 
@@ -42,6 +43,10 @@ class Headers:
 
     :param defaults: The list of default values for the :class:`Headers`.
 
+    .. versionchanged:: 3.2
+        Keys are indexed by their lowercase name, so looking up, checking,
+        setting, and removing a key no longer scans every header.
+
     .. versionchanged:: 3.1
         Implement ``|`` and ``|=`` operators.
 
@@ -69,10 +74,30 @@ class Headers:
         ) = None,
     ) -> None:
         self._list: list[tuple[str, str]] = []
+        # Maps each lowercase key to the ascending positions of its items in
+        # _list. Set to None when items are moved or removed, and rebuilt on
+        # the next lookup. Appending and replacing in place keep it current.
+        self._index: dict[str, list[int]] | None = {}
 
         if defaults is not None:
             self.extend(defaults)
 
+    def _get_index(self) -> dict[str, list[int]]:
+        index = self._index
+
+        if index is None:
+            index = self._index = {}
+
+            for pos, (key, _) in enumerate(self._list):
+                ikey = key.lower()
+
+                if ikey in index:
+                    index[ikey].append(pos)
+                else:
+                    index[ikey] = [pos]
+
+        return index
+
     @t.overload
     def __getitem__(self, key: str) -> str: ...
     @t.overload
@@ -89,13 +114,20 @@ class Headers:
         return self.__class__(self._list[key])
 
     def _get_key(self, key: str) -> str:
-        ikey = key.lower()
+        rv = self._get_first(key)
 
-        for k, v in self._list:
-            if k.lower() == ikey:
-                return v
+        if rv is None:
+            raise BadRequestKeyError(key)
+
+        return rv
 
-        raise BadRequestKeyError(key)
+    def _get_first(self, key: str) -> str | None:
+        positions = self._get_index().get(key.lower())
+
+        if not positions:
+            return None
+
+        return self._list[positions[0]][1]
 
     def __eq__(self, other: object) -> bool:
         if other.__class__ is not self.__class__:
@@ -148,9 +180,9 @@ class Headers:
         .. versionchanged:: 0.9
             The ``as_bytes`` parameter was added.
         """
-        try:
-            rv = self._get_key(key)
-        except KeyError:
+        rv = self._get_first(key)
+
+        if rv is None:
             return default
 
         if type is None:
@@ -185,21 +217,21 @@ class Headers:
         .. versionchanged:: 0.9
             The ``as_bytes`` parameter was added.
         """
-        ikey = key.lower()
+        positions = self._get_index().get(key.lower(), ())
+        items = self._list
 
         if type is not None:
             result = []
 
-            for k, v in self:
-                if k.lower() == ikey:
-                    try:
-                        result.append(type(v))
-                    except ValueError:
-                        continue
+            for pos in positions:
+                try:
+                    result.append(type(items[pos][1]))
+                except ValueError:
+                    continue
 
             return result
 
-        return [v for k, v in self if k.lower() == ikey]
+        return [items[pos][1] for pos in positions]
 
     def get_all(self, name: str) -> list[str]:
         """Return a list of all the values for the named field.
@@ -261,16 +293,16 @@ class Headers:
             return
 
         del self._list[key]
+        self._index = None
 
     def _del_key(self, key: str) -> None:
         key = key.lower()
-        new = []
 
-        for k, v in self._list:
-            if k.lower() != key:
-                new.append((k, v))
+        if key not in self._get_index():
+            return
 
-        self._list[:] = new
+        self._list[:] = [item for item in self._list if item[0].lower() != key]
+        self._index = None
 
     def remove(self, key: str) -> None:
         """Remove a key.
@@ -303,10 +335,12 @@ class Headers:
         :return: an item.
         """
         if key is None:
-            return self._list.pop()
+            return self.popitem()
 
         if isinstance(key, int):
-            return self._list.pop(key)
+            item = self._list.pop(key)
+            self._index = None
+            return item
 
         try:
             rv = self._get_key(key)
@@ -321,16 +355,21 @@ class Headers:
 
     def popitem(self) -> tuple[str, str]:
         """Removes a key or index and returns a (key, value) item."""
-        return self._list.pop()
+        rv = self._list.pop()
+
+        if self._index is not None:
+            ikey = rv[0].lower()
+            positions = self._index[ikey]
+            positions.pop()
+
+            if not positions:
+                del self._index[ikey]
+
+        return rv
 
     def __contains__(self, key: str) -> bool:
         """Check if a key is present."""
-        try:
-            self._get_key(key)
-        except KeyError:
-            return False
-
-        return True
+        return key.lower() in self._get_index()
 
     def __iter__(self) -> t.Iterator[tuple[str, str]]:
         """Yield ``(key, value)`` tuples."""
@@ -361,6 +400,15 @@ class Headers:
         value_str = _str_header_value(value)
         self._list.append((key, value_str))
 
+        if self._index is not None:
+            ikey = key.lower()
+            pos = len(self._list) - 1
+
+            if ikey in self._index:
+                self._index[ikey].append(pos)
+            else:
+                self._index[ikey] = [pos]
+
     def add_header(self, key: str, value: t.Any, /, **kwargs: t.Any) -> None:
         """Add a new header tuple to the list.
 
@@ -372,6 +420,7 @@ class Headers:
     def clear(self) -> None:
         """Clears all headers."""
         self._list.clear()
+        self._index = {}
 
     def set(self, key: str, value: t.Any, /, **kwargs: t.Any) -> None:
         """Remove all header tuples for `key` and add a new one.  The newly
@@ -392,26 +441,26 @@ class Headers:
             value = _options_header_vkw(value, kwargs)
 
         value_str = _str_header_value(value)
-
-        if not self._list:
-            self._list.append((key, value_str))
-            return
-
-        iter_list = iter(self._list)
+        index = self._get_index()
         ikey = key.lower()
+        positions = index.get(ikey)
 
-        for idx, (old_key, _) in enumerate(iter_list):
-            if old_key.lower() == ikey:
-                # replace first occurrence
-                self._list[idx] = (key, value_str)
-                break
-        else:
+        if not positions:
             # no existing occurrences
             self._list.append((key, value_str))
+            index[ikey] = [len(self._list) - 1]
             return
 
-        # remove remaining occurrences
-        self._list[idx + 1 :] = [t for t in iter_list if t[0].lower() != ikey]
+        # replace first occurrence
+        idx = positions[0]
+        self._list[idx] = (key, value_str)
+
+        if len(positions) > 1:
+            # remove remaining occurrences
+            self._list[idx + 1 :] = [
+                t for t in self._list[idx + 1 :] if t[0].lower() != ikey
+            ]
+            self._index = None
 
     def setlist(self, key: str, values: cabc.Iterable[t.Any]) -> None:
         """Remove any existing values for a header and add new ones.
@@ -482,11 +531,15 @@ class Headers:
         """Like :meth:`set` but also supports index/slice based setting."""
         if isinstance(key, str):
             self.set(key, value)
-        elif isinstance(key, int):
+            return
+
+        if isinstance(key, int):
             self._list[key] = value[0], _str_header_value(value[1])  # type: ignore[index]
         else:
             self._list[key] = [(k, _str_header_value(v)) for k, v in value]  # type: ignore[str-unpack]
 
+        self._index = None
+
     def update(
         self,
         arg: (
@@ -601,6 +654,38 @@ def _str_header_value(value: t.Any) -> str:
     return value  # type: ignore[no-any-return]
 
 
+_environ_content_keys = frozenset(("CONTENT_TYPE", "CONTENT_LENGTH"))
+
+
+@functools.lru_cache(maxsize=512)
+def _environ_key_to_header(key: str) -> str | None:
+    """Convert a WSGI environ key such as ``HTTP_X_FOO`` to a header name such
+    as ``X-Foo``, or return ``None`` if the key is not for a header. Names are
+    cached since the same keys are seen on every request.
+    """
+    if key.startswith("HTTP_"):
+        if key[5:] in _environ_content_keys:
+            return None
+
+        return key[5:].replace("_", "-").title()
+
+    if key in _environ_content_keys:
+        return key.replace("_", "-").title()
+
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _header_to_environ_key(key: str) -> str:
+    """Convert a header name to the WSGI environ key it is stored under."""
+    key = key.upper().replace("-", "_")
+
+    if key in _environ_content_keys:
+        return key
+
+    return f"HTTP_{key}"
+
+
 class EnvironHeaders(ImmutableHeadersMixin, Headers):  # type: ignore[misc]
     """Read only version of the headers from a WSGI environment.  This
     provides the same interface as `Headers` and is constructed from
@@ -609,11 +694,19 @@ class EnvironHeaders(ImmutableHeadersMixin, Headers):  # type: ignore[misc]
     subclass of the :exc:`~exceptions.BadRequest` HTTP exception and will
     render a page for a ``400 BAD REQUEST`` if caught in a catch-all for
     HTTP exceptions.
+
+    .. versionchanged:: 3.2
+        The header names for the environ keys are cached, and only found
+        again if the environ's keys change. Values are always read from the
+        environ.
     """
 
     def __init__(self, environ: WSGIEnvironment) -> None:
         super().__init__()
         self.environ = environ
+        # The environ keys the names were found for, and the header names
+        # with the environ key for each.
+        self._names: tuple[tuple[str, ...], list[tuple[str, str]]] = ((), [])
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, EnvironHeaders):
@@ -630,25 +723,65 @@ class EnvironHeaders(ImmutableHeadersMixin, Headers):  # type: ignore[misc]
         if not isinstance(key, str):
             raise BadRequestKeyError(key)
 
-        key = key.upper().replace("-", "_")
+        return self.environ[_header_to_environ_key(key)]  # type: ignore[no-any-return]
+
+    def _get_first(self, key: str) -> str | None:
+        try:
+            return self._get_key(key)
+        except KeyError:
+            return None
+
+    def __contains__(self, key: str) -> bool:
+        return self._get_first(key) is not None
 
-        if key in {"CONTENT_TYPE", "CONTENT_LENGTH"}:
-            return self.environ[key]  # type: ignore[no-any-return]
+    @t.overload
+    def getlist(self, key: str) -> list[str]: ...
+    @t.overload
+    def getlist(self, key: str, type: cabc.Callable[[str], T]) -> list[T]: ...
+    def getlist(
+        self, key: str, type: cabc.Callable[[str], T] | None = None
+    ) -> list[str] | list[T]:
+        ikey = key.lower()
+        values = [v for k, v in self if k.lower() == ikey]
 
-        return self.environ[f"HTTP_{key}"]  # type: ignore[no-any-return]
+        if type is None:
+            return values
+
+        result = []
+
+        for value in values:
+            try:
+                result.append(type(value))
+            except ValueError:
+                continue
+
+        return result
 
     def __len__(self) -> int:
         return sum(1 for _ in self)
 
+    def _get_names(self) -> list[tuple[str, str]]:
+        keys = tuple(self.environ)
+        environ_keys, names = self._names
+
+        if keys != environ_keys:
+            names = [
+                (key, name)
+                for key in keys
+                if (name := _environ_key_to_header(key)) is not None
+            ]
+            self._names = (keys, names)
+
+        return names
+
     def __iter__(self) -> cabc.Iterator[tuple[str, str]]:
-        for key, value in self.environ.items():
-            if key.startswith("HTTP_") and key not in {
-                "HTTP_CONTENT_TYPE",
-                "HTTP_CONTENT_LENGTH",
-            }:
-                yield key[5:].replace("_", "-").title(), value
-            elif key in {"CONTENT_TYPE", "CONTENT_LENGTH"} and value:
-                yield key.replace("_", "-").title(), value
+        environ = self.environ
+
+        for key, name in self._get_names():
+            value = environ[key]
+
+            if value or key not in _environ_content_keys:
+                yield name, value
 
     def copy(self) -> t.NoReturn:
         raise TypeError(f"cannot create {type(self).__name__!r} copies")
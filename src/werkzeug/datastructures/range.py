@@ -71,10 +71,14 @@ class IfRange:
 class Range:
     """Represents a ``Range`` header. All methods only support only
     bytes as the unit. Stores a list of ranges if given, but the methods
-    only work if only one range is provided.
+    only work if only one range is provided, except for
+    :meth:`ranges_for_length`.
 
     :raise ValueError: If the ranges provided are invalid.
 
+    .. versionchanged:: 3.2
+        Added :meth:`ranges_for_length` to support multiple ranges.
+
     .. versionchanged:: 0.15
         The ranges passed in are validated.
 
@@ -101,14 +105,40 @@ class Range:
         """
         if self.units != "bytes" or length is None or len(self.ranges) != 1:
             return None
-        start, end = self.ranges[0]
-        if end is None:
-            end = length
-            if start < 0:
-                start += length
-        if is_byte_range_valid(start, end, length):
-            return start, min(end, length)
-        return None
+        return _resolve_range(*self.ranges[0], length)
+
+    def ranges_for_length(self, length: int | None) -> list[tuple[int, int]] | None:
+        """Resolve every range against the given length and return a sorted
+        list of ``(start, stop)`` tuples. Ranges that can't be satisfied are
+        dropped, and ranges that overlap or are adjacent are merged, so no
+        byte is listed twice. Returns ``None`` if the range is not for bytes,
+        the length is ``None``, or no range is satisfiable.
+
+        .. versionadded:: 3.2
+        """
+        if self.units != "bytes" or length is None:
+            return None
+
+        resolved = sorted(
+            rng
+            for start, end in self.ranges
+            if (rng := _resolve_range(start, end, length)) is not None
+        )
+
+        if not resolved:
+            return None
+
+        merged = [resolved[0]]
+
+        for start, stop in resolved[1:]:
+            last_start, last_stop = merged[-1]
+
+            if start <= last_stop:
+                merged[-1] = (last_start, max(last_stop, stop))
+            else:
+                merged.append((start, stop))
+
+        return merged
 
     def make_content_range(self, length: int | None) -> ContentRange | None:
         """Creates a :class:`~werkzeug.datastructures.ContentRange` object
@@ -208,6 +238,19 @@ class Range:
         return f"<{type(self).__name__} {str(self)!r}>"
 
 
+def _resolve_range(start: int, end: int | None, length: int) -> tuple[int, int] | None:
+    if end is None:
+        end = length
+
+        if start < 0:
+            start += length
+
+    if is_byte_range_valid(start, end, length):
+        return start, min(end, length)
+
+    return None
+
+
 class _CallbackProperty(t.Generic[T]):
     def __set_name__(self, owner: type[ContentRange], name: str) -> None:
         self.attr = f"_{name}"
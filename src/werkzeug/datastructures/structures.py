@@ -730,6 +730,218 @@ class ImmutableMultiDict(ImmutableMultiDictMixin[K, V], MultiDict[K, V]):  # typ
         return self
 
 
+class _ValueList(list):  # type: ignore[type-arg]
+    """Multiple values for a key in a :class:`CompactImmutableMultiDict`,
+    distinguished from a single value that happens to be a list.
+    """
+
+    __slots__ = ()
+
+
+class CompactImmutableMultiDict(ImmutableMultiDict[K, V]):
+    """An :class:`ImmutableMultiDict` that stores a key with a single value
+    directly, and only uses a list for keys with multiple values. Most keys
+    in query strings and forms have one value, so this saves a list for each
+    key and a level of indirection when getting values.
+
+    It behaves the same as ``ImmutableMultiDict`` and compares equal to a
+    ``MultiDict`` with the same data. Only code that reads the underlying
+    ``dict`` storage directly, bypassing the ``MultiDict`` methods, sees the
+    difference.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self,
+        mapping: (
+            MultiDict[K, V]
+            | cabc.Mapping[K, V | list[V] | tuple[V, ...] | set[V]]
+            | cabc.Iterable[tuple[K, V]]
+            | None
+        ) = None,
+    ) -> None:
+        tmp: dict[K, t.Any] = {}
+
+        if mapping is None:
+            pass
+        elif isinstance(mapping, MultiDict):
+            for key, values in mapping.lists():
+                tmp[key] = values[0] if len(values) == 1 else _ValueList(values)
+        elif isinstance(mapping, cabc.Mapping):
+            for key, value in mapping.items():
+                if isinstance(value, (list, tuple, set)):
+                    if not value:
+                        continue
+
+                    value = list(value)
+                    tmp[key] = value[0] if len(value) == 1 else _ValueList(value)
+                else:
+                    tmp[key] = value
+        else:
+            for key, value in mapping:
+                if key not in tmp:
+                    tmp[key] = value
+                    continue
+
+                old = tmp[key]
+
+                if isinstance(old, _ValueList):
+                    old.append(value)
+                else:
+                    tmp[key] = _ValueList((old, value))
+
+        dict.__init__(self, tmp)
+
+    def __getitem__(self, key: K) -> V:
+        try:
+            value = dict.__getitem__(self, key)
+        except KeyError:
+            raise exceptions.BadRequestKeyError(key) from None
+
+        if isinstance(value, _ValueList):
+            if not value:
+                raise exceptions.BadRequestKeyError(key)
+
+            return value[0]  # type: ignore[no-any-return]
+
+        return value
+
+    def getlist(  # type: ignore[override]
+        self, key: K, type: cabc.Callable[[V], T] | None = None
+    ) -> list[V] | list[T]:
+        value: t.Any = dict.get(self, key, _missing)
+
+        if value is _missing:
+            return []
+
+        values: list[V] = list(value) if isinstance(value, _ValueList) else [value]
+
+        if type is None:
+            return values
+
+        result = []
+
+        for item in values:
+            try:
+                result.append(type(item))
+            except (ValueError, TypeError):
+                pass
+
+        return result
+
+    def items(self, multi: bool = False) -> cabc.Iterable[tuple[K, V]]:  # type: ignore[override]
+        for key, value in dict.items(self):
+            if not isinstance(value, _ValueList):
+                yield key, value
+            elif multi:
+                for item in value:
+                    yield key, item
+            else:
+                yield key, value[0]
+
+    def lists(self) -> cabc.Iterable[tuple[K, list[V]]]:
+        for key, value in dict.items(self):
+            yield key, list(value) if isinstance(value, _ValueList) else [value]
+
+    def values(self) -> cabc.Iterable[V]:  # type: ignore[override]
+        for value in dict.values(self):
+            yield value[0] if isinstance(value, _ValueList) else value
+
+    def listvalues(self) -> cabc.Iterable[list[V]]:
+        for value in dict.values(self):
+            yield list(value) if isinstance(value, _ValueList) else [value]
+
+    def __eq__(self, other: object) -> bool:
+        return dict(self.lists()) == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = ImmutableMultiDict.__hash__  # type: ignore[assignment]
+
+
+class _LazyImmutableMultiDict(ImmutableMultiDict[K, V]):
+    """An :class:`ImmutableMultiDict` that stores raw values and only calls
+    ``decode`` on the values for a key when that key is first accessed.
+    Behaves like an ``ImmutableMultiDict`` of the decoded values otherwise.
+    """
+
+    def __init__(
+        self,
+        mapping: (
+            MultiDict[K, V]
+            | cabc.Mapping[K, V | list[V] | tuple[V, ...] | set[V]]
+            | cabc.Iterable[tuple[K, t.Any]]
+            | None
+        ) = None,
+        decode: cabc.Callable[[t.Any], V] | None = None,
+    ) -> None:
+        super().__init__(mapping)
+        self._decode = decode
+        # Raw lists are never mutated. Decoded lists replace them in the dict,
+        # so concurrent access may decode a key twice but never reads a mix.
+        self._raw: dict[K, list[t.Any]] = (
+            {} if decode is None else dict(dict.items(self))  # type: ignore[arg-type]
+        )
+
+    def _decode_key(self, key: K) -> None:
+        raw = self._raw.get(key)
+
+        if raw is not None:
+            dict.__setitem__(self, key, [self._decode(v) for v in raw])  # type: ignore[misc]
+            self._raw.pop(key, None)
+
+    def _decode_all(self) -> None:
+        for key in list(self._raw):
+            self._decode_key(key)
+
+    def __getitem__(self, key: K) -> V:
+        self._decode_key(key)
+        return super().__getitem__(key)
+
+    def getlist(  # type: ignore[override]
+        self, key: K, type: cabc.Callable[[V], T] | None = None
+    ) -> list[V] | list[T]:
+        self._decode_key(key)
+        return super().getlist(key, type)  # type: ignore[arg-type]
+
+    def items(self, multi: bool = False) -> cabc.Iterable[tuple[K, V]]:  # type: ignore[override]
+        self._decode_all()
+        return super().items(multi)
+
+    def lists(self) -> cabc.Iterable[tuple[K, list[V]]]:
+        self._decode_all()
+        return super().lists()
+
+    def values(self) -> cabc.Iterable[V]:  # type: ignore[override]
+        self._decode_all()
+        return super().values()
+
+    def listvalues(self) -> cabc.Iterable[list[V]]:
+        self._decode_all()
+        return super().listvalues()
+
+    def __eq__(self, other: object) -> bool:
+        self._decode_all()
+
+        if isinstance(other, _LazyImmutableMultiDict):
+            other._decode_all()
+
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = ImmutableMultiDict.__hash__  # type: ignore[assignment]
+
+    def __reduce_ex__(self, protocol: t.SupportsIndex) -> t.Any:
+        return ImmutableMultiDict, (list(self.items(multi=True)),)
+
+    def __repr__(self) -> str:
+        return f"ImmutableMultiDict({list(self.items(multi=True))!r})"
+
+
 class CallbackDict(UpdateDictMixin[K, V], dict[K, V]):
     """A dict that calls a function passed every time something is changed.
     The function is passed the dict instance.
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import threading
 import typing as t
 from tempfile import SpooledTemporaryFile
 from types import TracebackType
 from urllib.parse import parse_qsl
 
 from ._internal import _plain_int
+from .datastructures import CompactImmutableMultiDict
 from .datastructures import FileStorage
 from .datastructures import Headers
 from .datastructures import ImmutableMultiDict
 from .datastructures import MultiDict
 from .exceptions import RequestEntityTooLarge
+from .exceptions import ServiceUnavailable
 from .http import parse_options_header
 from .sansio.multipart import Data
 from .sansio.multipart import Epilogue
@@ -42,6 +45,166 @@ if t.TYPE_CHECKING:
 F = t.TypeVar("F", bound=t.Callable[..., t.Any])
 
 
+class MemoryBudget:
+    """Limit the total size of request body data held in memory by all
+    requests at once. A single instance is shared by every request in the
+    process, usually by assigning it to :attr:`.Request.memory_budget`.
+
+    The budget tracks data cached by :meth:`.Request.get_data`, parsed form
+    fields, and uploaded files that are still in memory. Uploaded files are
+    moved to disk early if they don't fit in the budget. Other data raises
+    :exc:`~exceptions.ServiceUnavailable` if it doesn't fit, or
+    :exc:`~exceptions.RequestEntityTooLarge` if it could never fit.
+
+    Memory used by a request is released when the request is closed.
+
+    :param max_size: The maximum number of bytes held in memory at once.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._in_use = 0
+        self._high_water = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_use(self) -> int:
+        """The number of bytes currently held in memory."""
+        return self._in_use
+
+    @property
+    def high_water(self) -> int:
+        """The highest number of bytes held in memory at once."""
+        return self._high_water
+
+    def try_reserve(self, size: int) -> bool:
+        """Reserve ``size`` bytes if they fit in the budget. Returns
+        ``False`` without reserving anything if they don't.
+
+        :param size: The number of bytes to reserve.
+        """
+        with self._lock:
+            if self._in_use + size > self.max_size:
+                return False
+
+            self._in_use += size
+
+            if self._in_use > self._high_water:
+                self._high_water = self._in_use
+
+            return True
+
+    def reserve(self, size: int) -> None:
+        """Reserve ``size`` bytes, or raise an error if they don't fit in the
+        budget.
+
+        :param size: The number of bytes to reserve.
+        :raise RequestEntityTooLarge: The size is larger than the entire
+            budget.
+        :raise ServiceUnavailable: The size does not fit in the remaining
+            budget.
+        """
+        if size > self.max_size:
+            raise RequestEntityTooLarge()
+
+        if not self.try_reserve(size):
+            raise ServiceUnavailable()
+
+    def release(self, size: int) -> None:
+        """Release ``size`` bytes that were previously reserved.
+
+        :param size: The number of bytes to release.
+        """
+        with self._lock:
+            self._in_use -= size
+
+    def read(self, stream: t.IO[bytes], size: int | None = None) -> bytes:
+        """Read all the data from a stream, reserving its size. The size of
+        the returned data must be released once it is no longer used.
+
+        :param stream: The stream to read.
+        :param size: The expected size, such as the ``Content-Length``. It is
+            reserved before reading, so that a large body fails early, then
+            adjusted to the size that was actually read.
+        :raise RequestEntityTooLarge: The size is larger than the entire
+            budget.
+        :raise ServiceUnavailable: The size does not fit in the remaining
+            budget.
+        """
+        expected = size or 0
+        self.reserve(expected)
+
+        try:
+            rv = stream.read()
+
+            if len(rv) > expected:
+                self.reserve(len(rv) - expected)
+        except BaseException:
+            self.release(expected)
+            raise
+
+        if len(rv) < expected:
+            self.release(expected - len(rv))
+
+        return rv
+
+    def stream_factory(
+        self,
+        total_content_length: int | None,
+        content_type: str | None,
+        filename: str | None,
+        content_length: int | None = None,
+    ) -> t.IO[bytes]:
+        """A stream factory like :func:`default_stream_factory`, that holds
+        an uploaded file in memory only while it fits in the budget. The
+        parsers use this if they are given a budget but no stream factory. A
+        custom stream factory can call it for files it doesn't handle.
+        """
+        return _BudgetSpooledTemporaryFile(self, max_size=1024 * 500, mode="rb+")
+
+
+class _BudgetSpooledTemporaryFile(SpooledTemporaryFile[bytes]):
+    """A :class:`~tempfile.SpooledTemporaryFile` that reserves the data it
+    holds in memory from a :class:`MemoryBudget`, and rolls over to disk
+    early if the budget is exceeded.
+    """
+
+    def __init__(self, budget: MemoryBudget, max_size: int, mode: str) -> None:
+        super().__init__(max_size=max_size, mode=mode)
+        self._budget = budget
+        self._reserved = 0
+        self._on_disk = False
+
+    def write(self, s: t.Any) -> int:
+        if not self._on_disk:
+            size = len(s)
+
+            if self._budget.try_reserve(size):
+                self._reserved += size
+            else:
+                self.rollover()
+
+        return super().write(s)
+
+    def rollover(self) -> None:
+        super().rollover()
+        self._on_disk = True
+        self._release()
+
+    def close(self) -> None:
+        super().close()
+        self._release()
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    def _release(self) -> None:
+        self._budget.release(self._reserved)
+        self._reserved = 0
+
+
 def default_stream_factory(
     total_content_length: int | None,
     content_type: str | None,
@@ -59,6 +222,7 @@ def parse_form_data(
     silent: bool = True,
     *,
     max_form_parts: int | None = None,
+    memory_budget: MemoryBudget | None = None,
     **kwargs: t.Any,
 ) -> t_parse_result:
     """Parse the form data in the environ and return it as tuple in the form
@@ -88,8 +252,13 @@ def parse_form_data(
     :param silent: If set to False parsing errors will not be caught.
     :param max_form_parts: The maximum number of multipart parts to be parsed. If this
         is exceeded, a :exc:`~exceptions.RequestEntityTooLarge` exception is raised.
+    :param memory_budget: A :class:`MemoryBudget` shared with other requests
+        that limits the total data held in memory.
     :return: A tuple in the form ``(stream, form, files)``.
 
+    .. versionchanged:: 3.2
+        Added the ``memory_budget`` parameter.
+
     .. versionchanged:: 3.2
         The ``cls`` parameter is deprecated and will be removed in Werkzeug 3.3. It will
         always be ``ImmutableMultiDict``.
@@ -112,6 +281,7 @@ def parse_form_data(
         max_form_memory_size=max_form_memory_size,
         max_content_length=max_content_length,
         max_form_parts=max_form_parts,
+        memory_budget=memory_budget,
         silent=silent,
     )
 
@@ -151,6 +321,12 @@ class FormDataParser:
     :param silent: If set to False parsing errors will not be caught.
     :param max_form_parts: The maximum number of multipart parts to be parsed. If this
         is exceeded, a :exc:`~exceptions.RequestEntityTooLarge` exception is raised.
+    :param memory_budget: A :class:`MemoryBudget` shared with other requests
+        that limits the total data held in memory. The parsed form fields
+        stay reserved in it, see :attr:`reserved_memory`.
+
+    .. versionchanged:: 3.2
+        Added the ``memory_budget`` parameter.
 
     .. versionchanged:: 3.2
         The ``cls`` parameter and attribute are deprecated and will be removed
@@ -176,15 +352,28 @@ class FormDataParser:
         silent: bool = True,
         *,
         max_form_parts: int | None = None,
+        memory_budget: MemoryBudget | None = None,
         **kwargs: t.Any,
     ) -> None:
         if stream_factory is None:
-            stream_factory = default_stream_factory
+            if memory_budget is not None:
+                stream_factory = memory_budget.stream_factory
+            else:
+                stream_factory = default_stream_factory
 
         self.stream_factory = stream_factory
         self.max_form_memory_size = max_form_memory_size
         self.max_content_length = max_content_length
         self.max_form_parts = max_form_parts
+        self.memory_budget = memory_budget
+        #: The number of bytes of parsed form fields reserved from
+        #: :attr:`memory_budget`. They are not released by the parser, as the
+        #: fields are still in memory. The caller must release them once the
+        #: form is no longer used. :class:`.Request` does this when it is
+        #: closed.
+        #:
+        #: .. versionadded:: 3.2
+        self.reserved_memory = 0
 
         if "cls" in kwargs:
             import warnings
@@ -276,6 +465,7 @@ class FormDataParser:
             stream_factory=self.stream_factory,
             max_form_memory_size=self.max_form_memory_size,
             max_form_parts=self.max_form_parts,
+            memory_budget=self.memory_budget,
         )
 
         if self.cls is not None:
@@ -283,6 +473,9 @@ class FormDataParser:
 
         with MultiPartParser(**kwargs) as parser:
             form, files = parser.parse(stream, boundary, content_length)
+            # The fields are returned, keep them reserved after parsing.
+            self.reserved_memory += parser.reserved_memory
+            parser.reserved_memory = 0
 
         return stream, form, files
 
@@ -300,16 +493,30 @@ class FormDataParser:
         ):
             raise RequestEntityTooLarge()
 
-        items = parse_qsl(
-            stream.read().decode(),
-            keep_blank_values=True,
-            errors="werkzeug.url_quote",
-        )
+        if self.memory_budget is not None:
+            data = self.memory_budget.read(stream, content_length)
+        else:
+            data = stream.read()
+
+        try:
+            items = parse_qsl(
+                data.decode(),
+                keep_blank_values=True,
+                errors="werkzeug.url_quote",
+            )
+        except BaseException:
+            if self.memory_budget is not None:
+                self.memory_budget.release(len(data))
+
+            raise
+
+        if self.memory_budget is not None:
+            self.reserved_memory += len(data)
 
         if self.cls is not None:
             return stream, self.cls(items), self.cls()
 
-        return stream, ImmutableMultiDict(items), ImmutableMultiDict()
+        return stream, CompactImmutableMultiDict(items), ImmutableMultiDict()
 
 
 class MultiPartParser:
@@ -319,16 +526,25 @@ class MultiPartParser:
         max_form_memory_size: int | None = None,
         buffer_size: int = 64 * 1024,
         max_form_parts: int | None = None,
+        memory_budget: MemoryBudget | None = None,
         **kwargs: t.Any,
     ) -> None:
         self.max_form_memory_size = max_form_memory_size
         self.max_form_parts = max_form_parts
+        self.memory_budget = memory_budget
 
         if stream_factory is None:
-            stream_factory = default_stream_factory
+            if memory_budget is not None:
+                stream_factory = memory_budget.stream_factory
+            else:
+                stream_factory = default_stream_factory
 
         self.stream_factory = stream_factory
         self._files: list[t.IO[bytes]] = []
+        #: The number of bytes of form fields reserved from
+        #: :attr:`memory_budget`, which are released when the parser is used
+        #: as a context manager and exits.
+        self.reserved_memory = 0
 
         if "cls" in kwargs:
             import warnings
@@ -356,6 +572,10 @@ class MultiPartParser:
             for file in self._files:
                 file.close()
 
+        if self.memory_budget is not None:
+            self.memory_budget.release(self.reserved_memory)
+            self.reserved_memory = 0
+
     def get_part_charset(self, headers: Headers) -> str:
         # Figure out input charset for current part
         content_type = headers.get("Content-Type")
@@ -430,6 +650,12 @@ class MultiPartParser:
                         if field_size > self.max_form_memory_size:
                             raise RequestEntityTooLarge()
 
+                    if self.memory_budget is not None and isinstance(
+                        current_part, Field
+                    ):
+                        self.memory_budget.reserve(len(event.data))
+                        self.reserved_memory += len(event.data)
+
                     _write(event.data)
                     if not event.more_data:
                         if isinstance(current_part, Field):
@@ -457,7 +683,7 @@ class MultiPartParser:
         if self.cls is not None:
             return self.cls(fields), self.cls(files)
 
-        return ImmutableMultiDict(fields), ImmutableMultiDict(files)
+        return CompactImmutableMultiDict(fields), CompactImmutableMultiDict(files)
 
 
 def _chunk_iter(read: t.Callable[[int], bytes], size: int) -> t.Iterator[bytes | None]:
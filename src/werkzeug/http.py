@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import email.utils
+import functools
 import hashlib
+import math
 import re
 import typing as t
 import warnings
@@ -14,6 +16,7 @@ from datetime import timezone
 from enum import Enum
 from time import mktime
 from time import struct_time
+from time import time as _time_now
 from urllib.parse import quote
 from urllib.parse import unquote
 
@@ -23,6 +26,8 @@ from ._internal import _plain_int
 if t.TYPE_CHECKING:
     from _typeshed.wsgi import WSGIEnvironment
 
+_TParse = t.TypeVar("_TParse", bound=t.Callable[..., t.Any])
+
 _token_chars = frozenset(
     "!#$%&'*+-.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ^_`abcdefghijklmnopqrstuvwxyz|~"
 )
@@ -220,6 +225,60 @@ class SecFetchDest(Enum):
     XSLT = "xslt"
 
 
+# Clients send the same few values for headers such as Accept and
+# Content-Type over and over, so parse results are cached by the raw
+# value. Results must be immutable, as they are shared. Long values are
+# not cached to bound the memory used.
+_parse_cache_max_size = 512
+_parse_cache_max_length = 1024
+# Maps parser names to the cache_info and cache_clear functions of the cache.
+_parse_caches: dict[str, tuple[t.Callable[[], t.Any], t.Callable[[], None]]] = {}
+
+
+def _parse_cache(func: _TParse) -> _TParse:
+    """Cache the results of a header parsing function. The last argument
+    must be the header value, other arguments must be hashable.
+    """
+    cached = functools.lru_cache(maxsize=_parse_cache_max_size)(func)
+    _parse_caches[func.__name__.lstrip("_")] = (cached.cache_info, cached.cache_clear)
+
+    @functools.wraps(func)
+    def wrapper(*args: t.Any) -> t.Any:
+        if len(args[-1]) > _parse_cache_max_length:
+            return func(*args)
+
+        return cached(*args)
+
+    return t.cast(_TParse, wrapper)
+
+
+def parse_cache_info() -> dict[str, dict[str, int]]:
+    """Get the hit and miss counts for the caches used when parsing header
+    values, keyed by the name of the parser. Each cache holds the results of
+    recently parsed values, values longer than 1024 characters are not
+    cached. The counts for each parser are a dict with the keys ``hits``,
+    ``misses``, ``maxsize``, and ``currsize``.
+
+    The cached parsers are :func:`parse_list_header`,
+    :func:`parse_dict_header`, :func:`parse_options_header`, and
+    :meth:`.Accept.from_header`. Header classes that use these, such as
+    :class:`.ResponseCacheControl`, benefit as well.
+
+    .. versionadded:: 3.2
+    """
+    return {name: info()._asdict() for name, (info, _) in _parse_caches.items()}
+
+
+def clear_parse_cache() -> None:
+    """Clear the caches used when parsing header values, and reset their hit
+    and miss counts.
+
+    .. versionadded:: 3.2
+    """
+    for _, clear in _parse_caches.values():
+        clear()
+
+
 def quote_header_value(value: t.Any, allow_token: bool = True) -> str:
     """Add double quotes around a header value. If the header contains only ASCII token
     characters, it will be returned unchanged. If the header contains ``"`` or ``\\``
@@ -413,11 +472,53 @@ def parse_list_header(value: str) -> list[str]:
 
     :param value: The header value to parse.
 
+    .. versionchanged:: 3.2
+        Items are split with a regular expression instead of one character at
+        a time. Results are cached, see :func:`parse_cache_info`.
+
     .. versionchanged:: 3.2
         Quotes and escapes are kept if only part of an item is quoted. Empty
         values are omitted. An empty list is returned if the value contains an
         unclosed quoted string.
     """
+    return list(_parse_list_header(value))
+
+
+# One list item: unquoted text and complete quoted strings up to the next comma.
+_list_item_re = re.compile(r'[^,"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^,"]*)*', re.S)
+
+
+def _split_list_header(value: str) -> list[str] | None:
+    """Split a list header into raw items using :data:`_list_item_re`. Returns
+    ``None`` if the value is malformed, in which case
+    :func:`_split_list_header_slow` decides how to handle it.
+    """
+    if '"' not in value:
+        return value.split(",")
+
+    items = []
+    pos = 0
+    end = len(value)
+
+    while True:
+        match = _list_item_re.match(value, pos)
+        items.append(match.group())  # type: ignore[union-attr]
+        pos = match.end()  # type: ignore[union-attr]
+
+        if pos == end:
+            return items
+
+        if value[pos] != ",":
+            # an unclosed quoted string stopped the match
+            return None
+
+        pos += 1
+
+
+def _split_list_header_slow(value: str) -> list[str] | None:
+    """Split a list header into raw items one character at a time. Returns
+    ``None`` if the value contains an unclosed quoted string.
+    """
     items = []
     item = ""
     escape = False
@@ -449,13 +550,26 @@ def parse_list_header(value: str) -> list[str]:
         item += char
 
     if quote:
-        # invalid, unclosed quoted string
-        return []
+        return None
 
     items.append(item)
-    return [
+    return items
+
+
+@_parse_cache
+def _parse_list_header(value: str) -> tuple[str, ...]:
+    items = _split_list_header(value)
+
+    if items is None:
+        items = _split_list_header_slow(value)
+
+        if items is None:
+            # invalid, unclosed quoted string
+            return ()
+
+    return tuple(
         unquote_header_value(item) for item in (item.strip() for item in items) if item
-    ]
+    )
 
 
 def parse_dict_header(value: str) -> dict[str, str | None]:
@@ -477,6 +591,9 @@ def parse_dict_header(value: str) -> dict[str, str | None]:
 
     :param value: The header value to parse.
 
+    .. versionchanged:: 3.2
+        Results are cached, see :func:`parse_cache_info`.
+
     .. versionchanged:: 3.2
         An empty dict is returned if the value contains an unclosed quoted
         string.
@@ -493,9 +610,14 @@ def parse_dict_header(value: str) -> dict[str, str | None]:
     .. versionchanged:: 0.9
        The ``cls`` argument was added.
     """
+    return dict(_parse_dict_header(value))
+
+
+@_parse_cache
+def _parse_dict_header(value: str) -> tuple[tuple[str, str | None], ...]:
     result: dict[str, str | None] = {}
 
-    for item in parse_list_header(value):
+    for item in _parse_list_header(value):
         key, has_value, value = item.partition("=")
         key = key.strip()
 
@@ -530,7 +652,7 @@ def parse_dict_header(value: str) -> dict[str, str | None]:
 
         result[key] = unquote_header_value(value)
 
-    return result
+    return tuple(result.items())
 
 
 # https://httpwg.org/specs/rfc9110.html#parameter
@@ -585,6 +707,9 @@ def parse_options_header(value: str | None) -> tuple[str, dict[str, str]]:
     :param value: The header value to parse.
     :return: ``(value, options)``, where ``options`` is a dict
 
+    .. versionchanged:: 3.2
+        Results are cached, see :func:`parse_cache_info`.
+
     .. versionchanged:: 2.3
         Invalid parts, such as keys with no value, quoted keys, and incorrectly quoted
         values, are discarded instead of treating as ``None``.
@@ -609,13 +734,19 @@ def parse_options_header(value: str | None) -> tuple[str, dict[str, str]]:
     if value is None:
         return "", {}
 
+    value, options = _parse_options_header(value)
+    return value, dict(options)
+
+
+@_parse_cache
+def _parse_options_header(value: str) -> tuple[str, tuple[tuple[str, str], ...]]:
     value, _, rest = value.partition(";")
     value = value.strip()
     rest = rest.strip()
 
     if not value or not rest:
         # empty (invalid) value, or value without options
-        return value, {}
+        return value, ()
 
     # Collect all valid key=value parts without processing the value.
     parts: list[tuple[str, str]] = []
@@ -701,7 +832,7 @@ def parse_options_header(value: str | None) -> tuple[str, dict[str, str]]:
         else:
             options[pk] = pv
 
-    return value, options
+    return value, tuple(options.items())
 
 
 _TAnyAccept = t.TypeVar("_TAnyAccept", bound="ds.Accept")
@@ -1072,21 +1203,60 @@ def generate_etag(data: bytes) -> str:
         Use SHA-1. MD5 is not allowed in FIPS-enabled systems. This increases
         the length from 32 to 40 characters.
     """
-    digest = hashlib.sha3_256(data, usedforsecurity=False).digest()
-    return b64encode(digest).decode().rstrip("=")
+    etag_hash = _new_etag_hash()
+    etag_hash.update(data)
+    return _etag_from_hash(etag_hash)
+
+
+def _new_etag_hash() -> hashlib._Hash:
+    """Create the hash object used by :func:`generate_etag`, which can be
+    updated with the data in chunks.
+    """
+    return hashlib.sha3_256(usedforsecurity=False)
+
+
+def _etag_from_hash(etag_hash: hashlib._Hash) -> str:
+    return b64encode(etag_hash.digest()).decode().rstrip("=")
+
+
+_weekday_names = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_month_names = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+_month_numbers = {name.lower(): i for i, name in enumerate(_month_names, 1)}
+# https://httpwg.org/specs/rfc9110.html#http.date
+_imf_fixdate_re = re.compile(
+    r"[A-Za-z]{3}, (\d\d) ([A-Za-z]{3}) (\d{4}) (\d\d):(\d\d):(\d\d) GMT", re.A
+)
 
 
 def parse_date(value: str | None) -> datetime | None:
     """Parse an :rfc:`2822` date into a timezone-aware
     :class:`datetime.datetime` object, or ``None`` if parsing fails.
 
-    This is a wrapper for :func:`email.utils.parsedate_to_datetime`. It
-    returns ``None`` if parsing fails instead of raising an exception,
-    and always returns a timezone-aware datetime object. If the string
-    doesn't have timezone information, it is assumed to be UTC.
+    The preferred ``IMF-fixdate`` format is parsed directly. Other formats,
+    such as the obsolete RFC 850 and asctime formats, are passed to
+    :func:`email.utils.parsedate_to_datetime`. It returns ``None`` if parsing
+    fails instead of raising an exception, and always returns a
+    timezone-aware datetime object. If the string doesn't have timezone
+    information, it is assumed to be UTC.
 
     :param value: A string with a supported date format.
 
+    .. versionchanged:: 3.2
+        ``IMF-fixdate`` values are parsed without using ``email.utils``.
+
     .. versionchanged:: 2.0
         Return a timezone-aware datetime object. Use
         ``email.utils.parsedate_to_datetime``.
@@ -1094,6 +1264,27 @@ def parse_date(value: str | None) -> datetime | None:
     if value is None:
         return None
 
+    match = _imf_fixdate_re.fullmatch(value)
+
+    if match is not None:
+        day, month_name, year, hour, minute, second = match.groups()
+        month = _month_numbers.get(month_name.lower())
+
+        # email.utils treats years below 100 as two digit years
+        if month is not None and year[:2] != "00":
+            try:
+                return datetime(
+                    int(year),
+                    month,
+                    int(day),
+                    int(hour),
+                    int(minute),
+                    int(second),
+                    tzinfo=timezone.utc,
+                )
+            except ValueError:
+                return None
+
     try:
         dt = email.utils.parsedate_to_datetime(value)
     except (TypeError, ValueError):
@@ -1105,22 +1296,55 @@ def parse_date(value: str | None) -> datetime | None:
     return dt
 
 
+def _format_http_date(dt: datetime) -> str:
+    return (
+        f"{_weekday_names[dt.weekday()]}, {dt.day:02d} {_month_names[dt.month - 1]}"
+        f" {dt.year:04d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} GMT"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _format_http_timestamp(seconds: int) -> str:
+    return _format_http_date(datetime.fromtimestamp(seconds, timezone.utc))
+
+
+# The second and formatted value of the last call to http_date() for the
+# current time. Replaced as one tuple so concurrent calls see a matching pair.
+_http_date_now: tuple[int, str] = (-1, "")
+
+
 def http_date(
     timestamp: datetime | date | int | float | struct_time | None = None,
 ) -> str:
     """Format a datetime object or timestamp into an :rfc:`2822` date
     string.
 
-    This is a wrapper for :func:`email.utils.format_datetime`. It
-    assumes naive datetime objects are in UTC instead of raising an
-    exception.
+    Naive datetime objects are assumed to be in UTC. The formatted current
+    time is reused until the next second, and recently formatted timestamps
+    are cached.
 
     :param timestamp: The datetime or timestamp to format. Defaults to
         the current time.
 
+    .. versionchanged:: 3.2
+        Format the date directly instead of using ``email.utils``. Cache
+        the current time and recent timestamps.
+
     .. versionchanged:: 2.0
         Use ``email.utils.format_datetime``. Accept ``date`` objects.
     """
+    global _http_date_now
+
+    if timestamp is None:
+        seconds = int(_time_now())
+        cached_seconds, rv = _http_date_now
+
+        if seconds != cached_seconds:
+            rv = _format_http_timestamp(seconds)
+            _http_date_now = (seconds, rv)
+
+        return rv
+
     if isinstance(timestamp, date):
         if not isinstance(timestamp, datetime):
             # Assume plain date is midnight UTC.
@@ -1129,12 +1353,12 @@ def http_date(
             # Ensure datetime is timezone-aware.
             timestamp = _dt_as_utc(timestamp)
 
-        return email.utils.format_datetime(timestamp, usegmt=True)
+        return _format_http_date(timestamp)
 
     if isinstance(timestamp, struct_time):
         timestamp = mktime(timestamp)
 
-    return email.utils.formatdate(timestamp, usegmt=True)
+    return _format_http_timestamp(math.floor(timestamp))
 
 
 def parse_age(value: str | None = None) -> timedelta | None:
@@ -1298,7 +1522,7 @@ def parse_cookie(
     else:
         cookie = header
 
-    if cookie:
+    if cookie and not cookie.isascii():
         cookie = cookie.encode("latin1").decode()
 
     parse_kwargs: dict[str, t.Any] = {}
@@ -1380,6 +1604,9 @@ def dump_cookie(
 
     .. _`cookie`: http://browsercookielimits.squawky.net/
 
+    .. versionchanged:: 3.2
+        Implemented with :class:`CookieTemplate`.
+
     .. versionchanged:: 3.1
         The ``partitioned`` parameter was added.
 
@@ -1402,67 +1629,179 @@ def dump_cookie(
     .. versionchanged:: 1.0.0
         The string ``'None'`` is accepted for ``samesite``.
     """
-    if path is not None:
-        # safe = https://url.spec.whatwg.org/#url-path-segment-string
-        # as well as percent for things that are already quoted
-        # excluding semicolon since it's part of the header syntax
-        path = quote(path, safe="%!$&'()*+,/:=@")
-
-    if domain:
-        domain = domain.partition(":")[0].lstrip(".").encode("idna").decode("ascii")
-
-    if isinstance(max_age, timedelta):
-        max_age = int(max_age.total_seconds())
-
-    if expires is not None:
-        if not isinstance(expires, str):
-            expires = http_date(expires)
-    elif max_age is not None and sync_expires:
-        expires = http_date(datetime.now(tz=timezone.utc).timestamp() + max_age)
-
-    if samesite is not None:
-        samesite = samesite.title()
-
-        if samesite not in {"Strict", "Lax", "None"}:
-            raise ValueError("SameSite must be 'Strict', 'Lax', or 'None'.")
-
-    if partitioned:
-        secure = True
-
-    # Quote value if it contains characters not allowed by RFC 6265. Slash-escape with
-    # three octal digits, which matches http.cookies, although the RFC suggests base64.
-    if not _cookie_no_quote_re.fullmatch(value):
-        # Work with bytes here, since a UTF-8 character could be multiple bytes.
-        value = _cookie_slash_re.sub(
-            lambda m: _cookie_slash_map[m.group()], value.encode()
-        ).decode("ascii")
-        value = f'"{value}"'
-
-    # Send a non-ASCII key as mojibake. Everything else should already be ASCII.
-    # TODO Remove encoding dance, it seems like clients accept UTF-8 keys
-    buf = [f"{key.encode().decode('latin1')}={value}"]
-
-    for k, v in (
-        ("Domain", domain),
-        ("Expires", expires),
-        ("Max-Age", max_age),
-        ("Secure", secure),
-        ("HttpOnly", httponly),
-        ("Path", path),
-        ("SameSite", samesite),
-        ("Partitioned", partitioned),
-    ):
-        if v is None or v is False:
-            continue
+    template = CookieTemplate(
+        key,
+        max_age=max_age,
+        path=path,
+        domain=domain,
+        secure=secure,
+        httponly=httponly,
+        sync_expires=sync_expires,
+        max_size=0,
+        samesite=samesite,
+        partitioned=partitioned,
+    )
+    value, rv = template._dump(value, None, expires)
+    _check_cookie_size(key, value, rv, max_size)
+    return rv
 
-        if v is True:
-            buf.append(k)
-            continue
 
-        buf.append(f"{k}={v}")
+class CookieTemplate:
+    """Create ``Set-Cookie`` header values for a cookie that is set
+    repeatedly with the same name and attributes, such as a session cookie.
+
+    The attributes are validated and formatted once when the template is
+    created, so :meth:`dump` only quotes the value and formats the expiry.
+    The parameters are the same as for :func:`dump_cookie`, and the output
+    is the same as calling it with those arguments.
 
-    rv = "; ".join(buf)
+    .. code-block:: python
 
+        session_cookie = CookieTemplate(
+            "session", max_age=3600, secure=True, httponly=True, samesite="Lax"
+        )
+        response.set_cookie(session_cookie, session_id)
+        response.delete_cookie(session_cookie)
+
+    :param key: The name of the cookie.
+    :param max_age: The default ``max_age`` for :meth:`dump`.
+    :param path: Limit the cookie to this path.
+    :param domain: Set a cookie that is readable by this domain and its
+        subdomains.
+    :param secure: The cookie will only be available via HTTPS.
+    :param httponly: Disallow JavaScript access to the cookie.
+    :param sync_expires: Set expires if ``max_age`` is given but expires
+        isn't.
+    :param max_size: Warn if the final header value exceeds this size. Set
+        to 0 to disable this check.
+    :param samesite: Limit the cookie to same-site requests.
+    :param partitioned: Opt the cookie into partitioned storage. This also
+        sets ``secure``.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self,
+        key: str,
+        max_age: timedelta | int | None = None,
+        path: str | None = "/",
+        domain: str | None = None,
+        secure: bool = False,
+        httponly: bool = False,
+        sync_expires: bool = True,
+        max_size: int = 4093,
+        samesite: str | None = None,
+        partitioned: bool = False,
+    ) -> None:
+        if path is not None:
+            # safe = https://url.spec.whatwg.org/#url-path-segment-string
+            # as well as percent for things that are already quoted
+            # excluding semicolon since it's part of the header syntax
+            path = quote(path, safe="%!$&'()*+,/:=@")
+
+        if domain:
+            domain = domain.partition(":")[0].lstrip(".").encode("idna").decode("ascii")
+
+        if isinstance(max_age, timedelta):
+            max_age = int(max_age.total_seconds())
+
+        if samesite is not None:
+            samesite = samesite.title()
+
+            if samesite not in {"Strict", "Lax", "None"}:
+                raise ValueError("SameSite must be 'Strict', 'Lax', or 'None'.")
+
+        if partitioned:
+            secure = True
+
+        #: The name of the cookie.
+        self.key = key
+        #: The default ``max_age`` for :meth:`dump`.
+        self.max_age = max_age
+        self.sync_expires = sync_expires
+        self.max_size = max_size
+        # Send a non-ASCII key as mojibake. Everything else should already be ASCII.
+        # TODO Remove encoding dance, it seems like clients accept UTF-8 keys
+        self._header_key = key.encode().decode("latin1")
+        # Attributes come before and after Expires and Max-Age.
+        self._before = "" if domain is None else f"; Domain={domain}"
+        self._after = "".join(
+            f"; {k}" if v is True else f"; {k}={v}"
+            for k, v in (
+                ("Secure", secure),
+                ("HttpOnly", httponly),
+                ("Path", path),
+                ("SameSite", samesite),
+                ("Partitioned", partitioned),
+            )
+            if v is not None and v is not False
+        )
+
+    def dump(
+        self,
+        value: str = "",
+        max_age: timedelta | int | None = None,
+        expires: str | datetime | int | float | None = None,
+        max_size: int | None = None,
+    ) -> str:
+        """Create a ``Set-Cookie`` header value without the ``Set-Cookie``
+        prefix.
+
+        :param value: The value of the cookie.
+        :param max_age: Override the template's ``max_age``.
+        :param expires: A ``datetime`` object or timestamp when the cookie
+            expires.
+        :param max_size: Override the template's ``max_size``.
+        """
+        value, rv = self._dump(value, max_age, expires)
+
+        if max_size is None:
+            max_size = self.max_size
+
+        _check_cookie_size(self.key, value, rv, max_size)
+        return rv
+
+    def _dump(
+        self,
+        value: str,
+        max_age: timedelta | int | None,
+        expires: str | datetime | int | float | None,
+    ) -> tuple[str, str]:
+        if max_age is None:
+            max_age = self.max_age
+        elif isinstance(max_age, timedelta):
+            max_age = int(max_age.total_seconds())
+
+        if expires is not None:
+            if not isinstance(expires, str):
+                expires = http_date(expires)
+        elif max_age is not None and self.sync_expires:
+            expires = http_date(_time_now() + max_age)
+
+        # Quote value if it contains characters not allowed by RFC 6265. Slash-escape
+        # with three octal digits, which matches http.cookies, although the RFC
+        # suggests base64.
+        if not _cookie_no_quote_re.fullmatch(value):
+            # Work with bytes here, since a UTF-8 character could be multiple bytes.
+            value = _cookie_slash_re.sub(
+                lambda m: _cookie_slash_map[m.group()], value.encode()
+            ).decode("ascii")
+            value = f'"{value}"'
+
+        buf = [self._header_key, "=", value, self._before]
+
+        if expires is not None:
+            buf.append(f"; Expires={expires}")
+
+        if max_age is not None:
+            buf.append(f"; Max-Age={max_age}")
+
+        buf.append(self._after)
+        return value, "".join(buf)
+
+
+def _check_cookie_size(key: str, value: str, rv: str, max_size: int) -> None:
     # Warn if the final value of the cookie is larger than the limit. If the cookie is
     # too large, then it may be silently ignored by the browser, which can be quite hard
     # to debug.
@@ -1475,11 +1814,9 @@ def dump_cookie(
             f" header required {cookie_size - value_size} extra bytes. The final size"
             f" was {cookie_size} bytes but the limit is {max_size} bytes. Browsers may"
             " silently ignore cookies larger than this.",
-            stacklevel=2,
+            stacklevel=3,
         )
 
-    return rv
-
 
 def is_byte_range_valid(
     start: int | None, stop: int | None, length: int | None
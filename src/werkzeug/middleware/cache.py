@@ -0,0 +1,456 @@
+"""
+Cache Responses
+===============
+
+.. autoclass:: CacheMiddleware
+
+.. autoclass:: MemoryCache
+    :members:
+
+.. autoclass:: CachedResponse
+    :members:
+
+:copyright: 2007 Pallets
+:license: BSD-3-Clause
+"""
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import itertools
+import threading
+import typing as t
+from dataclasses import dataclass
+from dataclasses import field
+from time import monotonic
+
+from ..datastructures import Headers
+from ..datastructures import ResponseCacheControl
+from ..http import is_resource_modified
+from ..http import parse_list_header
+from ..http import remove_entity_headers
+from ..wsgi import ClosingIterator
+from ..wsgi import get_current_url
+
+if t.TYPE_CHECKING:
+    import typing_extensions as te
+    from _typeshed.wsgi import StartResponse
+    from _typeshed.wsgi import WSGIApplication
+    from _typeshed.wsgi import WSGIEnvironment
+
+    class _Storage(te.Protocol):
+        def get(self, key: str) -> CachedResponse | None: ...
+        def set(self, key: str, response: CachedResponse) -> None: ...
+        def delete(self, key: str) -> None: ...
+
+
+# Request headers that are not prefixed with HTTP_ in the environ.
+_environ_content_keys = frozenset(("CONTENT_TYPE", "CONTENT_LENGTH"))
+
+# Status codes that can be stored when a response has explicit freshness.
+_cacheable_status = frozenset((200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501))
+
+
+@dataclass
+class CachedResponse:
+    """A complete response stored by :class:`CacheMiddleware`.
+
+    .. versionadded:: 3.2
+    """
+
+    #: The WSGI status string.
+    status: str
+    #: The response headers as a list of ``(key, value)`` tuples.
+    headers: list[tuple[str, str]]
+    #: The complete response body.
+    body: bytes
+    #: The time the response was stored, from :func:`time.monotonic`.
+    created: float
+    #: The time after which the response is stale, from
+    #: :func:`time.monotonic`.
+    expires: float
+    #: The lowercase request header names from the response's ``Vary``
+    #: header, and the request's values for them. The entry stored under
+    #: the URL's key only records the names, with empty values and an empty
+    #: body, and the response is stored under a key for the values.
+    vary: tuple[tuple[str, str], ...] = ()
+    #: The approximate number of bytes used to store the response.
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Check if the response has not expired yet."""
+        if now is None:
+            now = monotonic()
+
+        return now < self.expires
+
+
+class MemoryCache:
+    """Store responses in memory for :class:`CacheMiddleware`. Responses are
+    removed when they expire, and the least recently used responses are
+    removed when there are more than ``max_entries`` responses or when they
+    use more than ``max_size`` bytes.
+
+    Another storage, such as one using files or a local cache server, can be
+    used instead by implementing the same ``get``, ``set``, and ``delete``
+    methods. ``get`` may return expired responses, the middleware checks
+    them.
+
+    :param max_entries: The maximum number of responses to store.
+    :param max_size: The maximum number of bytes to store, as estimated by
+        :attr:`CachedResponse.size`.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(self, max_entries: int = 1024, max_size: int = 64 * 1024**2):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._data: dict[str, CachedResponse] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get the response stored for a key, or ``None``. Expired responses
+        are removed and not returned.
+        """
+        with self._lock:
+            response = self._data.pop(key, None)
+
+            if response is None:
+                return None
+
+            if not response.is_fresh():
+                self._size -= response.size
+                return None
+
+            # Move the key to the end, as most recently used.
+            self._data[key] = response
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Store a response for a key, replacing any existing response. Least
+        recently used responses are removed to stay within the limits.
+        """
+        if response.size > self.max_size:
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+
+            if old is not None:
+                self._size -= old.size
+
+            self._data[key] = response
+            self._size += response.size
+
+            while len(self._data) > self.max_entries or self._size > self.max_size:
+                oldest = next(iter(self._data))
+                self._size -= self._data.pop(oldest).size
+
+    def delete(self, key: str) -> None:
+        """Remove the response stored for a key, if any."""
+        with self._lock:
+            response = self._data.pop(key, None)
+
+            if response is not None:
+                self._size -= response.size
+
+    def clear(self) -> None:
+        """Remove all responses."""
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+
+def _get_ttl(status: str, headers: Headers) -> int | None:
+    """Get the number of seconds a response can be stored by a shared
+    cache, or ``None`` if it must not be stored.
+    """
+    if int(status[:3]) not in _cacheable_status or "Set-Cookie" in headers:
+        return None
+
+    cc = ResponseCacheControl.from_header(headers.get("Cache-Control"))
+
+    if cc.no_store or cc.private or cc.no_cache:
+        return None
+
+    ttl = cc.s_maxage if cc.s_maxage is not None else cc.max_age
+
+    if ttl is None or ttl <= 0:
+        return None
+
+    return ttl
+
+
+class CacheMiddleware:
+    """Store complete responses to ``GET`` requests and serve them again
+    while they are fresh, like a shared HTTP cache in front of the
+    application.
+
+    .. code-block:: python
+
+        from werkzeug.middleware.cache import CacheMiddleware
+        app = CacheMiddleware(app)
+
+    A response is stored if it has an explicit lifetime from the
+    ``s-maxage`` or ``max-age`` ``Cache-Control`` directives, with
+    ``s-maxage`` taking precedence. It is not stored if it has the
+    ``no-store``, ``private``, or ``no-cache`` directives, if it sets a
+    cookie, if it has ``Vary: *``, or if its status isn't cacheable by
+    default. Requests with an ``Authorization`` header are not served from
+    or stored in the cache.
+
+    If a response has a ``Vary`` header, it is stored separately for each
+    combination of values of those request headers. A small entry with only
+    the header names is stored for the URL to find them.
+
+    A ``HEAD`` request is served from a stored ``GET`` response, but is
+    not stored itself. A request with ``If-None-Match`` or
+    ``If-Modified-Since`` that matches the stored ``ETag`` or
+    ``Last-Modified`` is answered with ``304 Not Modified``. Responses
+    served from the cache have an ``Age`` header.
+
+    When many requests miss the cache for the same URL at the same time,
+    only the first one calls the application. The others wait up to
+    ``lock_timeout`` seconds for its response to be stored, then use it.
+
+    The body is read completely before the response is started, so that
+    it can be stored. A body larger than ``max_entry_size`` is not stored,
+    and is streamed once that size is reached.
+
+    :param app: The WSGI application to wrap.
+    :param storage: Where to store responses. Defaults to a
+        :class:`MemoryCache`. See that class for the methods to implement
+        for other storage.
+    :param max_entry_size: The maximum size of a response body to store.
+    :param lock_timeout: How long a request waits for another request for
+        the same URL to store its response.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self,
+        app: WSGIApplication,
+        storage: _Storage | None = None,
+        max_entry_size: int = 1024**2,
+        lock_timeout: float = 10,
+    ) -> None:
+        self.app = app
+
+        if storage is None:
+            storage = MemoryCache()
+
+        self.storage = storage
+        self.max_entry_size = max_entry_size
+        self.lock_timeout = lock_timeout
+        self._pending: dict[str, threading.Event] = {}
+        self._pending_lock = threading.Lock()
+
+    def get_cache_key(self, environ: WSGIEnvironment) -> str:
+        """Get the key a request's response is stored under, before taking
+        ``Vary`` into account. By default, this is the full URL. Override
+        this to add other parts of the request.
+        """
+        return get_current_url(environ)
+
+    def _get_variant_key(self, key: str, vary: cabc.Iterable[tuple[str, str]]) -> str:
+        return "\n".join([key, *(f"{k}: {v}" for k, v in vary)])
+
+    def _get_vary(
+        self, environ: WSGIEnvironment, names: cabc.Iterable[str]
+    ) -> tuple[tuple[str, str], ...]:
+        vary = []
+
+        for name in names:
+            environ_key = name.upper().replace("-", "_")
+
+            if environ_key not in _environ_content_keys:
+                environ_key = f"HTTP_{environ_key}"
+
+            vary.append((name, environ.get(environ_key, "")))
+
+        return tuple(vary)
+
+    def _lookup(self, environ: WSGIEnvironment, key: str) -> CachedResponse | None:
+        """Find a fresh stored response for the request. If the response
+        varies, the entry stored under the key itself only gives the
+        ``Vary`` header names to find the variant for this request.
+        """
+        cached = self.storage.get(key)
+
+        if cached is not None and cached.vary:
+            vary = self._get_vary(environ, (name for name, _ in cached.vary))
+            cached = self.storage.get(self._get_variant_key(key, vary))
+
+        if cached is None or not cached.is_fresh():
+            return None
+
+        return cached
+
+    def _store(self, key: str, cached: CachedResponse) -> None:
+        if not cached.vary:
+            self.storage.set(key, cached)
+            return
+
+        # Store the body once, under the variant key, and only the names
+        # under the key itself.
+        names = CachedResponse(
+            cached.status,
+            [],
+            b"",
+            created=cached.created,
+            expires=cached.expires,
+            vary=tuple((name, "") for name, _ in cached.vary),
+        )
+        self.storage.set(key, names)
+        self.storage.set(self._get_variant_key(key, cached.vary), cached)
+
+    def _send_cached(
+        self,
+        environ: WSGIEnvironment,
+        start_response: StartResponse,
+        cached: CachedResponse,
+    ) -> cabc.Iterable[bytes]:
+        headers = Headers(cached.headers)
+        headers["Age"] = str(int(monotonic() - cached.created))
+
+        if (
+            cached.status[:3] == "200"
+            and "HTTP_IF_MATCH" not in environ
+            and not is_resource_modified(
+                environ, headers.get("ETag"), None, headers.get("Last-Modified")
+            )
+        ):
+            remove_entity_headers(headers)
+            start_response("304 Not Modified", headers.to_wsgi_list())
+            return []
+
+        start_response(cached.status, headers.to_wsgi_list())
+
+        if environ["REQUEST_METHOD"] == "HEAD":
+            return []
+
+        return [cached.body]
+
+    def __call__(
+        self, environ: WSGIEnvironment, start_response: StartResponse
+    ) -> cabc.Iterable[bytes]:
+        method = environ["REQUEST_METHOD"]
+
+        if method not in {"GET", "HEAD"} or "HTTP_AUTHORIZATION" in environ:
+            return self.app(environ, start_response)
+
+        key = self.get_cache_key(environ)
+        cached = self._lookup(environ, key)
+
+        if cached is not None:
+            return self._send_cached(environ, start_response, cached)
+
+        if method == "HEAD":
+            return self.app(environ, start_response)
+
+        with self._pending_lock:
+            event = self._pending.get(key)
+
+            if event is None:
+                self._pending[key] = threading.Event()
+
+        if event is not None:
+            # Another request is generating the response, wait for it to be
+            # stored, then generate it if it still isn't available.
+            event.wait(self.lock_timeout)
+            cached = self._lookup(environ, key)
+
+            if cached is not None:
+                return self._send_cached(environ, start_response, cached)
+
+            return self._call_app(environ, start_response, key)
+
+        try:
+            return self._call_app(environ, start_response, key)
+        finally:
+            with self._pending_lock:
+                self._pending.pop(key).set()
+
+    def _call_app(
+        self, environ: WSGIEnvironment, start_response: StartResponse, key: str
+    ) -> cabc.Iterable[bytes]:
+        """Call the application, reading the body so that the response can
+        be stored if it is cacheable. If it is not, the response is started
+        and the rest of the body is streamed.
+        """
+        response: list[t.Any] = []
+        chunks: list[bytes] = []
+
+        def capture_start_response(
+            status: str, headers: list[tuple[str, str]], exc_info: t.Any = None
+        ) -> cabc.Callable[[bytes], object]:
+            response[:] = (status, headers, exc_info)
+            # Data from the write callable is sent before the body.
+            return chunks.append
+
+        app_iter = self.app(environ, capture_start_response)
+        iterator = iter(app_iter)
+        ttl: int | None = None
+        size = 0
+        headers = Headers()
+
+        try:
+            # The empty first chunk checks the headers before reading the
+            # body, if the app called start_response before returning.
+            for chunk in itertools.chain((b"",), iterator):
+                chunks.append(chunk)
+                size += len(chunk)
+
+                if not response:
+                    # The app calls start_response when the body is iterated.
+                    continue
+
+                if ttl is None:
+                    headers = Headers(response[1])
+                    ttl = _get_ttl(response[0], headers)
+                    vary = parse_list_header(headers.get("Vary", ""))
+
+                    if ttl is None or "*" in vary or size > self.max_entry_size:
+                        break
+                elif size > self.max_entry_size:
+                    ttl = None
+                    break
+            else:
+                if ttl is not None:
+                    cached = CachedResponse(
+                        response[0],
+                        response[1],
+                        b"".join(chunks),
+                        created=(now := monotonic()),
+                        expires=now + ttl,
+                        vary=self._get_vary(environ, (v.lower() for v in vary)),
+                    )
+                    self._store(key, cached)
+                    app_iter_close = getattr(app_iter, "close", None)
+
+                    if app_iter_close is not None:
+                        app_iter_close()
+
+                    return self._send_cached(environ, start_response, cached)
+        except BaseException:
+            if hasattr(app_iter, "close"):
+                app_iter.close()
+
+            raise
+
+        if not response:
+            if hasattr(app_iter, "close"):
+                app_iter.close()
+
+            raise RuntimeError("The application did not call start_response.")
+
+        start_response(response[0], response[1], response[2])
+        return ClosingIterator(
+            itertools.chain(chunks, iterator), getattr(app_iter, "close", None)
+        )
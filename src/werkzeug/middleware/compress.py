@@ -0,0 +1,387 @@
+"""
+Compress Responses
+==================
+
+.. autoclass:: CompressMiddleware
+
+:copyright: 2007 Pallets
+:license: BSD-3-Clause
+"""
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import itertools
+import os
+import sys
+import typing as t
+import zlib
+from functools import partial
+
+from ..datastructures import Accept
+from ..datastructures import AcceptOffers
+from ..datastructures import Headers
+from ..http import dump_header
+from ..http import parse_list_header
+from ..utils import _find_precompressed
+from ..utils import _precompressed_extensions
+from ..wsgi import ClosingIterator
+from ..wsgi import FileWrapper
+
+if t.TYPE_CHECKING:
+    import typing_extensions as te
+    from _typeshed.wsgi import StartResponse
+    from _typeshed.wsgi import WSGIApplication
+    from _typeshed.wsgi import WSGIEnvironment
+
+    class _Compressor(te.Protocol):
+        def compress(self, data: bytes) -> bytes: ...
+        def flush(self) -> bytes: ...
+        def finish(self) -> bytes: ...
+
+
+class _ZlibCompressor:
+    """Adapt a :func:`zlib.compressobj` to the compressor interface. The
+    ``wbits`` select the gzip or zlib (``deflate``) format.
+    """
+
+    def __init__(self, wbits: int, level: int = 6) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+# The built-in compressors in order of preference.
+_default_compressors: dict[str, cabc.Callable[[], _Compressor]] = {}
+
+if sys.version_info >= (3, 14):
+    try:
+        from compression import zstd
+    except ImportError:
+        pass
+    else:
+
+        class _ZstdCompressor:
+            """Adapt a :class:`compression.zstd.ZstdCompressor` to the
+            compressor interface.
+            """
+
+            def __init__(self) -> None:
+                self._obj = zstd.ZstdCompressor()
+
+            def compress(self, data: bytes) -> bytes:
+                return self._obj.compress(data)
+
+            def flush(self) -> bytes:
+                return self._obj.flush(zstd.ZstdCompressor.FLUSH_BLOCK)
+
+            def finish(self) -> bytes:
+                return self._obj.flush(zstd.ZstdCompressor.FLUSH_FRAME)
+
+        _default_compressors["zstd"] = _ZstdCompressor
+
+_default_compressors["gzip"] = partial(_ZlibCompressor, 16 + zlib.MAX_WBITS)
+_default_compressors["deflate"] = partial(_ZlibCompressor, zlib.MAX_WBITS)
+
+# Formats that are already compressed and are not made smaller.
+_skip_mimetypes = frozenset(
+    (
+        "application/gzip",
+        "application/octet-stream",
+        "application/pdf",
+        "application/vnd.rar",
+        "application/x-7z-compressed",
+        "application/x-bzip2",
+        "application/x-gzip",
+        "application/x-xz",
+        "application/zip",
+        "application/zstd",
+    )
+)
+_skip_mimetype_prefixes = ("image/", "audio/", "video/", "font/woff")
+_compress_image_mimetypes = frozenset(("image/svg+xml", "image/x-icon", "image/bmp"))
+
+
+def _is_compressible_mimetype(mimetype: str) -> bool:
+    if not mimetype or mimetype in _skip_mimetypes:
+        return False
+
+    if mimetype.startswith(_skip_mimetype_prefixes):
+        return mimetype in _compress_image_mimetypes
+
+    return True
+
+
+def _compress_iter(
+    iterable: cabc.Iterable[bytes], compressor: _Compressor
+) -> cabc.Iterator[bytes]:
+    for data in iterable:
+        if data:
+            # Flush after each chunk so that a streamed response is sent as
+            # it is generated, rather than held until the compressor's
+            # buffer is full.
+            yield compressor.compress(data) + compressor.flush()
+
+    yield compressor.finish()
+
+
+class CompressMiddleware:
+    """Compress response bodies with an encoding the client accepts, based
+    on the ``Accept-Encoding`` request header.
+
+    .. code-block:: python
+
+        from werkzeug.middleware.compress import CompressMiddleware
+        app = CompressMiddleware(app)
+
+    ``gzip`` and ``deflate`` are supported, and ``zstd`` is preferred if
+    the :mod:`compression.zstd` module is available, on Python 3.14 and
+    later. Other encodings, such as ``br``, can be added by passing
+    ``compressors``. Each maps an encoding name to a function that returns
+    a new compressor object for a response, with three methods.
+
+    -   ``compress(data)`` adds data and returns any compressed output.
+    -   ``flush()`` returns all pending output, so that a client can
+        decompress everything passed so far.
+    -   ``finish()`` ends the stream and returns the remaining output.
+
+    For example, a compressor using the ``brotli`` library:
+
+    .. code-block:: python
+
+        import brotli
+
+        class BrotliCompressor:
+            def __init__(self):
+                self._c = brotli.Compressor()
+
+            def compress(self, data):
+                return self._c.process(data)
+
+            def flush(self):
+                return self._c.flush()
+
+            def finish(self):
+                return self._c.finish()
+
+        app = CompressMiddleware(app, compressors={"br": BrotliCompressor})
+
+    A response is not compressed if it already has a ``Content-Encoding``,
+    if it has ``Cache-Control: no-transform``, if it is a partial or empty
+    response, if its ``Content-Type`` is missing or is a format that is
+    already compressed, such as most images, or if it is smaller than
+    ``minimum_size``. ``Vary: Accept-Encoding`` is added to any response
+    that could be compressed.
+
+    A response body that is a list or tuple is compressed at once, and its
+    ``Content-Length`` is updated. Any other body is compressed as it is
+    iterated, flushing after each chunk, and ``Content-Length`` is removed.
+    A strong ``ETag`` is made weak, since the compressed bytes differ from
+    the original. ``Accept-Ranges`` is removed, since ranges would apply to
+    the compressed bytes.
+
+    If the body is a :class:`.FileWrapper` for a file on disk, such as from
+    :func:`.send_file`, and there is a precompressed file next to it, such
+    as ``style.css.gz`` next to ``style.css``, that file is sent instead of
+    compressing the original. A precompressed file is only used if it is
+    not older than the original.
+
+    Responses that are started with the ``write`` callable returned by
+    ``start_response`` are not compressed.
+
+    :param app: The WSGI application to wrap.
+    :param minimum_size: Don't compress bodies with a ``Content-Length``
+        smaller than this number of bytes.
+    :param compressors: A map of encoding names to compressor factories.
+        These are preferred over the built-in compressors, in the order
+        given, and can replace a built-in one.
+    :param precompressed: A map of encoding names to the extension of
+        precompressed files. By default, ``.br``, ``.zst``, and ``.gz``
+        files are used. Pass an empty dict to disable.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self,
+        app: WSGIApplication,
+        minimum_size: int = 500,
+        compressors: cabc.Mapping[str, cabc.Callable[[], _Compressor]] | None = None,
+        precompressed: cabc.Mapping[str, str] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressors = dict(compressors or ())
+
+        for key, value in _default_compressors.items():
+            self.compressors.setdefault(key, value)
+
+        if precompressed is None:
+            precompressed = _precompressed_extensions
+
+        self.precompressed = dict(precompressed)
+        self._offers = AcceptOffers(self.compressors)
+
+    def _is_skipped(self, environ: WSGIEnvironment, status: str) -> bool:
+        """Check if a response can't be compressed based on the request
+        and status, without looking at its headers.
+        """
+        code = int(status[:3])
+        return (
+            environ["REQUEST_METHOD"] == "HEAD" or code < 200 or code in {204, 206, 304}
+        )
+
+    def _is_compressible(self, headers: Headers) -> bool:
+        """Check if a response could be compressed based on its headers, for
+        any client.
+        """
+        if "Content-Encoding" in headers or "Content-Range" in headers:
+            return False
+
+        if "no-transform" in headers.get("Cache-Control", "").lower():
+            return False
+
+        mimetype = headers.get("Content-Type", "").partition(";")[0]
+        return _is_compressible_mimetype(mimetype.strip().lower())
+
+    def _update_headers(self, headers: Headers, encoding: str) -> None:
+        headers["Content-Encoding"] = encoding
+        headers.pop("Accept-Ranges", None)
+        etag = headers.get("ETag")
+
+        if etag is not None and not etag.startswith(("W/", "w/")):
+            headers["ETag"] = f"W/{etag}"
+
+    def _open_precompressed(
+        self, accept: Accept, file: t.IO[bytes]
+    ) -> tuple[str, t.IO[bytes]] | None:
+        """Open the precompressed file for the best encoding the client
+        accepts, if there is one next to the given file.
+        """
+        path = getattr(file, "name", None)
+
+        if not isinstance(path, str):
+            return None
+
+        found = _find_precompressed(path, self.precompressed)
+        encoding = accept.best_match(found)
+
+        if encoding is None:
+            return None
+
+        try:
+            return encoding, open(found[encoding][0], "rb")
+        except OSError:
+            return None
+
+    def __call__(
+        self, environ: WSGIEnvironment, start_response: StartResponse
+    ) -> cabc.Iterable[bytes]:
+        response: list[t.Any] = []
+        writers: list[cabc.Callable[[bytes], object]] = []
+
+        def capture_start_response(
+            status: str, headers: list[tuple[str, str]], exc_info: t.Any = None
+        ) -> cabc.Callable[[bytes], object]:
+            if exc_info is not None and writers:
+                raise exc_info[1].with_traceback(exc_info[2])
+
+            response[:] = (status, headers, exc_info)
+            return write
+
+        def write(data: bytes) -> None:
+            # Data written this way can't be compressed, start the response
+            # without changing it.
+            if not writers:
+                writers.append(start_response(*response))
+
+            writers[0](data)
+
+        app_iter = self.app(environ, capture_start_response)
+        body: cabc.Iterable[bytes] = app_iter
+
+        if not response and not writers:
+            # The app calls start_response when its body is first iterated.
+            iterator = iter(app_iter)
+            first = next(iterator, None)
+            body = itertools.chain(() if first is None else (first,), iterator)
+            body = ClosingIterator(body, getattr(app_iter, "close", None))
+
+        if writers:
+            return body
+
+        if not response:
+            if hasattr(body, "close"):
+                body.close()
+
+            raise RuntimeError("The application did not call start_response.")
+
+        status, header_list, exc_info = response
+
+        if self._is_skipped(environ, status):
+            start_response(status, header_list, exc_info)
+            return body
+
+        headers = Headers(header_list)
+
+        if not self._is_compressible(headers):
+            start_response(status, header_list, exc_info)
+            return body
+
+        vary = parse_list_header(headers.get("Vary", ""))
+
+        if "*" not in vary and "accept-encoding" not in {v.lower() for v in vary}:
+            headers["Vary"] = dump_header([*vary, "Accept-Encoding"])
+
+        accept = Accept.from_header(environ.get("HTTP_ACCEPT_ENCODING"))
+
+        if isinstance(body, FileWrapper) and self.precompressed:
+            opened = self._open_precompressed(accept, body.file)
+
+            if opened is not None:
+                file_encoding, file = opened
+                body.close()
+                self._update_headers(headers, file_encoding)
+                headers["Content-Length"] = str(os.fstat(file.fileno()).st_size)
+                start_response(status, headers.to_wsgi_list(), exc_info)
+                file_wrapper = environ.get("wsgi.file_wrapper", FileWrapper)
+                return file_wrapper(file)  # type: ignore[no-any-return]
+
+        encoding = accept.best_match(self._offers)
+        length = headers.get("Content-Length", type=int)
+
+        if encoding is None or (length is not None and length < self.minimum_size):
+            start_response(status, headers.to_wsgi_list(), exc_info)
+            return body
+
+        compressor = self.compressors[encoding]()
+
+        if isinstance(body, (list, tuple)):
+            data = b"".join(body)
+
+            if hasattr(app_iter, "close"):
+                app_iter.close()
+
+            if len(data) < self.minimum_size:
+                start_response(status, headers.to_wsgi_list(), exc_info)
+                return [data]
+
+            data = compressor.compress(data) + compressor.finish()
+            self._update_headers(headers, encoding)
+            headers["Content-Length"] = str(len(data))
+            start_response(status, headers.to_wsgi_list(), exc_info)
+            return [data]
+
+        self._update_headers(headers, encoding)
+        headers.pop("Content-Length", None)
+        start_response(status, headers.to_wsgi_list(), exc_info)
+        return ClosingIterator(
+            _compress_iter(body, compressor), getattr(body, "close", None)
+        )
@@ -3,7 +3,9 @@ Serve Shared Static Files
 =========================
 
 .. autoclass:: SharedDataMiddleware
-    :members: is_allowed
+    :members: is_allowed, build_index
+
+.. autofunction:: precompress_directory
 
 :copyright: 2007 Pallets
 :license: BSD-3-Clause
@@ -12,23 +14,35 @@ Serve Shared Static Files
 from __future__ import annotations
 
 import collections.abc as cabc
+import hashlib
+import importlib.resources
 import importlib.util
+import json
 import mimetypes
 import os
+import pathlib
 import posixpath
+import re
+import threading
 import typing as t
+from dataclasses import dataclass
 from datetime import datetime
 from datetime import timezone
 from io import BytesIO
 from time import time
 from zlib import adler32
 
+from ..datastructures import Accept
 from ..http import http_date
 from ..http import is_resource_modified
 from ..security import safe_join
+from ..utils import _find_precompressed
+from ..utils import _precompressed_extensions
 from ..utils import get_content_type
 from ..wsgi import get_path_info
 from ..wsgi import wrap_file
+from .compress import _default_compressors
+from .compress import _is_compressible_mimetype
 
 _TOpener = t.Callable[[], tuple[t.IO[bytes], datetime, int]]
 _TLoader = t.Callable[[str | None], tuple[str | None, _TOpener | None]]
@@ -38,6 +52,36 @@ if t.TYPE_CHECKING:
     from _typeshed.wsgi import WSGIApplication
     from _typeshed.wsgi import WSGIEnvironment
 
+    from .compress import _Compressor
+
+# Runs of hex digits in a file name, which may be a fingerprint of the content.
+_fingerprint_re = re.compile(r"[0-9a-f]{8,}")
+
+# Cache fingerprinted files for a year.
+_immutable_max_age = 60 * 60 * 24 * 365
+
+
+@dataclass
+class _IndexEntry:
+    """Information about an exported file, found when building the index so
+    that serving it doesn't need to look at the filesystem again.
+    """
+
+    #: The path to open the file.
+    filename: str
+    mtime: datetime
+    #: The modification time in nanoseconds, to detect changes.
+    mtime_ns: int
+    size: int
+    etag: str
+    content_type: str
+    last_modified: str
+    #: Precompressed files, a map of encoding names to paths and sizes.
+    variants: dict[str, tuple[str, int]]
+    #: The file name contains a fingerprint of its content, so it can be
+    #: cached forever.
+    immutable: bool = False
+
 
 class SharedDataMiddleware:
     """A WSGI middleware which provides static content for development
@@ -87,6 +131,36 @@ class SharedDataMiddleware:
     :param cache: enable or disable caching headers.
     :param cache_timeout: the cache timeout in seconds for the headers.
     :param fallback_mimetype: The fallback mimetype for unknown files.
+    :param index: Scan the exported directories when the middleware is
+        created, and store the information and headers for each file.
+        Requests for indexed files don't look at the filesystem except to
+        open the file. Files that are added later are still found, but
+        changes to indexed files are not seen until :meth:`build_index` is
+        called again.
+    :param hot_cache_size: With ``index``, keep the contents of small files
+        in memory, using up to this many bytes. The least recently used
+        files are removed first. Requests for these files don't use the
+        filesystem at all.
+    :param hot_file_max_size: The maximum size of a file to keep in memory.
+    :param precompressed: Send a precompressed file next to the requested
+        file instead, such as ``style.css.gz`` next to ``style.css``, if the
+        client accepts its encoding. ``True`` looks for ``.br``, ``.zst``,
+        and ``.gz`` files. Can also be a map of encoding names to file
+        extensions. A precompressed file is only used if it is not older
+        than the original.
+    :param manifest: With ``index``, the name of a manifest file written by
+        :func:`precompress_directory` to read from each exported directory.
+        Files listed in it use the hash of their content as the ``ETag``,
+        and files with the hash in their name are sent with headers to cache
+        them forever. A file's entry is ignored if its size or modification
+        time changed after the manifest was written.
+
+    .. versionchanged:: 3.2
+        Added the ``precompressed`` and ``manifest`` parameters.
+
+    .. versionchanged:: 3.2
+        Added the ``index``, ``hot_cache_size``, and ``hot_file_max_size``
+        parameters.
 
     .. versionchanged:: 1.0
         The default ``fallback_mimetype`` is
@@ -111,16 +185,36 @@ class SharedDataMiddleware:
         cache: bool = True,
         cache_timeout: int = 60 * 60 * 12,
         fallback_mimetype: str = "application/octet-stream",
+        index: bool = False,
+        hot_cache_size: int = 0,
+        hot_file_max_size: int = 64 * 1024,
+        precompressed: bool | cabc.Mapping[str, str] = False,
+        manifest: str | None = None,
     ) -> None:
         self.app = app
         self.exports: list[tuple[str, _TLoader]] = []
         self.cache = cache
         self.cache_timeout = cache_timeout
+        self.hot_cache_size = hot_cache_size
+        self.hot_file_max_size = hot_file_max_size
+
+        if precompressed is True:
+            precompressed = _precompressed_extensions
+
+        self.precompressed = dict(precompressed or ())
+        self.manifest = manifest
+        self._sources: list[tuple[str, str | tuple[str, str]]] = []
+        self._index: dict[str, _IndexEntry] | None = None
+        self._hot: dict[str, bytes] = {}
+        self._hot_used = 0
+        self._hot_lock = threading.Lock()
 
         if isinstance(exports, cabc.Mapping):
             exports = exports.items()
 
         for key, value in exports:
+            self._sources.append((key, value))
+
             if isinstance(value, tuple):
                 loader = self.get_package_loader(*value)
             elif isinstance(value, str):
@@ -140,6 +234,9 @@ class SharedDataMiddleware:
 
         self.fallback_mimetype = fallback_mimetype
 
+        if index:
+            self.build_index()
+
     def is_allowed(self, filename: str) -> bool:
         """Subclasses can override this method to disallow the access to
         certain files.  However by providing `disallow` in the constructor
@@ -218,6 +315,235 @@ class SharedDataMiddleware:
 
         return loader
 
+    def _make_entry(
+        self, filename: str, manifest_info: dict[str, t.Any] | None = None
+    ) -> _IndexEntry | None:
+        basename = os.path.basename(filename)
+
+        if not self.is_allowed(basename):
+            return None
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        guessed_type = mimetypes.guess_type(basename)
+        mime_type = get_content_type(guessed_type[0] or self.fallback_mimetype, "utf-8")
+        variants = {}
+
+        if self.precompressed:
+            variants = _find_precompressed(filename, self.precompressed, stat.st_mtime)
+
+        etag = self.generate_etag(mtime, stat.st_size, basename)
+        immutable = False
+
+        # Ignore the manifest if the file has changed since it was written.
+        if (
+            manifest_info is not None
+            and manifest_info.get("size") == stat.st_size
+            and manifest_info.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            content_hash = manifest_info["hash"]
+            etag = content_hash
+            immutable = any(
+                content_hash.startswith(m) for m in _fingerprint_re.findall(basename)
+            )
+
+        return _IndexEntry(
+            filename=filename,
+            mtime=mtime,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            etag=etag,
+            content_type=mime_type,
+            last_modified=http_date(mtime),
+            variants=variants,
+            immutable=immutable,
+        )
+
+    def _index_directory(
+        self, index: dict[str, _IndexEntry], prefix: str, directory: str
+    ) -> None:
+        if not prefix.endswith("/"):
+            prefix += "/"
+
+        manifest: dict[str, dict[str, t.Any]] = {}
+
+        if self.manifest is not None:
+            try:
+                with open(os.path.join(directory, self.manifest), "rb") as f:
+                    manifest = json.load(f)["files"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        for root, _, files in os.walk(directory):
+            rel_root = os.path.relpath(root, directory)
+
+            for name in files:
+                rel_path = name if rel_root == "." else os.path.join(rel_root, name)
+                rel_path = rel_path.replace(os.sep, "/")
+                key = prefix + rel_path
+
+                if key not in index and (
+                    entry := self._make_entry(
+                        os.path.join(root, name), manifest.get(rel_path)
+                    )
+                ):
+                    index[key] = entry
+
+    def build_index(self) -> None:
+        """Scan the exported files and directories, and store the information
+        and headers for each file. Requests for indexed files are served
+        without checking the filesystem. Call this again to pick up changes
+        to indexed files, for example from a file watcher.
+
+        Package exports are only indexed if the package is a directory on
+        the filesystem. Files that aren't indexed are served as before.
+
+        .. versionadded:: 3.2
+        """
+        index: dict[str, _IndexEntry] = {}
+
+        for key, value in self._sources:
+            if isinstance(value, tuple):
+                try:
+                    resource = importlib.resources.files(value[0]).joinpath(value[1])
+                except (ImportError, TypeError):
+                    continue
+
+                if not isinstance(resource, pathlib.Path):
+                    continue
+
+                value = str(resource)
+
+            if os.path.isfile(value):
+                if key not in index and (entry := self._make_entry(value)):
+                    index[key] = entry
+            elif os.path.isdir(value):
+                self._index_directory(index, key, value)
+
+        with self._hot_lock:
+            self._index = index
+            self._hot.clear()
+            self._hot_used = 0
+
+    def _get_hot(self, filename: str, size: int) -> bytes | None:
+        """Get the contents of a small indexed file from memory, reading and
+        storing it if it fits in the budget.
+        """
+        if size > self.hot_file_max_size or size > self.hot_cache_size:
+            return None
+
+        with self._hot_lock:
+            data = self._hot.pop(filename, None)
+
+            if data is not None:
+                # Move the file to the end, as most recently used.
+                self._hot[filename] = data
+                return data
+
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        # The file changed after it was indexed.
+        if len(data) != size:
+            return None
+
+        with self._hot_lock:
+            if filename not in self._hot:
+                self._hot[filename] = data
+                self._hot_used += len(data)
+
+                while self._hot_used > self.hot_cache_size:
+                    oldest = next(iter(self._hot))
+                    self._hot_used -= len(self._hot.pop(oldest))
+
+        return data
+
+    def _send_entry(
+        self,
+        environ: WSGIEnvironment,
+        start_response: StartResponse,
+        entry: _IndexEntry,
+    ) -> t.Iterable[bytes]:
+        filename = entry.filename
+        size = entry.size
+        etag = entry.etag
+        encoding = None
+
+        if entry.variants:
+            accept = Accept.from_header(environ.get("HTTP_ACCEPT_ENCODING"))
+            encoding = accept.best_match(entry.variants)
+
+            if encoding is not None:
+                filename, size = entry.variants[encoding]
+                etag = f"{etag}-{encoding}"
+
+        headers = [("Date", http_date())]
+
+        if entry.variants:
+            headers.append(("Vary", "Accept-Encoding"))
+
+        if self.cache:
+            if entry.immutable:
+                timeout = _immutable_max_age
+                cache_control = f"max-age={timeout}, public, immutable"
+            else:
+                timeout = self.cache_timeout
+                cache_control = f"max-age={timeout}, public"
+
+            headers += [("ETag", f'"{etag}"'), ("Cache-Control", cache_control)]
+
+            if (
+                "HTTP_IF_NONE_MATCH" in environ
+                or "HTTP_IF_MODIFIED_SINCE" in environ
+                or "HTTP_IF_MATCH" in environ
+            ) and not is_resource_modified(environ, etag, last_modified=entry.mtime):
+                start_response("304 Not Modified", headers)
+                return []
+
+            headers.append(("Expires", http_date(time() + timeout)))
+        else:
+            headers.append(("Cache-Control", "public"))
+
+        headers += [
+            ("Content-Type", entry.content_type),
+            ("Content-Length", str(size)),
+            ("Last-Modified", entry.last_modified),
+        ]
+
+        if encoding is not None:
+            headers.append(("Content-Encoding", encoding))
+
+        data = self._get_hot(filename, size)
+
+        if data is not None:
+            start_response("200 OK", headers)
+            return [data]
+
+        try:
+            f = open(filename, "rb")
+        except OSError:
+            return self.app(environ, start_response)
+
+        stat = os.fstat(f.fileno())
+
+        # If the file changed after it was indexed, the headers don't match
+        # its content, serve it as if it wasn't indexed.
+        if stat.st_size != size or (
+            encoding is None and stat.st_mtime_ns != entry.mtime_ns
+        ):
+            f.close()
+            return self._send_path(environ, start_response, get_path_info(environ))
+
+        start_response("200 OK", headers)
+        return wrap_file(environ, f)
+
     def generate_etag(self, mtime: datetime, file_size: int, real_filename: str) -> str:
         fn_str = os.fsencode(real_filename)
         timestamp = mtime.timestamp()
@@ -228,6 +554,15 @@ class SharedDataMiddleware:
         self, environ: WSGIEnvironment, start_response: StartResponse
     ) -> t.Iterable[bytes]:
         path = get_path_info(environ)
+
+        if self._index is not None and (entry := self._index.get(path)) is not None:
+            return self._send_entry(environ, start_response, entry)
+
+        return self._send_path(environ, start_response, path)
+
+    def _send_path(
+        self, environ: WSGIEnvironment, start_response: StartResponse, path: str
+    ) -> t.Iterable[bytes]:
         file_loader = None
 
         for search_path, loader in self.exports:
@@ -252,12 +587,38 @@ class SharedDataMiddleware:
         guessed_type = mimetypes.guess_type(real_filename)  # type: ignore
         mime_type = get_content_type(guessed_type[0] or self.fallback_mimetype, "utf-8")
         f, mtime, file_size = file_loader()
+        encoding = None
+        file_path = getattr(f, "name", None)
+        variants = {}
+
+        if self.precompressed and isinstance(file_path, str):
+            variants = _find_precompressed(file_path, self.precompressed)
+            accept = Accept.from_header(environ.get("HTTP_ACCEPT_ENCODING"))
+            encoding = accept.best_match(variants)
+
+            if encoding is not None:
+                variant_path, file_size = variants[encoding]
+
+                try:
+                    variant = open(variant_path, "rb")
+                except OSError:
+                    encoding = None
+                else:
+                    f.close()
+                    f = variant
 
         headers = [("Date", http_date())]
 
+        if variants:
+            headers.append(("Vary", "Accept-Encoding"))
+
         if self.cache:
             timeout = self.cache_timeout
             etag = self.generate_etag(mtime, file_size, real_filename)  # type: ignore
+
+            if encoding is not None:
+                etag = f"{etag}-{encoding}"
+
             headers += [
                 ("ETag", f'"{etag}"'),
                 ("Cache-Control", f"max-age={timeout}, public"),
@@ -279,5 +640,119 @@ class SharedDataMiddleware:
                 ("Last-Modified", http_date(mtime)),
             )
         )
+
+        if encoding is not None:
+            headers.append(("Content-Encoding", encoding))
+
         start_response("200 OK", headers)
         return wrap_file(environ, f)
+
+
+def precompress_directory(
+    directory: str | os.PathLike[str],
+    compressors: cabc.Mapping[str, cabc.Callable[[], _Compressor]] | None = None,
+    extensions: cabc.Mapping[str, str] | None = None,
+    manifest: str | None = "manifest.json",
+    minimum_size: int = 500,
+) -> dict[str, dict[str, t.Any]]:
+    """Write a compressed copy of each file in a directory next to it, such
+    as ``style.css.gz`` next to ``style.css``, and a manifest with the hash
+    of each file's content. This is meant to be run as a build step before
+    deploying, so that :class:`SharedDataMiddleware` with ``precompressed``,
+    or :func:`.send_file`, can send the compressed files directly.
+
+    A file is skipped if it is smaller than ``minimum_size``, if it is a
+    format that is already compressed, such as most images, or if
+    compressing it doesn't make it smaller. A compressed file is given the
+    same modification time as its original, and is not written again if it
+    is already up to date.
+
+    The manifest is a JSON object with a ``files`` key, mapping each file's
+    path relative to the directory to its ``size``, its modification time
+    as ``mtime_ns``, the SHA-256 ``hash`` of its content, and a list of the
+    ``encodings`` written for it. Pass it to
+    :class:`SharedDataMiddleware` as ``manifest`` to use the hashes as
+    ``ETag`` values. The hash can be used by other build steps to add a
+    fingerprint to file names, such as ``app.3f2a9c1d.js``.
+
+    :param directory: The directory to process, including subdirectories.
+    :param compressors: A map of encoding names to compressor factories,
+        like :class:`.CompressMiddleware` uses. Defaults to ``gzip``, and
+        ``zstd`` if it is available.
+    :param extensions: A map of encoding names to file extensions, which
+        must have an entry for each compressor. Defaults to ``.br``,
+        ``.zst``, and ``.gz``.
+    :param manifest: The name of the manifest file to write in the
+        directory. Pass ``None`` to not write a manifest.
+    :param minimum_size: Don't compress files smaller than this number of
+        bytes.
+    :return: The ``files`` data written to the manifest.
+
+    .. versionadded:: 3.2
+    """
+    if extensions is None:
+        extensions = _precompressed_extensions
+
+    if compressors is None:
+        compressors = {k: v for k, v in _default_compressors.items() if k in extensions}
+
+    directory = os.fspath(directory)
+    skip = tuple(extensions.values())
+    files: dict[str, dict[str, t.Any]] = {}
+
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            rel_path = os.path.relpath(path, directory).replace(os.sep, "/")
+
+            if rel_path == manifest or name.endswith(skip):
+                continue
+
+            with open(path, "rb") as f:
+                data = f.read()
+                stat = os.fstat(f.fileno())
+
+            info: dict[str, t.Any] = {
+                "size": len(data),
+                "mtime_ns": stat.st_mtime_ns,
+                "hash": hashlib.sha256(data).hexdigest(),
+                "encodings": [],
+            }
+            files[rel_path] = info
+            mimetype = mimetypes.guess_type(name)[0] or ""
+
+            if len(data) < minimum_size or not _is_compressible_mimetype(mimetype):
+                continue
+
+            for encoding, factory in compressors.items():
+                out_path = path + extensions[encoding]
+
+                try:
+                    up_to_date = os.stat(out_path).st_mtime == stat.st_mtime
+                except OSError:
+                    up_to_date = False
+
+                if not up_to_date:
+                    compressor = factory()
+                    out = compressor.compress(data) + compressor.finish()
+
+                    if len(out) >= len(data):
+                        continue
+
+                    with open(out_path, "wb") as f:
+                        f.write(out)
+
+                    os.utime(out_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+                info["encodings"].append(encoding)
+
+    if manifest is not None:
+        manifest_path = os.path.join(directory, manifest)
+        tmp_path = f"{manifest_path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"files": files}, f, indent=2, sort_keys=True)
+
+        os.replace(tmp_path, manifest_path)
+
+    return files
@@ -148,26 +148,50 @@ def parse_cookie(
     if not cookie:
         return cls()
 
-    cookie = f"{cookie};"
+    return cls([(k, _unquote_cookie_value(v)) for k, v in _split_cookie(cookie)])
+
+
+def _split_cookie(cookie: str) -> list[tuple[str, str]]:
+    """Split a ``Cookie`` header into stripped ``(key, value)`` pairs, leaving
+    quoted values as they are. Cookies without a key are skipped.
+    """
+    if '"' in cookie or "\n" in cookie:
+        # Quoted values may contain ";", use the full pattern.
+        pairs = _cookie_re.findall(f"{cookie};")
+    else:
+        pairs = [item.partition("=")[::2] for item in cookie.split(";")]
+
     out = []
 
-    for ck, cv in _cookie_re.findall(cookie):
-        ck = ck.strip()
-        cv = cv.strip()
+    for key, value in pairs:
+        key = key.strip()
+
+        if key:
+            out.append((key, value.strip()))
 
-        if not ck:
-            continue
+    return out
 
-        if len(cv) >= 2 and cv[0] == cv[-1] == '"':
-            # Work with bytes here, since a UTF-8 character could be multiple bytes.
-            cv = _cookie_unslash_re.sub(
-                _cookie_unslash_replace, cv[1:-1].encode()
-            ).decode(errors="replace")
 
-        out.append((ck, cv))
+def _unquote_cookie_value(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        # Work with bytes here, since a UTF-8 character could be multiple bytes.
+        return _cookie_unslash_re.sub(
+            _cookie_unslash_replace, value[1:-1].encode()
+        ).decode(errors="replace")
+
+    return value
+
+
+def _parse_cookie_lazy(cookie: str | None) -> ds.ImmutableMultiDict[str, str]:
+    """Like :func:`parse_cookie`, but values are only unquoted when their key
+    is accessed.
+    """
+    if not cookie:
+        return ds.ImmutableMultiDict()
 
-    return cls(out)
+    return _LazyImmutableMultiDict(_split_cookie(cookie), _unquote_cookie_value)
 
 
 # circular dependencies
 from .. import datastructures as ds  # noqa: E402
+from ..datastructures.structures import _LazyImmutableMultiDict  # noqa: E402
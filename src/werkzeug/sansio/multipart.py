@@ -72,6 +72,9 @@ HEADER_CONTINUATION_RE = re.compile(b"%s[ \t]" % LINE_BREAK, re.MULTILINE)
 # additional boundary markers (--) such that they will be found in a
 # subsequent search
 SEARCH_EXTRA_LENGTH = 8
+# What may follow a delimiter at the end of the buffer while the rest of
+# the boundary line has not been received yet.
+_BOUNDARY_SUFFIX_PARTIAL_RE = re.compile(rb"-?|[^\S\n\r]*")
 
 
 class MultipartDecoder:
@@ -121,6 +124,13 @@ class MultipartDecoder:
             % (LINE_BREAK, re.escape(boundary), LINE_BREAK, LINE_BREAK),
             re.MULTILINE,
         )
+        # The delimiter and every way a boundary line can start are
+        # computed once, the data search uses these rather than
+        # rebuilding them for every chunk.
+        self._delimiter = b"--" + boundary
+        self._boundary_prefixes = tuple(
+            line_break + self._delimiter for line_break in (b"\r\n", b"\n", b"\r")
+        )
         self._search_position = 0
         self._parts_decoded = 0
 
@@ -201,10 +211,11 @@ class MultipartDecoder:
 
         elif self.state == State.DATA_START:
             data, del_index, more_data = self._parse_data(self.buffer, start=True)
-            del self.buffer[:del_index]
-            event = Data(data=data, more_data=more_data)
-            if more_data:
-                self.state = State.DATA
+            if del_index > 0:
+                del self.buffer[:del_index]
+                event = Data(data=data, more_data=more_data)
+                if more_data:
+                    self.state = State.DATA
 
         elif self.state == State.DATA:
             data, del_index, more_data = self._parse_data(self.buffer, start=False)
@@ -245,51 +256,81 @@ class MultipartDecoder:
         else:
             data_start = 0
 
-        if self.buffer.find(b"--" + self.boundary) == -1:
-            # No complete boundary in the buffer, but there may be
-            # a partial boundary at the end.
-            data_end = del_index = (
-                self._last_partial_boundary_index(data[data_start:]) + data_start
-            )
-            more_data = True
+        # Only positions where the delimiter occurs can start a boundary,
+        # and bytes.find does that search in C. Each candidate is then
+        # checked against the boundary regex anchored at its line break.
+        index = data.find(self._delimiter)
+
+        while index != -1:
+            line_start = self._line_break_start(data, index)
+
+            if line_start != -1:
+                match = self.boundary_re.match(data, line_start)
+
+                if match is not None:
+                    if match.group(1).startswith(b"--"):
+                        self.state = State.EPILOGUE
+                    else:
+                        self.state = State.PART
+
+                    return bytes(data[data_start : match.start()]), match.end(), False
+
+                if _BOUNDARY_SUFFIX_PARTIAL_RE.fullmatch(
+                    data, index + len(self._delimiter)
+                ):
+                    # The boundary line is not complete yet, keep it
+                    # in the buffer until more data arrives.
+                    return self._partial_data(data, data_start, line_start)
+
+            index = data.find(self._delimiter, index + 1)
+
+        return self._partial_data(
+            data, data_start, self._last_partial_boundary_index(data)
+        )
+
+    def _partial_data(
+        self, data: bytes | bytearray, data_start: int, data_end: int
+    ) -> tuple[bytes, int, bool]:
+        if data_end < data_start:
+            # The line break starting the body may also be the start of
+            # the boundary of an empty part, nothing can be consumed yet.
+            return b"", 0, True
+
+        return bytes(data[data_start:data_end]), data_end, True
+
+    def _line_break_start(self, data: bytes | bytearray, index: int) -> int:
+        # Find the start of the line break preceding the delimiter at
+        # index, or -1 if the delimiter is not at the start of a line.
+        if data[index - 2 : index] == b"\r\n":
+            return index - 2
+        elif index > 0 and data[index - 1] in b"\r\n":
+            return index - 1
         else:
-            match = self.boundary_re.search(data)
-            if match is not None:
-                if match.group(1).startswith(b"--"):
-                    self.state = State.EPILOGUE
-                else:
-                    self.state = State.PART
-                data_end = match.start()
-                del_index = match.end()
-            else:
-                data_end = del_index = (
-                    self._last_partial_boundary_index(data[data_start:]) + data_start
-                )
-            more_data = match is None
-        return bytes(data[data_start:data_end]), del_index, more_data
+            return -1
 
     def _last_partial_boundary_index(self, data: bytes | bytearray) -> int:
-        # Find the last index following which a partial boundary
-        # could be present in the data. This will be the earliest
-        # position of a LF or a CR, unless that position is more
-        # than a complete boundary from the end in which case there
-        # is no partial boundary.
-        complete_boundary_index = len(data) - len(b"\r\n--" + self.boundary)
-        try:
-            last_nl = data.rindex(b"\n")
-        except ValueError:
-            last_nl = len(data)
-        else:
-            if last_nl < complete_boundary_index:
-                last_nl = len(data)
-        try:
-            last_cr = data.rindex(b"\r")
-        except ValueError:
-            last_cr = len(data)
-        else:
-            if last_cr < complete_boundary_index:
-                last_cr = len(data)
-        return min(last_nl, last_cr)
+        # Find the earliest index after which the data could be the
+        # start of a boundary, i.e. a line break followed by a prefix of
+        # the delimiter. Only the final bytes that are shorter than a
+        # complete boundary need to be checked, any other line break is
+        # known to be part of the data.
+        end = len(data)
+        position = max(0, end - len(self._delimiter) - 1)
+
+        while True:
+            cr = data.find(b"\r", position)
+            lf = data.find(b"\n", position)
+
+            if cr == -1 and lf == -1:
+                return end
+
+            position = lf if cr == -1 else cr if lf == -1 else min(cr, lf)
+            tail = data[position:]
+
+            if any(prefix.startswith(tail) for prefix in self._boundary_prefixes):
+                return position
+
+            position += 1
 
 
 class MultipartEncoder:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import collections.abc as cabc
-import typing as t
 from datetime import datetime
 from urllib.parse import parse_qsl
 
 from ..datastructures import Accept
 from ..datastructures import Authorization
+from ..datastructures import CompactImmutableMultiDict
 from ..datastructures import ETags
 from ..datastructures import Headers
 from ..datastructures import HeaderSet
@@ -25,6 +25,8 @@ from ..http import SecFetchSite
 from ..user_agent import UserAgent
 from ..utils import cached_property
 from ..utils import header_property
+from .http import _parse_cookie_lazy
+from .http import is_resource_modified
 from .http import parse_cookie
 from .utils import get_content_length
 from .utils import get_current_url
@@ -155,6 +157,9 @@ class Request:
         """The parsed URL query parameters (the ``?key=value&a=b`` part of a
         URL) as an :class:`ImmutableMultiDict`.
 
+        .. versionchanged:: 3.2
+            Returns a :class:`.CompactImmutableMultiDict`.
+
         .. versionchanged:: 2.3
             Invalid bytes remain percent encoded.
         """
@@ -175,7 +180,7 @@ class Request:
             )
             return self.parameter_storage_class(items)
 
-        return ImmutableMultiDict(items)
+        return CompactImmutableMultiDict(items)
 
     @cached_property
     def access_route(self) -> cabc.Sequence[str]:
@@ -258,14 +263,17 @@ class Request:
     @cached_property
     def cookies(self) -> ImmutableMultiDict[str, str]:
         """A :class:`dict` with the contents of all cookies transmitted with
-        the request."""
+        the request.
+
+        .. versionchanged:: 3.2
+            Quoted values are only unquoted when their key is accessed.
+        """
         wsgi_combined_cookie = ";".join(self.headers.getlist("Cookie"))
-        kwargs: dict[str, t.Any] = {}
 
         if self.dict_storage_class is not None:
-            kwargs["cls"] = self.dict_storage_class
+            return parse_cookie(wsgi_combined_cookie, cls=self.dict_storage_class)
 
-        return parse_cookie(wsgi_combined_cookie, **kwargs)
+        return _parse_cookie_lazy(wsgi_combined_cookie)
 
     # Common Descriptors
 
@@ -503,6 +511,43 @@ class Request:
         """
         return Range.from_header(self.headers.get("Range"))
 
+    def is_modified(
+        self, etag: str | None = None, last_modified: datetime | str | None = None
+    ) -> bool:
+        """Check the conditional request headers against validators for the
+        current version of the resource, before generating its response.
+
+        A validator should be cheap to get, such as a version number or an
+        updated timestamp stored with the data, so that the expensive work of
+        generating the body can be skipped if the client's copy is current.
+        Pass the same validators to the response as its ``ETag`` and
+        ``Last-Modified`` headers.
+
+        Only ``GET`` and ``HEAD`` requests are checked, this returns ``True``
+        for other methods. ``Range`` and ``If-Range`` are ignored.
+
+        Use :meth:`.Response.not_modified` to get a ready response if the
+        resource is not modified.
+
+        :param etag: The ETag the response will have, such as
+            ``f"v{post.version}"``.
+        :param last_modified: The time the resource was last modified.
+        :return: ``False`` if the client's copy is current, or if an
+            ``If-Match`` header did not match.
+
+        .. versionadded:: 3.2
+        """
+        if self.method not in {"GET", "HEAD"}:
+            return True
+
+        return is_resource_modified(
+            http_if_modified_since=self.headers.get("If-Modified-Since"),
+            http_if_none_match=self.headers.get("If-None-Match"),
+            http_if_match=self.headers.get("If-Match"),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
     # User Agent
 
     @cached_property
@@ -15,6 +15,7 @@ from ..datastructures import ResponseCacheControl
 from ..datastructures import WWWAuthenticate
 from ..datastructures.cache_control import _CacheControl
 from ..http import COEP
+from ..http import CookieTemplate
 from ..http import COOP
 from ..http import CORP
 from ..http import dump_age
@@ -184,7 +185,7 @@ class Response:
 
     def set_cookie(
         self,
-        key: str,
+        key: str | CookieTemplate,
         value: str = "",
         max_age: timedelta | int | None = None,
         expires: str | datetime | int | float | None = None,
@@ -200,7 +201,10 @@ class Response:
         A warning is raised if the size of the cookie header exceeds
         :attr:`max_cookie_size`, but the header will still be set.
 
-        :param key: the key (name) of the cookie to be set.
+        :param key: the key (name) of the cookie to be set, or a
+            :class:`~werkzeug.http.CookieTemplate`. With a template, its
+            attributes are used and only ``value``, ``max_age``, and
+            ``expires`` may be given.
         :param value: the value of the cookie.
         :param max_age: should be a number of seconds, or `None` (default) if
                         the cookie should last only as long as the client's
@@ -219,10 +223,40 @@ class Response:
         :param samesite: Limit the scope of the cookie to only be
             attached to requests that are "same-site".
         :param partitioned: If ``True``, the cookie will be partitioned.
+        :raise TypeError: If ``key`` is a template and other cookie
+            attributes are given as well.
+
+        .. versionchanged:: 3.2
+            ``key`` may be a ``CookieTemplate``.
 
         .. versionchanged:: 3.1
             The ``partitioned`` parameter was added.
         """
+        if isinstance(key, CookieTemplate):
+            if (
+                path != "/"
+                or domain is not None
+                or secure
+                or httponly
+                or samesite is not None
+                or partitioned
+            ):
+                raise TypeError(
+                    "Cookie attributes cannot be given with a CookieTemplate,"
+                    " they are set by the template."
+                )
+
+            self.headers.add(
+                "Set-Cookie",
+                key.dump(
+                    value,
+                    max_age=max_age,
+                    expires=expires,
+                    max_size=self.max_cookie_size,
+                ),
+            )
+            return
+
         self.headers.add(
             "Set-Cookie",
             dump_cookie(
@@ -242,7 +276,7 @@ class Response:
 
     def delete_cookie(
         self,
-        key: str,
+        key: str | CookieTemplate,
         path: str | None = "/",
         domain: str | None = None,
         secure: bool = False,
@@ -252,7 +286,9 @@ class Response:
     ) -> None:
         """Delete a cookie.  Fails silently if key doesn't exist.
 
-        :param key: the key (name) of the cookie to be deleted.
+        :param key: the key (name) of the cookie to be deleted, or a
+            :class:`~werkzeug.http.CookieTemplate`, in which case its
+            attributes are used.
         :param path: if the cookie that should be deleted was limited to a
                      path, the path has to be defined here.
         :param domain: if the cookie that should be deleted was limited to a
@@ -263,6 +299,9 @@ class Response:
         :param samesite: Limit the scope of the cookie to only be
             attached to requests that are "same-site".
         :param partitioned: If ``True``, the cookie will be partitioned.
+
+        .. versionchanged:: 3.2
+            ``key`` may be a ``CookieTemplate``.
         """
         self.set_cookie(
             key,
@@ -334,7 +334,15 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
                 if not headers_sent:
                     write(b"")
                 if chunk_response:
-                    self.wfile.write(b"0\r\n\r\n")
+                    # An iterable may have trailer fields to send after the
+                    # body, such as a checksum calculated while sending it.
+                    trailers = getattr(application_iter, "trailers", None) or ()
+                    self.wfile.write(b"0\r\n")
+
+                    for key, value in trailers:
+                        self.wfile.write(f"{key}: {value}\r\n".encode("latin-1"))
+
+                    self.wfile.write(b"\r\n")
             finally:
                 # Check for any remaining data in the read socket, and discard it. This
                 # will read past request.max_content_length, but lets the client see a
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import re
+import threading
+import typing as t
+from collections import deque
+from time import monotonic
+
+if t.TYPE_CHECKING:
+    from .wrappers.response import Response
+
+_line_break_re = re.compile(r"\r\n|\r|\n")
+
+
+def format_event(
+    data: str | None = None,
+    event: str | None = None,
+    id: str | None = None,
+    retry: int | None = None,
+    comment: str | None = None,
+) -> bytes:
+    """Format a server-sent event in the ``text/event-stream`` format. Each
+    line of ``data`` is sent as a separate ``data`` field, which the client
+    joins again with newlines.
+
+    :param data: The event data. May contain newlines.
+    :param event: The event type. The client dispatches the event to
+        listeners for this type, or ``message`` by default.
+    :param id: The event ID. The client sends the last ID it saw in the
+        ``Last-Event-ID`` header when it reconnects.
+    :param retry: The time in milliseconds the client waits before it
+        reconnects.
+    :param comment: A comment, which the client ignores.
+    :raise ValueError: If ``event`` or ``id`` contain a newline, or ``id``
+        contains a null character.
+
+    .. versionadded:: 3.2
+    """
+    lines: list[str] = []
+
+    if comment is not None:
+        lines.extend(f": {line}" for line in _line_break_re.split(comment))
+
+    if event is not None:
+        if _line_break_re.search(event):
+            raise ValueError("The event type must not contain a newline.")
+
+        lines.append(f"event: {event}")
+
+    if id is not None:
+        if _line_break_re.search(id) or "\0" in id:
+            raise ValueError("The event ID must not contain a newline or null.")
+
+        lines.append(f"id: {id}")
+
+    if retry is not None:
+        lines.append(f"retry: {int(retry)}")
+
+    if data is not None:
+        lines.extend(f"data: {line}" for line in _line_break_re.split(data))
+
+    lines.append("\n")
+    return "\n".join(lines).encode()
+
+
+class EventStream:
+    """Send server-sent events to a client. Events are sent with
+    :meth:`send`, from any thread, such as from a publish/subscribe
+    listener, and the :attr:`response` sends them to the client.
+
+    .. code-block:: python
+
+        @Request.application
+        def app(request):
+            stream = EventStream()
+            unsubscribe = subscribe(lambda message: stream.send(message))
+            stream.call_on_close(unsubscribe)
+            return stream.response
+
+    Events that are ready when the server asks for more data are joined into
+    one chunk, so sending many small events doesn't write and flush each
+    one separately. If no event has been sent for ``heartbeat_interval``
+    seconds, a comment is sent to keep the connection open through proxies.
+    Writing the heartbeat also detects a client that has disconnected. The
+    thread serving the response waits for events or the next heartbeat,
+    rather than polling.
+
+    When the client disconnects, the server closes the response iterable,
+    which closes the stream and calls the functions registered with
+    :meth:`call_on_close`. After that, :meth:`send` returns ``False``. If the
+    client doesn't read events as fast as they are sent, and more than
+    ``max_buffer_size`` bytes are waiting, the stream is closed so that it
+    doesn't use unlimited memory. The client will reconnect, sending the
+    ``Last-Event-ID`` header, and can catch up from there.
+
+    :param heartbeat_interval: The number of seconds without events after
+        which a heartbeat comment is sent. Pass ``None`` to disable.
+    :param max_buffer_size: The number of bytes of events that can be
+        waiting to be sent before the stream is closed.
+
+    .. versionadded:: 3.2
+    """
+
+    #: The response class used by :attr:`response`.
+    response_class: type[Response] | None = None
+
+    def __init__(
+        self,
+        heartbeat_interval: float | None = 15,
+        max_buffer_size: int = 1024 * 1024,
+    ) -> None:
+        self.heartbeat_interval = heartbeat_interval
+        self.max_buffer_size = max_buffer_size
+        self._chunks: deque[bytes] = deque()
+        self._buffer_size = 0
+        self._closed = False
+        self._on_close: list[t.Callable[[], t.Any]] = []
+        self._cond = threading.Condition()
+
+    @property
+    def closed(self) -> bool:
+        """The stream was closed by :meth:`close`, or because the client
+        disconnected.
+        """
+        return self._closed
+
+    def send(
+        self,
+        data: str | None = None,
+        event: str | None = None,
+        id: str | None = None,
+        retry: int | None = None,
+    ) -> bool:
+        """Send an event. The arguments are passed to :func:`format_event`.
+        Returns ``False`` without sending if the stream is closed.
+        """
+        return self._push(format_event(data, event=event, id=id, retry=retry))
+
+    def send_comment(self, comment: str) -> bool:
+        """Send a comment, which the client ignores. Returns ``False``
+        without sending if the stream is closed.
+        """
+        return self._push(format_event(comment=comment))
+
+    def _push(self, value: bytes) -> bool:
+        with self._cond:
+            if self._closed:
+                return False
+
+            self._chunks.append(value)
+            self._buffer_size += len(value)
+            dropped = self._buffer_size > self.max_buffer_size
+
+            if dropped:
+                # The client is too slow, the waiting events are dropped.
+                self._chunks.clear()
+                self._buffer_size = 0
+                self._closed = True
+
+            self._cond.notify_all()
+
+        if dropped:
+            self._call_on_close()
+
+        return not dropped
+
+    def call_on_close(self, func: t.Callable[[], t.Any]) -> t.Callable[[], t.Any]:
+        """Register a function to call when the stream is closed, such as to
+        stop listening for events. If the stream is already closed, it is
+        called immediately. Can be used as a decorator.
+        """
+        with self._cond:
+            if not self._closed:
+                self._on_close.append(func)
+                return func
+
+        func()
+        return func
+
+    def close(self) -> None:
+        """Close the stream. Events that are waiting are still sent, then
+        the response ends.
+        """
+        with self._cond:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._cond.notify_all()
+
+        self._call_on_close()
+
+    def _call_on_close(self) -> None:
+        with self._cond:
+            funcs = self._on_close
+            self._on_close = []
+
+        for func in funcs:
+            func()
+
+    def _disconnect(self) -> None:
+        with self._cond:
+            self._chunks.clear()
+            self._buffer_size = 0
+
+        self.close()
+
+    def _read(self) -> bytes | None:
+        """Wait for events, and return all waiting events joined together, a
+        heartbeat if none arrive in time, or ``None`` at the end.
+        """
+        with self._cond:
+            if not self._chunks and not self._closed:
+                if self.heartbeat_interval is None:
+                    while not self._chunks and not self._closed:
+                        self._cond.wait()
+                else:
+                    deadline = monotonic() + self.heartbeat_interval
+
+                    while not self._chunks and not self._closed:
+                        remaining = deadline - monotonic()
+
+                        if remaining <= 0:
+                            return b":\n\n"
+
+                        self._cond.wait(remaining)
+
+            if not self._chunks:
+                return None
+
+            value = b"".join(self._chunks)
+            self._chunks.clear()
+            self._buffer_size = 0
+            return value
+
+    @property
+    def response(self) -> Response:
+        """A new response that sends the events in this stream. Return this
+        from the view. It has the ``text/event-stream`` content type and
+        ``Cache-Control: no-cache``.
+        """
+        response_class = self.response_class
+
+        if response_class is None:
+            from .wrappers.response import Response
+
+            response_class = Response
+
+        rv = response_class(
+            _EventStreamIterator(self),
+            mimetype="text/event-stream",
+            direct_passthrough=True,
+        )
+        rv.cache_control.no_cache = True
+        return rv
+
+
+class _EventStreamIterator:
+    """The response iterable for an :class:`EventStream`. The server closing
+    it, such as when the client disconnects, closes the stream.
+    """
+
+    def __init__(self, stream: EventStream) -> None:
+        self._stream = stream
+
+    def __iter__(self) -> _EventStreamIterator:
+        return self
+
+    def __next__(self) -> bytes:
+        value = self._stream._read()
+
+        if value is None:
+            raise StopIteration
+
+        return value
+
+    def close(self) -> None:
+        self._stream._disconnect()
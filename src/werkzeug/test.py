@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import dataclasses
+import io
 import json
 import mimetypes
+import os
 import sys
 import typing as t
+from bisect import bisect_right
 from collections import defaultdict
 from datetime import datetime
 from io import BytesIO
@@ -63,6 +66,9 @@ def stream_encode_multipart(
     :class:`FileStorage` objects.) into a multipart encoded string stored
     in a file descriptor.
 
+    Use :class:`MultipartStream` instead to read file data as the body is
+    read, without copying it.
+
     .. versionchanged:: 3.0
         The ``charset`` parameter was removed.
     """
@@ -158,6 +164,175 @@ def encode_multipart(
     return boundary, stream.read()
 
 
+class MultipartStream(io.RawIOBase):
+    """A binary stream that encodes a dict of values as multipart form data
+    while it is read, rather than encoding everything up front like
+    :func:`stream_encode_multipart`.
+
+    Only the part headers and boundaries are encoded ahead of time. File
+    data is read directly from the file objects when the stream is read, so
+    large files are not copied into memory or a temporary file. The total
+    :attr:`content_length` is known up front from the size of each file.
+    Files that are not seekable, so their size can't be determined, are read
+    into memory.
+
+    Pass it as the ``input_stream`` of an :class:`EnvironBuilder`, which sets
+    the content type and length from it. The file objects must remain open
+    until the stream has been read, they are not closed by :meth:`close`.
+
+    .. code-block:: python
+
+        with open("large.bin", "rb") as f:
+            stream = MultipartStream({"name": "value", "file": f})
+            response = client.post(input_stream=stream)
+
+    :param data: A dict of values to encode. Values can be strings or file
+        objects, including :class:`.FileStorage`. Lists of values are
+        encoded as multiple parts with the same name.
+    :param boundary: The boundary to use. Generated if not given.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(self, data: t.Mapping[str, t.Any], boundary: str | None = None):
+        if boundary is None:
+            boundary = f"---------------WerkzeugFormPart_{time()}{random()}"
+
+        #: The boundary separating the parts.
+        self.boundary = boundary
+        # Each segment is either encoded bytes, or a file object with the
+        # position and length of its data.
+        self._segments: list[bytes | tuple[t.IO[bytes], int, int]] = []
+        self._offsets: list[int] = []
+        #: The total length of the encoded data.
+        self.content_length = 0
+        self._position = 0
+        encoder = MultipartEncoder(boundary.encode())
+        self._add(encoder.send_event(Preamble(data=b"")))
+
+        for key, value in _iter_data(data):
+            if getattr(value, "read", None) is not None:
+                filename = getattr(value, "filename", getattr(value, "name", None))
+                content_type = getattr(value, "content_type", None)
+
+                if content_type is None:
+                    content_type = (
+                        filename
+                        and mimetypes.guess_type(filename)[0]
+                        or "application/octet-stream"
+                    )
+
+                headers = getattr(value, "headers", None)
+
+                if headers is None:
+                    headers = Headers()
+
+                headers.update([("Content-Type", content_type)])
+
+                if filename is None:
+                    self._add(encoder.send_event(Field(name=key, headers=headers)))
+                else:
+                    self._add(
+                        encoder.send_event(
+                            File(name=key, filename=filename, headers=headers)
+                        )
+                    )
+
+                self._add_file(encoder, value)
+            else:
+                if not isinstance(value, str):
+                    value = str(value)
+
+                self._add(encoder.send_event(Field(name=key, headers=Headers())))
+                self._add(
+                    encoder.send_event(Data(data=value.encode(), more_data=False))
+                )
+
+        self._add(encoder.send_event(Epilogue(data=b"")))
+
+    def _add(self, segment: bytes | tuple[t.IO[bytes], int, int]) -> None:
+        length = len(segment) if isinstance(segment, bytes) else segment[2]
+
+        if length:
+            self._segments.append(segment)
+            self._offsets.append(self.content_length)
+            self.content_length += length
+
+    def _add_file(self, encoder: MultipartEncoder, value: t.IO[bytes]) -> None:
+        try:
+            start = value.tell()
+            value.seek(0, os.SEEK_END)
+            length = value.tell() - start
+        except (AttributeError, OSError, ValueError):
+            # Not seekable, the size can only be known by reading it.
+            self._add(encoder.send_event(Data(data=value.read(), more_data=False)))
+            return
+
+        # Encoding empty data only advances the encoder's state, the line
+        # break that starts non-empty data is added here instead.
+        encoder.send_event(Data(data=b"", more_data=False))
+
+        if length:
+            self._add(b"\r\n")
+            self._add((value, start, length))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self.content_length
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}.")
+
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer: t.Any) -> int:
+        view = memoryview(buffer).cast("B")
+
+        if self._position >= self.content_length or not len(view):
+            return 0
+
+        index = bisect_right(self._offsets, self._position) - 1
+        segment = self._segments[index]
+        offset = self._position - self._offsets[index]
+
+        if isinstance(segment, bytes):
+            size = min(len(view), len(segment) - offset)
+            view[:size] = segment[offset : offset + size]
+        else:
+            file, start, length = segment
+            size = min(len(view), length - offset)
+            file.seek(start + offset)
+            readinto = getattr(file, "readinto", None)
+
+            if readinto is not None:
+                size = readinto(view[:size])
+            else:
+                chunk = file.read(size)
+                size = len(chunk)
+                view[:size] = chunk
+
+            if not size:
+                raise EOFError(
+                    "A file in the multipart data is shorter than its"
+                    " size when the stream was created."
+                )
+
+        self._position += size
+        return size
+
+
 def _iter_data(data: t.Mapping[str, t.Any]) -> t.Iterator[tuple[str, t.Any]]:
     """Iterate over a mapping that might have a list of values, yielding
     all key, value pairs. Almost like iter_multi_items but only allows
@@ -224,7 +399,8 @@ class EnvironBuilder:
     :param input_stream: An IO object to pass through as the body of the
         request, without reading, which simulates a streaming request. The
         stream is not closed when calling :meth:`.close`, as it must remain open
-        to be read in the application.
+        to be read in the application. If it is a :class:`MultipartStream`, the
+        content type is set automatically.
 
     .. versionchanged:: 3.2
         Can be used as a ``with`` context manager to automatically close
@@ -681,6 +857,11 @@ class EnvironBuilder:
         content_type = self.content_type
 
         if input_stream is not None:
+            if content_type is None and isinstance(input_stream, MultipartStream):
+                content_type = (
+                    f'multipart/form-data; boundary="{input_stream.boundary}"'
+                )
+
             start_pos = input_stream.tell()
             input_stream.seek(0, 2)
             end_pos = input_stream.tell()
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import collections.abc as cabc
+import errno
 import io
 import mimetypes
 import os
 import pkgutil
 import re
 import sys
+import threading
 import typing as t
 import unicodedata
+from dataclasses import dataclass
 from datetime import datetime
+from stat import S_ISREG
+from time import monotonic
 from time import time
 from urllib.parse import quote
 from zlib import adler32
@@ -18,9 +24,11 @@ from markupsafe import escape
 from ._internal import _DictAccessorProperty
 from ._internal import _missing
 from ._internal import _TAccessorValue
+from .datastructures import Accept
 from .datastructures import Headers
 from .exceptions import NotFound
 from .exceptions import RequestedRangeNotSatisfiable
+from .http import http_date
 from .security import _windows_device_files
 from .security import safe_join
 from .wsgi import wrap_file
@@ -36,6 +44,9 @@ _T = t.TypeVar("_T")
 _entity_re = re.compile(r"&([^;]+);")
 _filename_ascii_strip_re = re.compile(r"[^A-Za-z0-9_.-]")
 
+# Extensions of precompressed files next to the original file.
+_precompressed_extensions = {"br": ".br", "zstd": ".zst", "gzip": ".gz"}
+
 
 class cached_property(property, t.Generic[_T]):
     """A :func:`property` that is only evaluated once. Subsequent access
@@ -326,6 +337,239 @@ def append_slash_redirect(environ: WSGIEnvironment, code: int = 308) -> Response
     return redirect(new_path, code)
 
 
+def _find_precompressed(
+    path: str, extensions: cabc.Mapping[str, str], mtime: float | None = None
+) -> dict[str, tuple[str, int]]:
+    """Find precompressed files next to a file, such as ``style.css.gz``
+    next to ``style.css``. Files that are older than the original are
+    ignored, since they may be outdated.
+
+    :param path: The path to the original file.
+    :param extensions: A map of encoding names to file extensions.
+    :param mtime: The modification time of the original file, if it is
+        already known.
+    :return: A map of encoding names to the path and size of each file.
+    """
+    if mtime is None:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return {}
+
+    found = {}
+
+    for encoding, ext in extensions.items():
+        try:
+            stat = os.stat(path + ext)
+        except OSError:
+            continue
+
+        if stat.st_mtime >= mtime:
+            found[encoding] = (path + ext, stat.st_size)
+
+    return found
+
+
+def _get_file_headers(
+    download_name: str | None, mimetype: str | None, as_attachment: bool
+) -> tuple[str, list[tuple[str, str]]]:
+    """Get the mimetype and the ``Content-Encoding`` and
+    ``Content-Disposition`` headers for :func:`send_file`.
+    """
+    headers = Headers()
+
+    if mimetype is None:
+        if download_name is None:
+            raise TypeError(
+                "Unable to detect the MIME type because a file name is"
+                " not available. Either set 'download_name', pass a"
+                " path instead of a file, or set 'mimetype'."
+            )
+
+        mimetype, encoding = mimetypes.guess_type(download_name)
+
+        if mimetype is None:
+            mimetype = "application/octet-stream"
+
+        # Don't send encoding for attachments, it causes browsers to
+        # save decompress tar.gz files.
+        if encoding is not None and not as_attachment:
+            headers.set("Content-Encoding", encoding)
+
+    if download_name is not None:
+        try:
+            download_name.encode("ascii")
+        except UnicodeEncodeError:
+            simple = unicodedata.normalize("NFKD", download_name)
+            simple = simple.encode("ascii", "ignore").decode("ascii")
+            # safe = RFC 5987 attr-char
+            quoted = quote(download_name, safe="!#$&+-.^_`|~")
+            names = {"filename": simple, "filename*": f"UTF-8''{quoted}"}
+        else:
+            names = {"filename": download_name}
+
+        value = "attachment" if as_attachment else "inline"
+        headers.set("Content-Disposition", value, **names)
+    elif as_attachment:
+        raise TypeError(
+            "No name provided for attachment. Either set"
+            " 'download_name' or pass a path instead of a file."
+        )
+
+    return mimetype, headers.to_wsgi_list()
+
+
+@dataclass
+class _FileMetadata:
+    """Information about a file sent with :func:`send_file`, and the header
+    values based on it.
+    """
+
+    #: The modification time in nanoseconds and size, to detect changes.
+    stat_key: tuple[int, int]
+    #: When the file was last checked, from :func:`time.monotonic`.
+    checked: float
+    size: int
+    mimetype: str
+    #: The ``Content-Encoding`` and ``Content-Disposition`` headers.
+    headers: list[tuple[str, str]]
+    etag: str
+    last_modified: str
+    #: Precompressed files, a map of encoding names to paths and sizes.
+    variants: dict[str, tuple[str, int]]
+
+
+def _load_file_metadata(
+    path: str,
+    stat: os.stat_result,
+    download_name: str | None,
+    mimetype: str | None,
+    as_attachment: bool,
+    precompressed: cabc.Mapping[str, str] | None,
+) -> _FileMetadata:
+    if download_name is None:
+        download_name = os.path.basename(path)
+
+    mimetype, headers = _get_file_headers(download_name, mimetype, as_attachment)
+    variants = {}
+
+    if precompressed:
+        variants = _find_precompressed(path, precompressed, stat.st_mtime)
+
+    check = adler32(path.encode()) & 0xFFFFFFFF
+    return _FileMetadata(
+        stat_key=(stat.st_mtime_ns, stat.st_size),
+        checked=monotonic(),
+        size=stat.st_size,
+        mimetype=mimetype,
+        headers=headers,
+        etag=f"{stat.st_mtime}-{stat.st_size}-{check}",
+        last_modified=http_date(stat.st_mtime),
+        variants=variants,
+    )
+
+
+class FileMetadataCache:
+    """Cache information about files sent with :func:`send_file`, to avoid
+    looking up and building the same headers for each request. Pass it as
+    ``metadata_cache`` to :func:`send_file` or :func:`send_from_directory`.
+
+    .. code-block:: python
+
+        static_cache = FileMetadataCache()
+
+        def static(request, name):
+            return send_from_directory(
+                "static", name, request.environ, metadata_cache=static_cache
+            )
+
+    The file's size and modification time, the ``Content-Type``,
+    ``Content-Disposition``, ``ETag``, and ``Last-Modified`` values, and any
+    precompressed files are stored. A file is checked with
+    :func:`os.stat` again if it was last checked more than
+    ``revalidate_interval`` seconds ago, and the information is updated if
+    the file changed. Within the interval, the file that is opened to be
+    sent is still compared to the stored size and modification time, so the
+    headers always match the data. Only new precompressed files, and changes
+    when using ``use_x_sendfile``, are not seen until the next check.
+    :meth:`clear` can be called to see them immediately.
+
+    :param revalidate_interval: How often to check each file for changes,
+        in seconds. Use ``0`` to check on each request, which still avoids
+        building the headers again.
+    :param max_entries: The maximum number of files to store. The oldest
+        entries are removed first.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self, revalidate_interval: float = 2.0, max_entries: int = 4096
+    ) -> None:
+        self.revalidate_interval = revalidate_interval
+        self.max_entries = max_entries
+        self._entries: dict[tuple[t.Any, ...], _FileMetadata] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all stored information, so each file is checked again."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get(
+        self,
+        path: str,
+        download_name: str | None,
+        mimetype: str | None,
+        as_attachment: bool,
+        precompressed: cabc.Mapping[str, str] | None,
+        stat: os.stat_result | None = None,
+    ) -> _FileMetadata:
+        """Get the information for a file, checking it again if the interval
+        has passed. If ``stat`` is given, such as from the opened file, it is
+        compared instead, regardless of the interval.
+        """
+        key = (
+            path,
+            download_name,
+            mimetype,
+            as_attachment,
+            tuple(precompressed.items()) if precompressed else None,
+        )
+        meta = self._entries.get(key)
+        now = monotonic()
+
+        if stat is None:
+            if meta is not None and now - meta.checked < self.revalidate_interval:
+                return meta
+
+            stat = os.stat(path)
+
+        if not S_ISREG(stat.st_mode):
+            raise FileNotFoundError(errno.ENOENT, "Not a file", path)
+
+        if meta is not None and meta.stat_key == (stat.st_mtime_ns, stat.st_size):
+            meta.checked = now
+            return meta
+
+        meta = _load_file_metadata(
+            path, stat, download_name, mimetype, as_attachment, precompressed
+        )
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+            while self._entries and len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+            self._entries[key] = meta
+
+        return meta
+
+
 def send_file(
     path_or_file: os.PathLike[str] | str | t.IO[bytes],
     environ: WSGIEnvironment,
@@ -338,6 +582,8 @@ def send_file(
     max_age: None | (int | t.Callable[[str | None], int | None]) = None,
     use_x_sendfile: bool = False,
     response_class: type[Response] | None = None,
+    precompressed: bool | cabc.Mapping[str, str] = False,
+    metadata_cache: FileMetadataCache | None = None,
     _root_path: os.PathLike[str] | str | None = None,
 ) -> Response:
     """Send the contents of a file to the client.
@@ -384,9 +630,22 @@ def send_file(
         HTTP server. Requires passing a file path.
     :param response_class: Build the response using this class. Defaults
         to :class:`~werkzeug.wrappers.Response`.
+    :param precompressed: Send a precompressed file next to the given
+        path instead, such as ``style.css.gz`` next to ``style.css``, if
+        the client accepts its encoding. ``True`` looks for ``.br``,
+        ``.zst``, and ``.gz`` files. Can also be a map of encoding names to
+        file extensions. A precompressed file is only used if it is not
+        older than the original. Requires passing a file path.
+    :param metadata_cache: A :class:`FileMetadataCache` to store the
+        information and headers for the file, instead of checking the file
+        and building them again for each request. Requires passing a file
+        path.
     :param _root_path: Do not use. For internal use only. Use
         :func:`send_from_directory` to safely send files under a path.
 
+    .. versionchanged:: 3.2
+        Added the ``precompressed`` and ``metadata_cache`` parameters.
+
     .. versionchanged:: 2.0.2
         ``send_file`` only sets a detected ``Content-Encoding`` if
         ``as_attachment`` is disabled.
@@ -420,8 +679,15 @@ def send_file(
     path: str | None = None
     file: t.IO[bytes] | None = None
     size: int | None = None
-    mtime: float | None = None
+    meta: _FileMetadata | None = None
     headers = Headers()
+    extensions: cabc.Mapping[str, str] | None = None
+
+    if precompressed and not use_x_sendfile:
+        if precompressed is True:
+            extensions = _precompressed_extensions
+        else:
+            extensions = precompressed
 
     if isinstance(path_or_file, (os.PathLike, str)) or hasattr(
         path_or_file, "__fspath__"
@@ -435,59 +701,83 @@ def send_file(
         else:
             path = os.path.abspath(path_or_file)
 
-        stat = os.stat(path)
-        size = stat.st_size
-        mtime = stat.st_mtime
-    else:
-        file = path_or_file
-
-    if download_name is None and path is not None:
-        download_name = os.path.basename(path)
+        if metadata_cache is not None:
+            meta = metadata_cache._get(
+                path, download_name, mimetype, as_attachment, extensions
+            )
 
-    if mimetype is None:
-        if download_name is None:
-            raise TypeError(
-                "Unable to detect the MIME type because a file name is"
-                " not available. Either set 'download_name', pass a"
-                " path instead of a file, or set 'mimetype'."
+            if not use_x_sendfile:
+                # The file may have changed since it was last checked. Check
+                # the opened file so the headers match the data that is sent.
+                file = open(path, "rb")
+
+                try:
+                    stat = os.fstat(file.fileno())
+
+                    if meta.stat_key != (stat.st_mtime_ns, stat.st_size):
+                        meta = metadata_cache._get(
+                            path,
+                            download_name,
+                            mimetype,
+                            as_attachment,
+                            extensions,
+                            stat,
+                        )
+                except BaseException:
+                    file.close()
+                    raise
+        else:
+            meta = _load_file_metadata(
+                path, os.stat(path), download_name, mimetype, as_attachment, extensions
             )
 
-        mimetype, encoding = mimetypes.guess_type(download_name)
+        size = meta.size
+        mimetype = meta.mimetype
+        headers.extend(meta.headers)
+    else:
+        file = path_or_file
+        mimetype, file_headers = _get_file_headers(
+            download_name, mimetype, as_attachment
+        )
+        headers.extend(file_headers)
 
-        if mimetype is None:
-            mimetype = "application/octet-stream"
+    # The path to send, which may be a precompressed file next to the path.
+    send_path = path
+    content_encoding: str | None = None
 
-        # Don't send encoding for attachments, it causes browsers to
-        # save decompress tar.gz files.
-        if encoding is not None and not as_attachment:
-            headers.set("Content-Encoding", encoding)
+    if meta is not None and meta.variants:
+        headers.add("Vary", "Accept-Encoding")
+        accept = Accept.from_header(environ.get("HTTP_ACCEPT_ENCODING"))
+        content_encoding = accept.best_match(meta.variants)
 
-    if download_name is not None:
-        try:
-            download_name.encode("ascii")
-        except UnicodeEncodeError:
-            simple = unicodedata.normalize("NFKD", download_name)
-            simple = simple.encode("ascii", "ignore").decode("ascii")
-            # safe = RFC 5987 attr-char
-            quoted = quote(download_name, safe="!#$&+-.^_`|~")
-            names = {"filename": simple, "filename*": f"UTF-8''{quoted}"}
-        else:
-            names = {"filename": download_name}
+        if content_encoding is not None:
+            variant_path, variant_size = meta.variants[content_encoding]
 
-        value = "attachment" if as_attachment else "inline"
-        headers.set("Content-Disposition", value, **names)
-    elif as_attachment:
-        raise TypeError(
-            "No name provided for attachment. Either set"
-            " 'download_name' or pass a path instead of a file."
-        )
+            if file is not None:
+                # The original file is already open, only switch to the
+                # precompressed file if its size is unchanged.
+                try:
+                    variant_file = open(variant_path, "rb")
+                except OSError:
+                    content_encoding = None
+                else:
+                    if os.fstat(variant_file.fileno()).st_size == variant_size:
+                        file.close()
+                        file = variant_file
+                    else:
+                        variant_file.close()
+                        content_encoding = None
+
+        if content_encoding is not None:
+            send_path, size = variant_path, variant_size
+            headers.set("Content-Encoding", content_encoding)
 
     if use_x_sendfile and path is not None:
         headers["X-Sendfile"] = path
         data = None
     else:
         if file is None:
-            file = open(path, "rb")  # type: ignore
+            file = open(send_path, "rb")  # type: ignore
         elif isinstance(file, io.BytesIO):
             size = file.getbuffer().nbytes
         elif isinstance(file, io.TextIOBase):
@@ -504,8 +794,8 @@ def send_file(
 
     if last_modified is not None:
         rv.last_modified = last_modified  # type: ignore
-    elif mtime is not None:
-        rv.last_modified = mtime  # type: ignore
+    elif meta is not None:
+        rv.headers["Last-Modified"] = meta.last_modified
 
     rv.cache_control.no_cache = True
 
@@ -524,9 +814,13 @@ def send_file(
 
     if isinstance(etag, str):
         rv.set_etag(etag)
-    elif etag and path is not None:
-        check = adler32(path.encode()) & 0xFFFFFFFF
-        rv.set_etag(f"{mtime}-{size}-{check}")
+    elif etag and meta is not None:
+        rv.set_etag(meta.etag)
+
+    if content_encoding is not None and rv.headers.get("ETag"):
+        # Each encoding is a different representation with its own ETag.
+        tag, weak = rv.get_etag()
+        rv.set_etag(f"{tag}-{content_encoding}", bool(weak))
 
     if conditional:
         try:
@@ -581,10 +875,19 @@ def send_from_directory(
     if "_root_path" in kwargs:
         path_str = os.path.join(kwargs["_root_path"], path_str)
 
-    if not os.path.isfile(path_str):
-        raise NotFound()
+    if kwargs.get("metadata_cache") is None:
+        if not os.path.isfile(path_str):
+            raise NotFound()
 
-    return send_file(path_str, environ, **kwargs)
+        return send_file(path_str, environ, **kwargs)
+
+    # The cache checks that the path is a file when it looks it up, which
+    # may be skipped if it was checked recently. Opening the path then fails
+    # if it was removed or became a directory.
+    try:
+        return send_file(path_str, environ, **kwargs)
+    except OSError:
+        raise NotFound() from None
 
 
 def import_string(import_name: str, silent: bool = False) -> t.Any:
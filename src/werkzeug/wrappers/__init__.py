@@ -1,3 +1,4 @@
 from .request import Request as Request
 from .response import Response as Response
+from .response import ResponsePipe as ResponsePipe
 from .response import ResponseStream as ResponseStream
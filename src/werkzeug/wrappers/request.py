@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import codecs
 import collections.abc as cabc
 import functools
 import json
+import re
 import typing as t
 from io import BytesIO
 
@@ -14,9 +16,11 @@ from ..datastructures import ImmutableMultiDict
 from ..datastructures import iter_multi_items
 from ..datastructures import MultiDict
 from ..exceptions import BadRequest
+from ..exceptions import RequestEntityTooLarge
 from ..exceptions import UnsupportedMediaType
 from ..formparser import default_stream_factory
 from ..formparser import FormDataParser
+from ..formparser import MemoryBudget
 from ..sansio.request import Request as _SansIORequest
 from ..utils import cached_property
 from ..utils import environ_property
@@ -98,6 +102,16 @@ class Request(_SansIORequest):
     #: .. versionadded:: 2.2.3
     max_form_parts = 1000
 
+    #: A :class:`.MemoryBudget` that limits the total size of request body
+    #: data held in memory by all requests at once. Set this on the class to
+    #: share one budget across the process. Data cached by :meth:`get_data`,
+    #: parsed form fields, and uploaded files in memory are counted.
+    #: Uploaded files are moved to disk if they don't fit. The data is
+    #: released when the request is closed.
+    #:
+    #: .. versionadded:: 3.2
+    memory_budget: MemoryBudget | None = None
+
     #: The form data parser that should be used.  Can be replaced to customize
     #: the form date parsing.
     form_data_parser_class: type[FormDataParser] = FormDataParser
@@ -129,6 +143,8 @@ class Request(_SansIORequest):
         )
         self.environ = environ
         self.shallow = shallow
+        # Bytes reserved from memory_budget, released by close.
+        self._reserved_memory = 0
 
         if populate_request and not shallow:
             self.environ["werkzeug.request"] = self
@@ -220,7 +236,19 @@ class Request(_SansIORequest):
         :param content_length: the length of this file.  This value is usually
                                not provided because webbrowsers do not provide
                                this value.
+
+        .. versionchanged:: 3.2
+            If :attr:`memory_budget` is set, the file is moved to disk early if
+            it doesn't fit in the budget.
         """
+        if self.memory_budget is not None:
+            return self.memory_budget.stream_factory(
+                total_content_length=total_content_length,
+                filename=filename,
+                content_type=content_type,
+                content_length=content_length,
+            )
+
         return default_stream_factory(
             total_content_length=total_content_length,
             filename=filename,
@@ -248,6 +276,7 @@ class Request(_SansIORequest):
             max_form_memory_size=self.max_form_memory_size,
             max_content_length=self.max_content_length,
             max_form_parts=self.max_form_parts,
+            memory_budget=self.memory_budget,
         )
 
         if self.parameter_storage_class is not None:
@@ -284,6 +313,9 @@ class Request(_SansIORequest):
                 self.content_length,
                 self.mimetype_params,
             )
+            # Parsed fields stay reserved in the budget until the request is
+            # closed.
+            self._reserved_memory += parser.reserved_memory
         else:
             if self.parameter_storage_class is not None:
                 import warnings
@@ -329,6 +361,10 @@ class Request(_SansIORequest):
         for _key, value in iter_multi_items(files or ()):
             value.close()
 
+        if self._reserved_memory and self.memory_budget is not None:
+            self.memory_budget.release(self._reserved_memory)
+            self._reserved_memory = 0
+
     def __enter__(self) -> Request:
         return self
 
@@ -433,13 +469,23 @@ class Request(_SansIORequest):
         If `as_text` is set to `True` the return value will be a decoded
         string.
 
+        If :attr:`memory_budget` is set, cached data is counted against it
+        until the request is closed.
+
+        .. versionchanged:: 3.2
+            Cached data is counted against :attr:`memory_budget`.
+
         .. versionadded:: 0.9
         """
         rv = getattr(self, "_cached_data", None)
         if rv is None:
             if parse_form_data:
                 self._load_form_data()
-            rv = self.stream.read()
+            if cache and self.memory_budget is not None:
+                rv = self.memory_budget.read(self.stream, self.content_length)
+                self._reserved_memory += len(rv)
+            else:
+                rv = self.stream.read()
             if cache:
                 self._cached_data = rv
         if as_text:
@@ -634,6 +680,69 @@ class Request(_SansIORequest):
 
         return rv
 
+    def iter_json(
+        self,
+        force: bool = False,
+        lines: bool | None = None,
+        chunk_size: int = 64 * 1024,
+        max_item_size: int | None = None,
+    ) -> cabc.Iterator[t.Any]:
+        """Parse the request body as a sequence of JSON values, yielding each
+        value as it is read from :attr:`stream`. Unlike :meth:`get_json`, the
+        whole body is never held in memory at once, which is useful for bulk
+        data. :attr:`max_content_length` is still enforced by the stream.
+
+        The body can be a JSON array, in which case each item is yielded, or
+        newline delimited JSON, in which case each line is yielded. Newline
+        delimited JSON is detected from the :mimetype:`application/x-ndjson`
+        or :mimetype:`application/jsonl` mimetypes.
+
+        If the mimetype does not indicate JSON, or parsing fails,
+        :meth:`on_json_loading_failed` is called. Items that were already
+        yielded before an error are not affected.
+
+        Each item or line is decoded with :attr:`json_module` once it is
+        complete. The parsed items are not cached, so this can only be called
+        once, and :meth:`get_json` will not be able to read the data
+        afterwards.
+
+        :param force: Ignore the mimetype and always try to parse JSON.
+        :param lines: Parse newline delimited JSON instead of an array.
+            Detected from the mimetype by default.
+        :param chunk_size: The number of bytes to read from the stream at a
+            time.
+        :param max_item_size: The maximum number of characters in one item
+            or line. Defaults to :attr:`max_content_length`. Exceeding this
+            raises :exc:`~werkzeug.exceptions.RequestEntityTooLarge`, so that
+            malformed data doesn't grow the buffer without limit.
+
+        .. versionadded:: 3.2
+        """
+        if lines is None:
+            lines = self.mimetype in _json_lines_mimetypes
+
+        if not (force or lines or self.is_json):
+            self.on_json_loading_failed(None)
+            return
+
+        if max_item_size is None:
+            max_item_size = self.max_content_length
+
+        stream = self._get_stream_for_parsing()
+        chunks = _iter_text_chunks(stream, chunk_size)
+
+        try:
+            if lines:
+                yield from _iter_json_lines(
+                    chunks, self.json_module.loads, max_item_size
+                )
+            else:
+                yield from _iter_json_array(
+                    chunks, self.json_module.loads, max_item_size
+                )
+        except ValueError as e:
+            self.on_json_loading_failed(e)
+
     def on_json_loading_failed(self, e: ValueError | None) -> t.Any:
         """Called if :meth:`get_json` fails and isn't silenced.
 
@@ -654,3 +763,200 @@ class Request(_SansIORequest):
             "Did not attempt to load JSON data because the request"
             " Content-Type was not 'application/json'."
         )
+
+
+_json_lines_mimetypes = {"application/x-ndjson", "application/jsonl"}
+_json_ws_re = re.compile(r"[ \t\n\r]*")
+# Skip to the next character that can end an item at the top level of the
+# array, or inside a nested value, where complete strings are skipped too.
+# Then skip the rest of a string up to its closing quote.
+_json_top_re = re.compile(r'[^"\[\]{},]*')
+_json_nested_re = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.S)
+_json_string_body_re = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)
+
+
+def _iter_text_chunks(stream: t.IO[bytes], size: int) -> cabc.Iterator[str]:
+    """Read and decode a UTF-8 stream in chunks. A multibyte character split
+    between chunks is held back until the rest is read.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    while True:
+        data = stream.read(size)
+
+        if not data:
+            break
+
+        yield decoder.decode(data)
+
+    yield decoder.decode(b"", final=True)
+
+
+def _iter_json_lines(
+    chunks: cabc.Iterable[str],
+    loads: t.Callable[[str], t.Any],
+    max_item_size: int | None = None,
+) -> cabc.Iterator[t.Any]:
+    """Parse newline delimited JSON, yielding the value of each non-blank
+    line as soon as the line is complete.
+    """
+    pending: list[str] = []
+    pending_size = 0
+
+    for chunk in chunks:
+        lines = chunk.split("\n")
+
+        if len(lines) == 1:
+            pending.append(chunk)
+            pending_size += len(chunk)
+
+            if max_item_size is not None and pending_size > max_item_size:
+                raise RequestEntityTooLarge()
+
+            continue
+
+        pending.append(lines[0])
+        lines[0] = "".join(pending)
+        pending = [lines.pop()]
+        pending_size = len(pending[0])
+
+        for line in lines:
+            if max_item_size is not None and len(line) > max_item_size:
+                raise RequestEntityTooLarge()
+
+            if line.strip():
+                yield loads(line)
+
+    line = "".join(pending)
+
+    if line.strip():
+        yield loads(line)
+
+
+def _iter_json_array(
+    chunks: cabc.Iterable[str],
+    loads: t.Callable[[str], t.Any],
+    max_item_size: int | None = None,
+) -> cabc.Iterator[t.Any]:
+    """Parse a JSON array, yielding each item as soon as it is complete.
+    Each chunk is scanned once for the end of the current item, tracking
+    strings and nesting, and the item is only decoded once it is complete.
+    """
+    # Expecting "[", the first item or "]", an item, the rest of an item,
+    # "," or "]", or the end.
+    state = "start"
+    item: list[str] = []
+    item_size = 0
+    depth = 0
+    in_string = False
+    escape = False
+
+    for chunk in chunks:
+        position = 0
+        length = len(chunk)
+
+        while position < length:
+            if state == "value":
+                start = position
+                complete = False
+
+                while position < length:
+                    if escape:
+                        position += 1
+                        escape = False
+                    elif in_string:
+                        match = _json_string_body_re.match(chunk, position)
+                        position = t.cast(t.Match[str], match).end()
+
+                        if position == length:
+                            break
+
+                        position += 1
+
+                        if chunk[position - 1] == "\\":
+                            # An escape split from the escaped character.
+                            escape = True
+                        else:
+                            in_string = False
+
+                            if depth == 0:
+                                complete = True
+                                break
+                    else:
+                        token_re = _json_nested_re if depth else _json_top_re
+                        match = token_re.match(chunk, position)
+                        position = t.cast(t.Match[str], match).end()
+
+                        if position == length:
+                            break
+
+                        char = chunk[position]
+
+                        if char == '"':
+                            position += 1
+                            in_string = True
+                        elif char in "[{":
+                            position += 1
+                            depth += 1
+                        elif depth:
+                            position += 1
+                            depth -= 1
+
+                            if depth == 0:
+                                complete = True
+                                break
+                        else:
+                            # The end of a number or literal, the delimiter
+                            # is left for the separator state.
+                            complete = True
+                            break
+
+                item.append(chunk[start:position])
+                item_size += position - start
+
+                if max_item_size is not None and item_size > max_item_size:
+                    raise RequestEntityTooLarge()
+
+                if complete:
+                    yield loads("".join(item))
+                    item = []
+                    item_size = 0
+                    state = "separator"
+
+                continue
+
+            position = t.cast(t.Match[str], _json_ws_re.match(chunk, position)).end()
+
+            if position == length:
+                break
+
+            char = chunk[position]
+
+            if state == "start":
+                if char != "[":
+                    raise ValueError("Expecting a JSON array.")
+
+                position += 1
+                state = "first"
+            elif state in {"first", "item"}:
+                if state == "first" and char == "]":
+                    position += 1
+                    state = "end"
+                elif char in ",]}":
+                    raise ValueError(f"Expecting value at {char!r}.")
+                else:
+                    state = "value"
+            elif state == "separator":
+                position += 1
+
+                if char == ",":
+                    state = "item"
+                elif char == "]":
+                    state = "end"
+                else:
+                    raise ValueError(f"Expecting ',' delimiter at {char!r}.")
+            else:
+                raise ValueError("Extra data after JSON array.")
+
+    if state != "end":
+        raise ValueError("Unexpected end of JSON array.")
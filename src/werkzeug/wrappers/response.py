@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import secrets
+import tempfile
+import threading
 import typing as t
+from base64 import b64encode
+from collections import deque
+from datetime import datetime
 from http import HTTPStatus
 from urllib.parse import urljoin
 
@@ -9,22 +16,27 @@ from .._internal import _get_environ
 from ..datastructures import ETags
 from ..datastructures import Headers
 from ..datastructures import Range
-from ..http import generate_etag
+from ..http import _etag_from_hash
+from ..http import _new_etag_hash
 from ..http import http_date
 from ..http import is_resource_modified
 from ..http import remove_entity_headers
 from ..sansio.response import Response as _SansIOResponse
 from ..urls import iri_to_uri
 from ..utils import cached_property
+from ..wsgi import _MultipartRangeWrapper
 from ..wsgi import _RangeWrapper
 from ..wsgi import ClosingIterator
+from ..wsgi import FileWrapper
 from ..wsgi import get_current_url
 
 if t.TYPE_CHECKING:
+    import typing_extensions as te
     from _typeshed.wsgi import StartResponse
     from _typeshed.wsgi import WSGIApplication
     from _typeshed.wsgi import WSGIEnvironment
 
+    from ..sansio.request import Request as _SansIORequest
     from .request import Request
 
 
@@ -132,6 +144,14 @@ class Response(_SansIOResponse):
     #: .. versionadded:: 0.8
     automatically_set_content_length = True
 
+    #: The maximum number of ranges to send as a ``multipart/byteranges``
+    #: response to a range request, after overlapping and adjacent ranges
+    #: are merged. A request for more ranges is sent the full content
+    #: instead, to avoid the overhead of many small parts.
+    #:
+    #: .. versionadded:: 3.2
+    max_ranges = 16
+
     #: The response body to send as the WSGI iterable. A list of strings
     #: or bytes represents a fixed-length response, any other iterable
     #: is a streaming response. Strings are encoded to bytes as UTF-8.
@@ -141,6 +161,23 @@ class Response(_SansIOResponse):
     #: at a time.
     response: t.Iterable[str] | t.Iterable[bytes]
 
+    # Whether the class uses the default WSGI serialization methods and
+    # close, so that __call__ can skip them for simple responses.
+    _default_wsgi_methods = True
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._default_wsgi_methods = all(
+            getattr(cls, name) is getattr(Response, name)
+            for name in (
+                "get_wsgi_headers",
+                "get_app_iter",
+                "get_wsgi_response",
+                "iter_encoded",
+                "close",
+            )
+        )
+
     def __init__(
         self,
         response: t.Iterable[bytes] | bytes | t.Iterable[str] | str | None = None,
@@ -572,11 +609,74 @@ class Response(_SansIOResponse):
         :param start_response: the response callable provided by the WSGI
                                server.
         :return: an application iterator
+
+        .. versionchanged:: 3.2
+            A response with a list of bytes as the body is sent without
+            copying its headers or wrapping its body, if it doesn't need
+            any of the changes :meth:`get_wsgi_response` makes.
         """
+        if self._default_wsgi_methods:
+            simple = self._get_simple_wsgi_response(environ)
+
+            if simple is not None:
+                start_response(self.status, simple[1])
+                return simple[0]
+
         app_iter, status, headers = self.get_wsgi_response(environ)
         start_response(status, headers)
         return app_iter
 
+    def _get_simple_wsgi_response(
+        self, environ: WSGIEnvironment
+    ) -> tuple[list[bytes], list[tuple[str, str]]] | None:
+        """Get the body and headers for a response that
+        :meth:`get_wsgi_response` would send unchanged, apart from adding
+        ``Content-Length``. Returns ``None`` for any other response.
+
+        The body must be a list of bytes, there must be no functions to call
+        on close, the status must allow a body, the request must not be
+        ``HEAD``, and there must be no ``Location`` or ``Content-Location``
+        headers, which may need to be changed.
+        """
+        body = self.response
+        status = self.status_code
+
+        if (
+            type(body) is not list
+            or self.direct_passthrough
+            or self._on_close
+            or status < 200
+            or status == 204
+            or status == 304
+            or environ["REQUEST_METHOD"] == "HEAD"
+        ):
+            return None
+
+        length = 0
+
+        for item in body:
+            if type(item) is not bytes:
+                return None
+
+            length += len(item)
+
+        headers = list(self.headers)
+        has_length = False
+
+        for key, _ in headers:
+            ikey = key.lower()
+
+            if ikey == "location" or ikey == "content-location":
+                return None
+
+            if ikey == "content-length":
+                has_length = True
+
+        if not has_length and self.automatically_set_content_length:
+            headers.append(("Content-Length", str(length)))
+
+        return body, headers
+
     # JSON
 
     #: A module or other object that has ``dumps`` and ``loads``
@@ -631,11 +731,89 @@ class Response(_SansIOResponse):
         """The response iterable as write-only stream."""
         return ResponseStream(self)
 
+    def open_stream(
+        self, max_buffer_size: int = 64 * 1024, digest: str | None = None
+    ) -> ResponsePipe:
+        """Replace the body with a :class:`ResponsePipe`, and return it.
+        Unlike :attr:`stream`, data written to the pipe is sent to the client
+        as the server reads it, and writing blocks while the server has not
+        yet read ``max_buffer_size`` bytes. Write to the pipe from another
+        thread, then return the response from the view.
+
+        .. code-block:: python
+
+            response = Response(mimetype="text/csv")
+            stream = response.open_stream()
+
+            def produce():
+                with stream:
+                    for row in query_rows():
+                        stream.write(format_row(row))
+
+            threading.Thread(target=produce).start()
+            return response
+
+        :param max_buffer_size: The number of bytes that can be written
+            before the server reads them, after which writing blocks.
+        :param digest: Calculate a checksum of the body as it is written,
+            and send it in a ``Content-Digest`` trailer after the body. Can
+            be ``"sha-256"`` or ``"sha-512"``. Trailers are only sent by the
+            development server, with chunked transfer encoding, and are lost
+            if middleware wraps the response iterable. A ``Trailer`` header
+            is not set, since it would promise a field that may not be sent.
+
+        .. versionadded:: 3.2
+        """
+        pipe = ResponsePipe(self, max_buffer_size, digest)
+        self.response = _PipeIterator(pipe)
+        self.direct_passthrough = True
+        self.headers.pop("Content-Length", None)
+        return pipe
+
     def _wrap_range_response(self, start: int, length: int) -> None:
         """Wrap existing Response in case of Range Request context."""
         if self.status_code == 206:
             self.response = _RangeWrapper(self.response, start, length)  # type: ignore
 
+    def _wrap_multipart_range_response(
+        self, ranges: list[tuple[int, int]], complete_length: int
+    ) -> bool:
+        """Wrap existing Response to send multiple ranges as a
+        ``multipart/byteranges`` body. Returns ``False`` without changing the
+        response if the body would not be smaller than the full content.
+        """
+        boundary = secrets.token_hex(16)
+        content_type = self.headers.get("Content-Type")
+        type_header = f"Content-Type: {content_type}\r\n" if content_type else ""
+        tail = f"\r\n--{boundary}--\r\n".encode("latin1")
+        content_length = len(tail)
+        parts: list[tuple[bytes, int, int]] = []
+
+        for start, stop in ranges:
+            head = (
+                f"--{boundary}\r\n{type_header}"
+                f"Content-Range: bytes {start}-{stop - 1}/{complete_length}\r\n\r\n"
+            ).encode("latin1")
+
+            if parts:
+                head = b"\r\n" + head
+
+            content_length += len(head) + stop - start
+            parts.append((head, start, stop))
+
+        if content_length >= complete_length:
+            return False
+
+        self.status_code = 206
+        self.content_type = f"multipart/byteranges; boundary={boundary}"
+        self.content_length = content_length
+        self.response = _MultipartRangeWrapper(
+            self.response,  # type: ignore[arg-type]
+            parts,
+            tail,
+        )
+        return True
+
     def _is_range_request_processable(self, environ: WSGIEnvironment) -> bool:
         """Return ``True`` if `Range` header is present and if underlying
         resource is considered unchanged when compared with `If-Range` header.
@@ -668,6 +846,9 @@ class Response(_SansIOResponse):
                  if `Range` header could not be parsed or satisfied.
 
         .. versionchanged:: 3.2
+            Multiple ranges are sent as a ``multipart/byteranges`` body, up to
+            :attr:`max_ranges`.
+
             Adds the ``Accept-Ranges`` header if ``accept_ranges`` is passed,
             even if this is not a satisfiable range request.
 
@@ -692,17 +873,23 @@ class Response(_SansIOResponse):
         if parsed_range is None:
             raise RequestedRangeNotSatisfiable(complete_length)
 
-        range_tuple = parsed_range.range_for_length(complete_length)
-        content_range_header = parsed_range.to_content_range_header(complete_length)
+        ranges = parsed_range.ranges_for_length(complete_length)
 
-        if range_tuple is None or content_range_header is None:
+        if ranges is None:
             raise RequestedRangeNotSatisfiable(complete_length)
 
-        content_length = range_tuple[1] - range_tuple[0]
+        if len(ranges) > 1:
+            if len(ranges) > self.max_ranges:
+                return False
+
+            return self._wrap_multipart_range_response(ranges, complete_length)
+
+        start, stop = ranges[0]
+        content_length = stop - start
         self.content_length = content_length
-        self.content_range = content_range_header
+        self.content_range = f"bytes {start}-{stop - 1}/{complete_length}"
         self.status_code = 206
-        self._wrap_range_response(range_tuple[0], content_length)
+        self._wrap_range_response(start, content_length)
         return True
 
     def make_conditional(
@@ -746,7 +933,10 @@ class Response(_SansIOResponse):
         :raises: :class:`~werkzeug.exceptions.RequestedRangeNotSatisfiable`
                  if `Range` header could not be parsed or satisfied.
 
-        .. versionchangedd: 3.2
+        .. versionchanged:: 3.2
+            Multiple ranges are sent as a ``multipart/byteranges`` body, up to
+            :attr:`max_ranges`.
+
             Adds the ``Accept-Ranges`` header if ``accept_ranges`` is passed,
             even if this is not a satisfiable range request.
 
@@ -782,13 +972,95 @@ class Response(_SansIOResponse):
                     self.headers["Content-Length"] = str(length)
         return self
 
-    def add_etag(self, overwrite: bool = False, weak: bool = False) -> None:
+    @classmethod
+    def not_modified(
+        cls,
+        request: _SansIORequest,
+        etag: str | None = None,
+        last_modified: datetime | str | None = None,
+        weak: bool = False,
+    ) -> te.Self | None:
+        """Check the request's conditional headers against validators for the
+        current version of the resource, and return a ``304 Not Modified``
+        response if the client's copy is current. Returns ``None`` if the
+        response must be generated.
+
+        This allows a view to skip rendering and hashing the body, which
+        :meth:`make_conditional` can only do after the response is built.
+        The validators should be cheap to get, such as a version number or
+        updated timestamp stored with the data. See
+        :meth:`.Request.is_modified`.
+
+        .. code-block:: python
+
+            @Request.application
+            def show_post(request):
+                version, updated = get_post_version(post_id)
+                etag = f"v{version}"
+
+                rv = Response.not_modified(request, etag, updated)
+
+                if rv is not None:
+                    return rv
+
+                response = Response(render_post(post_id))
+                response.set_etag(etag)
+                response.last_modified = updated
+                return response
+
+        The returned response has the given ``ETag`` and ``Last-Modified``
+        headers. Its status is ``412 Precondition Failed`` instead if an
+        ``If-Match`` header did not match, like :meth:`make_conditional`.
+
+        :param request: The request to check.
+        :param etag: The ETag the response will have.
+        :param last_modified: The time the resource was last modified.
+        :param weak: Mark the ETag as weak.
+
+        .. versionadded:: 3.2
+        """
+        if request.is_modified(etag, last_modified):
+            return None
+
+        rv = cls(status=412 if request.if_match else 304)
+
+        if etag is not None:
+            rv.set_etag(etag, weak)
+
+        if isinstance(last_modified, str):
+            rv.headers["Last-Modified"] = last_modified
+        elif last_modified is not None:
+            rv.last_modified = last_modified
+
+        return rv
+
+    def add_etag(
+        self,
+        overwrite: bool = False,
+        weak: bool = False,
+        spool_size: int | None = None,
+    ) -> None:
         """Add an ETag by hashing this response's data. This causes the data to
-        be read, don't call this on a streaming response.
+        be read, don't call this on a streaming response unless ``spool_size``
+        is given.
+
+        The data is hashed as it is iterated, without joining it into a single
+        bytes object. The ``Content-Length`` header is set as well if it is not
+        already, so :meth:`make_conditional` doesn't need to read the data
+        again.
 
         :param overwrite: Overwrite an existing ``ETag`` header.
         :param weak: Mark the ETag as weak. This is unlikely what you want, as
             a hash of the data is typically considered strong.
+        :param spool_size: If the response is streamed, write the data to a
+            :class:`~tempfile.SpooledTemporaryFile` while hashing it, and send
+            the response from that file. The data is held in memory up to this
+            many bytes, then in a temporary file on disk, until the response is
+            sent and closed. This is also allowed in direct passthrough mode.
+
+        .. versionchanged:: 3.2
+            The data is hashed in chunks. Added the ``spool_size`` parameter.
+            ``Content-Length`` is set.
 
         .. versionchanged:: 3.2
             Use SHA3-256.
@@ -796,8 +1068,42 @@ class Response(_SansIOResponse):
         .. versionchanged:: 2.0
             Use SHA-1.
         """
-        if overwrite or "ETag" not in self.headers:
-            self.set_etag(generate_etag(self.get_data()), weak)
+        if not overwrite and "ETag" in self.headers:
+            return
+
+        etag_hash = _new_etag_hash()
+        length = 0
+
+        if spool_size is not None and not self.is_sequence:
+            spool = tempfile.SpooledTemporaryFile(max_size=spool_size)
+
+            try:
+                for chunk in self.iter_encoded():
+                    etag_hash.update(chunk)
+                    length += spool.write(chunk)
+            except BaseException:
+                spool.close()
+                raise
+            finally:
+                if hasattr(self.response, "close"):
+                    self.response.close()
+
+            spool.seek(0)
+            self.response = FileWrapper(spool)
+        else:
+            self._ensure_sequence()
+
+            for chunk in self.iter_encoded():
+                etag_hash.update(chunk)
+                length += len(chunk)
+
+        self.set_etag(_etag_from_hash(etag_hash), weak)
+
+        if (
+            self.automatically_set_content_length
+            and "Content-Length" not in self.headers
+        ):
+            self.headers["Content-Length"] = str(length)
 
 
 class ResponseStream:
@@ -843,3 +1149,183 @@ class ResponseStream:
     @property
     def encoding(self) -> str:
         return "utf-8"
+
+
+# Digest algorithm names from RFC 9530, mapped to hashlib names.
+_digest_algorithms = {"sha-256": "sha256", "sha-512": "sha512"}
+
+
+class ResponsePipe(ResponseStream):
+    """A write-only stream used by :meth:`Response.open_stream` to send the
+    body of a response while it is written. Data is held in a buffer
+    between the thread writing it and the server reading it. Writing blocks
+    while the buffer is full, so a slow client slows down the writer rather
+    than the body accumulating in memory.
+
+    Call :meth:`close`, or use the pipe as a context manager, when the body
+    is complete. If writing fails, call :meth:`abort` instead, so the server
+    ends the response with an error rather than sending a truncated body as
+    if it were complete. If the server stops reading, for example because
+    the client disconnected, :meth:`write` raises :exc:`BrokenPipeError`.
+
+    Strings are encoded as UTF-8. A single write larger than the buffer is
+    allowed when the buffer is empty. Writing must happen in another thread
+    than the one serving the response, otherwise it blocks forever once the
+    buffer is full.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self,
+        response: Response,
+        max_buffer_size: int = 64 * 1024,
+        digest: str | None = None,
+    ) -> None:
+        super().__init__(response)
+        self.max_buffer_size = max_buffer_size
+        #: Trailer fields to send after the body, with chunked transfer
+        #: encoding. They may be added until the pipe is closed.
+        self.trailers = Headers()
+        self._chunks: deque[bytes] = deque()
+        self._buffer_size = 0
+        self._written = 0
+        self._error: BaseException | None = None
+        self._reader_closed = False
+        self._cond = threading.Condition()
+        self._digest_name = digest
+        self._digest: hashlib._Hash | None = None
+
+        if digest is not None:
+            if digest not in _digest_algorithms:
+                raise ValueError(f"Unsupported digest algorithm {digest!r}.")
+
+            self._digest = hashlib.new(_digest_algorithms[digest])
+
+    def write(self, value: bytes | str) -> int:
+        if isinstance(value, str):
+            value = value.encode()
+
+        if not value:
+            return 0
+
+        with self._cond:
+            if self.closed:
+                raise ValueError("I/O operation on closed file")
+
+            while (
+                self._buffer_size
+                and self._buffer_size + len(value) > self.max_buffer_size
+                and not self._reader_closed
+            ):
+                self._cond.wait()
+
+            if self._reader_closed:
+                raise BrokenPipeError("The response is no longer being read.")
+
+            self._chunks.append(value)
+            self._buffer_size += len(value)
+            self._written += len(value)
+
+            if self._digest is not None:
+                self._digest.update(value)
+
+            self._cond.notify_all()
+
+        return len(value)
+
+    def tell(self) -> int:
+        return self._written
+
+    def close(self) -> None:
+        """End the body. Data in the buffer is still sent."""
+        with self._cond:
+            if self.closed:
+                return
+
+            if self._digest is not None:
+                value = b64encode(self._digest.digest()).decode()
+                self.trailers["Content-Digest"] = f"{self._digest_name}=:{value}:"
+
+            self.closed = True
+            self._cond.notify_all()
+
+    def abort(self, error: BaseException | None = None) -> None:
+        """End the body with an error. The error is raised by the server when
+        it reaches the end of the buffer, which ends the response without
+        marking it complete.
+
+        :param error: The error to raise. Defaults to a
+            :exc:`RuntimeError`.
+        """
+        with self._cond:
+            if self.closed:
+                return
+
+            if error is None:
+                error = RuntimeError("The response body was aborted.")
+
+            self._error = error
+            self.closed = True
+            self._cond.notify_all()
+
+    def __enter__(self) -> ResponsePipe:
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):  # type: ignore
+        if exc_value is not None:
+            self.abort(exc_value)
+        else:
+            self.close()
+
+    def _read(self) -> bytes | None:
+        """Wait for and return the next chunk, or ``None`` at the end."""
+        with self._cond:
+            while not self._chunks and not self.closed:
+                self._cond.wait()
+
+            if self._chunks:
+                value = self._chunks.popleft()
+                self._buffer_size -= len(value)
+                self._cond.notify_all()
+                return value
+
+            if self._error is not None:
+                raise self._error
+
+            return None
+
+    def _close_reader(self) -> None:
+        with self._cond:
+            self._reader_closed = True
+            self._chunks.clear()
+            self._buffer_size = 0
+            self._cond.notify_all()
+
+
+class _PipeIterator:
+    """The response iterable for a :class:`ResponsePipe`. The server closing
+    it makes further writes fail. Servers that support trailers, such as the
+    development server, read :attr:`trailers` after the body is iterated.
+    """
+
+    def __init__(self, pipe: ResponsePipe) -> None:
+        self._pipe = pipe
+
+    @property
+    def trailers(self) -> list[tuple[str, str]]:
+        return self._pipe.trailers.to_wsgi_list()
+
+    def __iter__(self) -> _PipeIterator:
+        return self
+
+    def __next__(self) -> bytes:
+        value = self._pipe._read()
+
+        if value is None:
+            raise StopIteration
+
+        return value
+
+    def close(self) -> None:
+        self._pipe._close_reader()
@@ -436,6 +436,68 @@ class _RangeWrapper:
             self.iterable.close()
 
 
+class _MultipartRangeWrapper:
+    """Convert an iterable into a ``multipart/byteranges`` body that
+    contains the given ranges of the underlying content. Each part is
+    preceded by its boundary and headers, which are given already encoded.
+
+    If the iterable is seekable, it is seeked to the start of each range,
+    otherwise it is read forward, so the ranges must be sorted and must not
+    overlap.
+
+    :param iterable: an iterable object with a :meth:`__next__` method.
+    :param parts: a list of ``(head, start, stop)`` tuples, where ``head``
+        is the boundary and headers that precede the range of bytes.
+    :param tail: the closing boundary written after the last part.
+    """
+
+    def __init__(
+        self,
+        iterable: t.Iterable[bytes] | t.IO[bytes],
+        parts: list[tuple[bytes, int, int]],
+        tail: bytes,
+    ) -> None:
+        self.iterable = iterable
+        self.parts = parts
+        self.tail = tail
+        self.seekable = hasattr(iterable, "seekable") and iterable.seekable()
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        iterator = iter(self.iterable)
+        chunk = b""
+        # The position in the underlying content of the start of the chunk.
+        offset = 0
+
+        for head, start, stop in self.parts:
+            yield head
+
+            if self.seekable:
+                self.iterable.seek(start)  # type: ignore[union-attr]
+                chunk = b""
+                offset = start
+
+            while start < stop:
+                if start >= offset + len(chunk):
+                    offset += len(chunk)
+                    next_chunk = next(iterator, None)
+
+                    if next_chunk is None:
+                        return
+
+                    chunk = next_chunk
+                    continue
+
+                data = chunk[start - offset : stop - offset]
+                start += len(data)
+                yield data
+
+        yield self.tail
+
+    def close(self) -> None:
+        if hasattr(self.iterable, "close"):
+            self.iterable.close()
+
+
 class LimitedStream(io.RawIOBase):
     """Wrap a stream so that it doesn't read more than a given limit. This is used to
     limit ``wsgi.input`` to the ``Content-Length`` header value or
@@ -0,0 +1,204 @@
+import threading
+import time
+
+import pytest
+
+from werkzeug.middleware.cache import CachedResponse
+from werkzeug.middleware.cache import CacheMiddleware
+from werkzeug.middleware.cache import MemoryCache
+from werkzeug.test import Client
+from werkzeug.wrappers import Request
+from werkzeug.wrappers import Response
+
+
+def make_app(calls, **kwargs):
+    kwargs.setdefault("headers", {"Cache-Control": "max-age=60"})
+
+    @Request.application
+    def app(request):
+        calls.append(request)
+        response = Response(f"Hello {len(calls)}", **kwargs)
+        response.set_etag(str(len(calls)))
+        return response
+
+    return app
+
+
+def test_cached():
+    calls = []
+    client = Client(CacheMiddleware(make_app(calls)))
+    assert client.get().text == "Hello 1"
+    response = client.get()
+    assert response.text == "Hello 1"
+    assert response.headers["Age"] == "0"
+    assert len(calls) == 1
+
+    response = client.head()
+    assert response.status_code == 200
+    assert response.data == b""
+    assert len(calls) == 1
+
+    assert client.get("/other").text == "Hello 2"
+    assert client.post().text == "Hello 3"
+    assert client.get(headers={"Authorization": "Bearer a"}).text == "Hello 4"
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Cache-Control": "max-age=0"},
+        {"Cache-Control": "max-age=60, private"},
+        {"Cache-Control": "max-age=60, no-store"},
+        {"Cache-Control": "max-age=60, no-cache"},
+        {"Cache-Control": "max-age=60", "Set-Cookie": "a=b"},
+        {"Cache-Control": "max-age=60", "Vary": "*"},
+    ],
+)
+def test_not_cached(headers):
+    calls = []
+    client = Client(CacheMiddleware(make_app(calls, headers=headers)))
+    assert client.get().text == "Hello 1"
+    assert client.get().text == "Hello 2"
+
+
+def test_s_maxage():
+    calls = []
+    app = make_app(calls, headers={"Cache-Control": "max-age=0, s-maxage=60"})
+    client = Client(CacheMiddleware(app))
+    client.get()
+    assert client.get().text == "Hello 1"
+
+
+def test_vary():
+    calls = []
+    app = make_app(calls, headers={"Cache-Control": "max-age=60", "Vary": "Accept"})
+    client = Client(CacheMiddleware(app))
+    assert client.get(headers={"Accept": "text/html"}).text == "Hello 1"
+    assert client.get(headers={"Accept": "text/plain"}).text == "Hello 2"
+    assert client.get(headers={"Accept": "text/html"}).text == "Hello 1"
+    assert client.get(headers={"Accept": "text/plain"}).text == "Hello 2"
+    assert client.get().text == "Hello 3"
+
+
+def test_vary_stored_once():
+    calls = []
+    app = make_app(calls, headers={"Cache-Control": "max-age=60", "Vary": "Accept"})
+    storage = MemoryCache()
+    client = Client(CacheMiddleware(app, storage=storage))
+    response = client.get(headers={"Accept": "text/html"})
+    # The body and headers are only counted once.
+    assert storage._size == len(response.data) + sum(
+        len(k) + len(v) for k, v in response.headers if k != "Age"
+    )
+
+
+def test_vary_content_type():
+    calls = []
+    app = make_app(
+        calls, headers={"Cache-Control": "max-age=60", "Vary": "Content-Type"}
+    )
+    client = Client(CacheMiddleware(app))
+    assert client.get(content_type="text/html").text == "Hello 1"
+    assert client.get(content_type="text/plain").text == "Hello 2"
+    assert client.get(content_type="text/html").text == "Hello 1"
+
+
+def test_conditional():
+    calls = []
+    client = Client(CacheMiddleware(make_app(calls)))
+    client.get()
+    response = client.get(headers={"If-None-Match": '"1"'})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"1"'
+    assert response.data == b""
+    assert client.get(headers={"If-None-Match": '"0"'}).status_code == 200
+    assert len(calls) == 1
+
+
+def test_expired(monkeypatch):
+    calls = []
+    client = Client(CacheMiddleware(make_app(calls)))
+    client.get()
+    now = time.monotonic()
+    monkeypatch.setattr("werkzeug.middleware.cache.monotonic", lambda: now + 61)
+    assert client.get().text == "Hello 2"
+
+
+def test_max_entry_size():
+    calls = []
+    client = Client(CacheMiddleware(make_app(calls), max_entry_size=5))
+    assert client.get().text == "Hello 1"
+    assert client.get().text == "Hello 2"
+
+
+def test_coalesce():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @Request.application
+    def app(request):
+        calls.append(request)
+        started.set()
+        release.wait(5)
+        return Response("Hello", headers={"Cache-Control": "max-age=60"})
+
+    client = Client(CacheMiddleware(app))
+    results = []
+
+    def get():
+        results.append(client.get().text)
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+
+    for thread in threads[1:]:
+        thread.start()
+
+    release.set()
+
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["Hello"] * 4
+    assert len(calls) == 1
+
+
+def test_memory_cache_eviction():
+    def make(body):
+        now = time.monotonic()
+        return CachedResponse("200 OK", [], body, created=now, expires=now + 60)
+
+    cache = MemoryCache(max_entries=2, max_size=10)
+    cache.set("a", make(b"aaaa"))
+    cache.set("b", make(b"bbbb"))
+    assert cache.get("a") is not None
+    cache.set("c", make(b"cccc"))
+    # b was the least recently used.
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    cache.set("d", make(b"dddddddd"))
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert cache.get("d") is not None
+    cache.set("e", make(b"e" * 11))
+    assert cache.get("e") is None
+
+
+def test_start_response_not_called():
+    closed = []
+
+    def app(environ, start_response):
+        try:
+            yield from ()
+        finally:
+            closed.append(True)
+
+    client = Client(CacheMiddleware(app))
+
+    with pytest.raises(RuntimeError, match="start_response"):
+        client.get()
+
+    assert closed
@@ -0,0 +1,172 @@
+import gzip
+import os
+import zlib
+
+import pytest
+
+from werkzeug.middleware.compress import CompressMiddleware
+from werkzeug.test import Client
+from werkzeug.utils import send_file
+from werkzeug.wrappers import Request
+from werkzeug.wrappers import Response
+
+DATA = b"Hello, World! " * 100
+
+
+def make_client(make_response, **kwargs):
+    @Request.application
+    def app(request):
+        return make_response()
+
+    return Client(CompressMiddleware(app, **kwargs))
+
+
+@pytest.mark.parametrize(
+    ("accept", "encoding", "decompress"),
+    [
+        ("gzip", "gzip", gzip.decompress),
+        ("deflate", "deflate", zlib.decompress),
+        ("deflate, gzip;q=0.5", "deflate", zlib.decompress),
+        ("gzip, *;q=0.1", "gzip", gzip.decompress),
+    ],
+)
+def test_compress(accept, encoding, decompress):
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [DATA]
+
+    client = Client(CompressMiddleware(app))
+    response = client.get(headers={"Accept-Encoding": accept})
+    assert response.headers["Content-Encoding"] == encoding
+    assert response.headers["Vary"] == "Accept-Encoding"
+    # A list body is compressed at once and gets an exact length.
+    assert response.headers["Content-Length"] == str(len(response.data))
+    assert decompress(response.data) == DATA
+
+
+@pytest.mark.parametrize("accept", [None, "identity", "gzip;q=0, deflate;q=0", "br"])
+def test_not_accepted(accept):
+    client = make_client(lambda: Response(DATA))
+    response = client.get(headers={"Accept-Encoding": accept} if accept else {})
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.data == DATA
+
+
+@pytest.mark.parametrize(
+    ("data", "kwargs"),
+    [
+        (b"small", {}),
+        (DATA, {"mimetype": "image/png"}),
+        (DATA, {"headers": {"Content-Encoding": "br"}}),
+        (DATA, {"headers": {"Cache-Control": "no-transform"}}),
+        (DATA, {"status": 206, "headers": {"Content-Range": "bytes 0-1/2"}}),
+    ],
+)
+def test_skipped(data, kwargs):
+    client = make_client(lambda: Response(data, **kwargs))
+    response = client.get(headers={"Accept-Encoding": "gzip"})
+    assert response.headers.get("Content-Encoding") != "gzip"
+
+
+def test_streamed():
+    chunks = []
+
+    def generate():
+        for _ in range(3):
+            chunks.append(1)
+            yield DATA
+
+    client = make_client(lambda: Response(generate()))
+    response = client.get(headers={"Accept-Encoding": "gzip"}, buffered=False)
+    assert response.headers["Content-Encoding"] == "gzip"
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    body = response.iter_encoded()
+    # Each chunk can be decompressed as soon as it is sent.
+    assert decompressor.decompress(next(body)) == DATA
+    assert len(chunks) == 1
+    assert decompressor.decompress(b"".join(body)) == DATA * 2
+    response.close()
+
+
+def test_list_body():
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain"), ("ETag", '"a"')])
+        return [DATA, DATA]
+
+    client = Client(CompressMiddleware(app))
+    response = client.get(headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Length"] == str(len(response.data))
+    assert response.headers["ETag"] == 'W/"a"'
+    assert gzip.decompress(response.data) == DATA * 2
+
+
+def test_vary_existing():
+    client = make_client(lambda: Response(DATA, headers={"Vary": "Cookie"}))
+    response = client.get(headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Vary"] == "Cookie, Accept-Encoding"
+
+
+def test_custom_compressor():
+    class Compressor:
+        def __init__(self):
+            self.data = []
+
+        def compress(self, data):
+            self.data.append(data)
+            return b""
+
+        def flush(self):
+            return b""
+
+        def finish(self):
+            return b"".join(self.data)[::-1]
+
+    client = make_client(lambda: Response(DATA), compressors={"reverse": Compressor})
+    response = client.get(headers={"Accept-Encoding": "gzip, reverse"})
+    assert response.headers["Content-Encoding"] == "reverse"
+    assert response.data == DATA[::-1]
+
+
+def test_precompressed(tmp_path):
+    path = tmp_path / "style.css"
+    path.write_bytes(DATA)
+    gz_path = tmp_path / "style.css.gz"
+    gz_path.write_bytes(gzip.compress(DATA))
+
+    @Request.application
+    def app(request):
+        return send_file(path, request.environ)
+
+    client = Client(CompressMiddleware(app))
+    response = client.get(headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Content-Length"] == str(gz_path.stat().st_size)
+    assert response.headers["ETag"].startswith("W/")
+    assert response.data == gz_path.read_bytes()
+    response.close()
+
+    # An outdated precompressed file is not used.
+    mtime = path.stat().st_mtime
+    os.utime(gz_path, (mtime - 10, mtime - 10))
+    response = client.get(headers={"Accept-Encoding": "gzip"})
+    assert gzip.decompress(response.data) == DATA
+    assert "Content-Length" not in response.headers
+    response.close()
+
+
+def test_start_response_not_called():
+    closed = []
+
+    def app(environ, start_response):
+        try:
+            yield from ()
+        finally:
+            closed.append(True)
+
+    client = Client(CompressMiddleware(app))
+
+    with pytest.raises(RuntimeError, match="start_response"):
+        client.get()
+
+    assert closed
@@ -1,6 +1,12 @@
+import gzip
+import hashlib
+import json
 import os
 from contextlib import closing
 
+import pytest
+
+from werkzeug.middleware.shared_data import precompress_directory
 from werkzeug.middleware.shared_data import SharedDataMiddleware
 from werkzeug.test import create_environ
 from werkzeug.test import run_wsgi_app
@@ -60,3 +66,202 @@ def test_shared_data_middleware(tmpdir):
             app_iter, status, headers = run_wsgi_app(app, create_environ(path))
             assert status == "404 NOT FOUND"
             assert b"".join(app_iter).strip() == b"NOT FOUND"
+
+
+def test_index(tmp_path):
+    def null_application(environ, start_response):
+        start_response("404 NOT FOUND", [("Content-Type", "text/plain")])
+        return [b"NOT FOUND"]
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b" * 20)
+    app = SharedDataMiddleware(
+        null_application,
+        {"/static": str(tmp_path), "/pkg": ("werkzeug.debug", "shared")},
+        index=True,
+        hot_cache_size=10,
+    )
+    app_iter, status, headers = run_wsgi_app(app, create_environ("/static/sub/a.txt"))
+    assert status == "200 OK"
+    assert b"".join(app_iter) == b"a"
+    headers = dict(headers)
+    assert headers["Content-Type"] == "text/plain; charset=utf-8"
+    assert headers["Content-Length"] == "1"
+
+    # The small file is kept in memory, the larger one is not.
+    (tmp_path / "sub" / "a.txt").unlink()
+    app_iter, status, _ = run_wsgi_app(app, create_environ("/static/sub/a.txt"))
+    assert b"".join(app_iter) == b"a"
+    app_iter, status, _ = run_wsgi_app(app, create_environ("/static/b.txt"))
+
+    with closing(app_iter):
+        assert b"".join(app_iter) == b"b" * 20
+
+    app_iter, status, _ = run_wsgi_app(
+        app,
+        create_environ("/static/sub/a.txt", headers={"If-None-Match": headers["ETag"]}),
+    )
+    assert status == "304 Not Modified"
+
+    app_iter, status, _ = run_wsgi_app(app, create_environ("/pkg/debugger.js"))
+
+    with closing(app_iter):
+        assert b"docReady(() =>" in b"".join(app_iter)
+
+    # Files that aren't indexed are still found, and building the index again
+    # picks them up, and drops the deleted file.
+    (tmp_path / "c.txt").write_text("c")
+    app_iter, status, _ = run_wsgi_app(app, create_environ("/static/c.txt"))
+
+    with closing(app_iter):
+        assert b"".join(app_iter) == b"c"
+
+    assert "/static/c.txt" not in app._index
+    app.build_index()
+    assert "/static/c.txt" in app._index
+    app_iter, status, _ = run_wsgi_app(app, create_environ("/static/sub/a.txt"))
+    assert status == "404 NOT FOUND"
+
+
+@pytest.mark.parametrize("hot_cache_size", [0, 100])
+def test_index_file_changed(tmp_path, hot_cache_size):
+    (tmp_path / "a.txt").write_text("a")
+    app = SharedDataMiddleware(
+        None, {"/static": str(tmp_path)}, index=True, hot_cache_size=hot_cache_size
+    )
+    (tmp_path / "a.txt").write_text("abc")
+    app_iter, status, headers = run_wsgi_app(app, create_environ("/static/a.txt"))
+
+    with closing(app_iter):
+        assert b"".join(app_iter) == b"abc"
+
+    assert headers["Content-Length"] == "3"
+
+
+def test_hot_cache_eviction(tmp_path):
+    for name in "abc":
+        (tmp_path / name).write_bytes(name.encode() * 4)
+
+    app = SharedDataMiddleware(None, {"/": str(tmp_path)}, index=True, hot_cache_size=8)
+
+    for name in "abac":
+        app_iter, _, _ = run_wsgi_app(app, create_environ(f"/{name}"))
+        b"".join(app_iter)
+
+    # b was the least recently used.
+    assert list(app._hot) == [str(tmp_path / "a"), str(tmp_path / "c")]
+    assert app._hot_used == 8
+
+
+@pytest.mark.parametrize("index", [False, True])
+def test_precompressed(tmp_path, index):
+    path = tmp_path / "style.css"
+    path.write_text("body {}" * 100)
+    gz_path = tmp_path / "style.css.gz"
+    gz_path.write_bytes(gzip.compress(path.read_bytes()))
+    app = SharedDataMiddleware(
+        None, {"/": str(tmp_path)}, index=index, precompressed=True
+    )
+
+    app_iter, status, headers = run_wsgi_app(
+        app, create_environ("/style.css", headers={"Accept-Encoding": "gzip"})
+    )
+
+    with closing(app_iter):
+        assert gzip.decompress(b"".join(app_iter)) == path.read_bytes()
+
+    headers = dict(headers)
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Content-Length"] == str(gz_path.stat().st_size)
+    assert headers["Content-Type"] == "text/css; charset=utf-8"
+    assert headers["Vary"] == "Accept-Encoding"
+    assert headers["ETag"].endswith('-gzip"')
+
+    app_iter, status, headers = run_wsgi_app(app, create_environ("/style.css"))
+
+    with closing(app_iter):
+        assert b"".join(app_iter) == path.read_bytes()
+
+    headers = dict(headers)
+    assert "Content-Encoding" not in headers
+    assert headers["Vary"] == "Accept-Encoding"
+
+    # An outdated precompressed file is not used.
+    mtime = path.stat().st_mtime
+    os.utime(gz_path, (mtime - 10, mtime - 10))
+
+    if index:
+        app.build_index()
+
+    app_iter, status, headers = run_wsgi_app(
+        app, create_environ("/style.css", headers={"Accept-Encoding": "gzip"})
+    )
+
+    with closing(app_iter):
+        assert b"".join(app_iter) == path.read_bytes()
+
+
+def test_precompress_directory(tmp_path):
+    data = b"body {}" * 100
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "style.css").write_bytes(data)
+    (tmp_path / "small.css").write_bytes(b"a {}")
+    (tmp_path / "image.png").write_bytes(data)
+    files = precompress_directory(tmp_path)
+
+    assert gzip.decompress((tmp_path / "sub" / "style.css.gz").read_bytes()) == data
+    assert not (tmp_path / "small.css.gz").exists()
+    assert not (tmp_path / "image.png.gz").exists()
+    assert set(files) == {"sub/style.css", "small.css", "image.png"}
+    assert "gzip" in files["sub/style.css"]["encodings"]
+    assert files["small.css"]["encodings"] == []
+
+    with open(tmp_path / "manifest.json") as f:
+        assert json.load(f)["files"] == files
+
+    # Running again doesn't rewrite up to date files.
+    gz_path = tmp_path / "sub" / "style.css.gz"
+    gz_path.write_bytes(b"marker")
+    os.utime(gz_path, ns=(0, (tmp_path / "sub" / "style.css").stat().st_mtime_ns))
+    assert precompress_directory(tmp_path) == files
+    assert gz_path.read_bytes() == b"marker"
+
+
+def test_manifest(tmp_path):
+    data = b"body {}" * 100
+    content_hash = hashlib.sha256(data).hexdigest()
+    (tmp_path / "style.css").write_bytes(data)
+    (tmp_path / f"style.{content_hash[:8]}.css").write_bytes(data)
+    (tmp_path / "changed.css").write_bytes(data)
+    (tmp_path / "touched.css").write_bytes(data)
+    precompress_directory(tmp_path)
+    (tmp_path / "changed.css").write_bytes(b"a {}")
+    # The same size, but different content.
+    (tmp_path / "touched.css").write_bytes(data.upper())
+    os.utime(tmp_path / "touched.css", ns=(0, 0))
+    app = SharedDataMiddleware(
+        None, {"/static": str(tmp_path)}, index=True, manifest="manifest.json"
+    )
+
+    def get_headers(path):
+        app_iter, _, headers = run_wsgi_app(app, create_environ(path))
+
+        with closing(app_iter):
+            b"".join(app_iter)
+
+        return dict(headers)
+
+    headers = get_headers("/static/style.css")
+    assert headers["ETag"] == f'"{content_hash}"'
+    assert "immutable" not in headers["Cache-Control"]
+
+    headers = get_headers(f"/static/style.{content_hash[:8]}.css")
+    assert headers["ETag"] == f'"{content_hash}"'
+    assert headers["Cache-Control"] == "max-age=31536000, public, immutable"
+
+    # The manifest is ignored for a file that changed after it was written.
+    headers = get_headers("/static/changed.css")
+    assert headers["ETag"].startswith('"wzsdm-')
+    headers = get_headers("/static/touched.css")
+    assert headers["ETag"].startswith('"wzsdm-')
@@ -1,8 +1,16 @@
+import pickle
+import random
+
 import pytest
 
 from werkzeug.datastructures import Headers
+from werkzeug.datastructures import ImmutableMultiDict
 from werkzeug.http import SecFetchMode
 from werkzeug.http import SecFetchSite
+from werkzeug.sansio.http import _cookie_re
+from werkzeug.sansio.http import _parse_cookie_lazy
+from werkzeug.sansio.http import _split_cookie
+from werkzeug.sansio.http import parse_cookie
 from werkzeug.sansio.request import Request
 
 
@@ -31,6 +39,43 @@ def test_cookies() -> None:
     assert req.cookies.getlist("a") == ["b", "c"]
 
 
+def test_cookies_lazy() -> None:
+    headers = Headers([("Cookie", 'a="\\101"; b=c; a=d')])
+    req = Request("GET", "http", None, "", "", b"", headers, None)
+    cookies = req.cookies
+    assert isinstance(cookies, ImmutableMultiDict)
+    assert list(cookies) == ["a", "b"]
+    assert cookies._raw["a"] == ['"\\101"', "d"]  # type: ignore[attr-defined]
+    assert cookies.getlist("a") == ["A", "d"]
+    assert "a" not in cookies._raw  # type: ignore[attr-defined]
+    assert "b" in cookies._raw  # type: ignore[attr-defined]
+    assert cookies == parse_cookie('a="\\101"; b=c; a=d')
+    assert pickle.loads(pickle.dumps(cookies)) == cookies
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_cookies_lazy_matches_eager(seed: int) -> None:
+    rng = random.Random(seed)
+    alphabet = 'ab =;"\\\n\t\u00e9'
+
+    for _ in range(200):
+        value = "".join(rng.choices(alphabet, k=rng.randrange(30)))
+        eager = parse_cookie(value)
+        lazy = _parse_cookie_lazy(value)
+        assert list(lazy.items(multi=True)) == list(eager.items(multi=True)), value
+        assert list(lazy) == list(eager)
+        assert repr(lazy) == repr(eager)
+
+        # the split fast path matches the full pattern
+        if '"' not in value and "\n" not in value:
+            full = [
+                (k.strip(), v.strip())
+                for k, v in _cookie_re.findall(f"{value};")
+                if k.strip()
+            ]
+            assert _split_cookie(value) == full, value
+
+
 @pytest.mark.parametrize(
     "headers, expected",
     [
@@ -55,3 +100,21 @@ def test_sec_fetch_mode(headers: Headers, expected: SecFetchMode | None) -> None
 def test_sec_fetch_site(headers: Headers, expected: SecFetchSite | None) -> None:
     req = Request("POST", "http", None, "", "", b"", headers, None)
     assert req.sec_fetch_site == expected
+
+
+@pytest.mark.parametrize(
+    ("method", "headers", "expected"),
+    [
+        ("GET", {}, True),
+        ("GET", {"If-None-Match": '"v1"'}, False),
+        ("GET", {"If-None-Match": 'W/"v1"'}, False),
+        ("GET", {"If-None-Match": '"v2"'}, True),
+        ("GET", {"If-Modified-Since": "Thu, 01 Jan 2026 00:00:00 GMT"}, False),
+        ("GET", {"If-Modified-Since": "Wed, 31 Dec 2025 00:00:00 GMT"}, True),
+        ("HEAD", {"If-None-Match": "*"}, False),
+        ("POST", {"If-None-Match": '"v1"'}, True),
+    ],
+)
+def test_is_modified(method: str, headers: dict[str, str], expected: bool) -> None:
+    req = Request(method, "http", None, "", "", b"", Headers(headers), None)
+    assert req.is_modified("v1", "Thu, 01 Jan 2026 00:00:00 GMT") is expected
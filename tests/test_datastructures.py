@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import io
+import mmap
 import pickle
+import random
 import tempfile
 import typing as t
 from contextlib import contextmanager
@@ -325,6 +327,55 @@ class TestImmutableMultiDict(_ImmutableDictTests):
         assert immutable2 in x
 
 
+class TestCompactImmutableMultiDict(TestImmutableMultiDict):
+    storage_class = ds.CompactImmutableMultiDict
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [],
+            [("a", "1"), ("b", "2"), ("a", "3"), ("c", "x"), ("a", "4")],
+            {"a": ["1", "2"], "b": "3", "c": [], "d": ("4",)},
+            ds.MultiDict([("a", "1"), ("b", "2"), ("b", "3")]),
+        ],
+    )
+    def test_matches_immutable_multidict(self, data):
+        d = self.storage_class(data)
+        expect = ds.ImmutableMultiDict(data)
+        assert d == expect
+        assert expect == d
+        assert not d != expect
+        assert d.to_dict(flat=False) == expect.to_dict(flat=False)
+        assert list(d.items(multi=True)) == list(expect.items(multi=True))
+        assert list(d.items()) == list(expect.items())
+        assert list(d.values()) == list(expect.values())
+        assert list(d.listvalues()) == list(expect.listvalues())
+        assert dict(d) == dict(expect)
+        assert d.copy() == expect.copy()
+        assert deepcopy(d) == expect
+        assert hash(d) == hash(expect)
+
+        for key in ["a", "b", "c", "missing"]:
+            assert d.get(key) == expect.get(key)
+            assert d.getlist(key) == expect.getlist(key)
+            assert d.getlist(key, type=int) == expect.getlist(key, type=int)
+
+        loaded = pickle.loads(pickle.dumps(d))
+        assert type(loaded) is self.storage_class
+        assert loaded == expect
+
+    def test_single_values_inline(self):
+        d = self.storage_class([("a", "1"), ("b", "2"), ("b", "3")])
+        assert dict.__getitem__(d, "a") == "1"
+        assert dict.__getitem__(d, "b") == ["2", "3"]
+        # a list value is not mistaken for multiple values
+        d = self.storage_class([("a", ["1", "2"])])
+        assert d.getlist("a") == [["1", "2"]]
+
+        with pytest.raises(BadRequestKeyError):
+            d["missing"]
+
+
 class TestImmutableDict(_ImmutableDictTests):
     storage_class = ds.ImmutableDict
 
@@ -662,6 +713,37 @@ class TestHeaders:
         a |= {"y": 2}
         assert "x" in a and "y" in a
 
+    @pytest.mark.parametrize("seed", range(20))
+    def test_index_matches_list(self, seed: int) -> None:
+        rng = random.Random(seed)
+        keys = ["X-A", "x-a", "X-B", "x-b", "X-C"]
+        h = ds.Headers()
+
+        for _ in range(200):
+            op = rng.randrange(9)
+            key = rng.choice(keys)
+
+            if op < 3:
+                h.add(key, str(rng.random()))
+            elif op == 3:
+                h.set(key, "set")
+            elif op == 4:
+                h.remove(key)
+            elif op == 5 and h:
+                del h[rng.randrange(len(h))]
+            elif op == 6 and h:
+                h.popitem()
+            elif op == 7 and h:
+                h[rng.randrange(len(h))] = (key, "item")
+            elif op == 8:
+                h.setlist(key, ["1", "2"])
+
+            for check in keys:
+                expect = [v for k, v in h._list if k.lower() == check.lower()]
+                assert h.getlist(check) == expect
+                assert (check in h) == bool(expect)
+                assert h.get(check) == (expect[0] if expect else None)
+
 
 class TestEnvironHeaders:
     storage_class = ds.EnvironHeaders
@@ -719,6 +801,19 @@ class TestEnvironHeaders:
         headers = ds.EnvironHeaders({"CONTENT_LENGTH": "50", "HTTP_HOST": "test"})
         assert str(headers) == "Content-Length: 50\r\nHost: test\r\n\r\n"
 
+    def test_environ_changes(self) -> None:
+        environ = {"CONTENT_LENGTH": "", "HTTP_X_FOO": "1", "wsgi.version": (1, 0)}
+        headers = ds.EnvironHeaders(environ)
+        assert list(headers) == [("X-Foo", "1")]
+        environ["HTTP_X_FOO"] = "2"
+        environ["CONTENT_LENGTH"] = "50"
+        assert list(headers) == [("Content-Length", "50"), ("X-Foo", "2")]
+        del environ["HTTP_X_FOO"]
+        environ["HTTP_X_BAR"] = "3"
+        assert list(headers) == [("Content-Length", "50"), ("X-Bar", "3")]
+        assert headers["x-bar"] == "3"
+        assert "X-Foo" not in headers
+
 
 class TestHeaderSet:
     storage_class = ds.HeaderSet
@@ -1011,6 +1106,36 @@ class TestMIMEAccept:
         accept = ds.MIMEAccept(values)
         match = accept.best_match(matches, default=default)
         assert match == expect
+        offers = ds.AcceptOffers(matches)
+        assert accept.best_match(offers, default=default) == expect
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_offers_match_list(self, seed):
+        rng = random.Random(seed)
+        pool = [
+            "*/*",
+            "text/*",
+            "text/html",
+            "TEXT/Html",
+            "text/html;level=1",
+            "text/plain",
+            "image/*",
+            "image/png",
+            "application/json",
+            "*/html",
+            "invalid",
+        ]
+        offer_pool = [v for v in pool if v not in {"*/html", "invalid"}]
+
+        for _ in range(100):
+            values = [
+                (rng.choice(pool), rng.choice([0, 0.5, 1]))
+                for _ in range(rng.randrange(6))
+            ]
+            accept = ds.MIMEAccept(values)
+            matches = rng.sample(offer_pool, rng.randrange(1, 6))
+            expect = accept.best_match(matches)
+            assert accept.best_match(ds.AcceptOffers(matches)) == expect
 
 
 class TestLanguageAccept:
@@ -1035,6 +1160,23 @@ class TestLanguageAccept:
         accept = ds.LanguageAccept(values)
         best = accept.best_match(matches, default=default)
         assert best == expect
+        offers = ds.AcceptOffers(matches)
+        assert accept.best_match(offers, default=default) == expect
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_offers_match_list(self, seed):
+        rng = random.Random(seed)
+        pool = ["*", "en", "en-US", "en_us", "EN-gb", "de", "de-AT", "fr-CA"]
+
+        for _ in range(100):
+            values = [
+                (rng.choice(pool), rng.choice([0, 0.5, 1]))
+                for _ in range(rng.randrange(6))
+            ]
+            accept = ds.LanguageAccept(values)
+            matches = rng.sample(pool[1:], rng.randrange(1, 6))
+            expect = accept.best_match(matches)
+            assert accept.best_match(ds.AcceptOffers(matches)) == expect
 
 
 class TestFileStorage:
@@ -1094,6 +1236,69 @@ class TestFileStorage:
         with path.open("rb") as src:
             assert src.read() == b"one\ntwo"
 
+    @pytest.mark.parametrize("max_size", [10, 2048])
+    def test_as_memoryview_spooled(self, max_size):
+        with tempfile.SpooledTemporaryFile(max_size) as f:
+            f.write(b"one\ntwo" * 200)
+            f.seek(3)
+            storage = self.storage_class(f, "file.data")
+
+            with storage.as_memoryview() as view:
+                assert view.readonly
+                assert view[:7] == b"one\ntwo"
+                assert len(view) == 1400
+
+            assert f._rolled is (max_size == 10)
+            assert f.tell() == 3
+
+    def test_as_memoryview_file(self, tmp_path):
+        path = tmp_path / "file.data"
+        path.write_bytes(b"one\ntwo")
+
+        with path.open("rb") as f:
+            view = self.storage_class(f).as_memoryview()
+            assert isinstance(view.obj, mmap.mmap)
+            assert view.tobytes() == b"one\ntwo"
+            view.release()
+
+    def test_as_memoryview_empty_file(self):
+        with tempfile.TemporaryFile() as f:
+            assert self.storage_class(f, "empty").as_memoryview() == b""
+
+    def test_as_memoryview_unbuffered(self):
+        class Stream(io.RawIOBase):
+            def __init__(self):
+                self.data = io.BytesIO(b"one\ntwo")
+
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                return self.data.readinto(b)
+
+            def seekable(self):
+                return True
+
+            def seek(self, pos, whence=0):
+                return self.data.seek(pos, whence)
+
+        assert self.storage_class(Stream()).as_memoryview() == b"one\ntwo"
+
+    def test_as_memoryview_not_seekable(self):
+        class Stream(io.RawIOBase):
+            def __init__(self):
+                self.data = io.BytesIO(b"one\ntwo")
+
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                return self.data.readinto(b)
+
+        stream = io.BufferedReader(Stream())
+        stream.read(4)
+        assert self.storage_class(stream).as_memoryview() == b"two"
+
 
 @pytest.mark.parametrize("ranges", ([(0, 1), (-5, None)], [(5, None)]))
 def test_range_to_header(ranges):
@@ -8,6 +8,7 @@ from werkzeug import formparser
 from werkzeug.datastructures import ImmutableMultiDict
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.exceptions import ServiceUnavailable
 from werkzeug.formparser import FormDataParser
 from werkzeug.formparser import parse_form_data
 from werkzeug.test import Client
@@ -464,3 +465,87 @@ def test_multipart_max_form_memory_size() -> None:
 
     with pytest.raises(RequestEntityTooLarge):
         parser.parse(io.BytesIO(data), b"bound", None)
+
+
+def test_memory_budget_spills_files() -> None:
+    """Files are moved to disk if they don't fit in the memory budget, and
+    released from it when closed.
+    """
+    budget = formparser.MemoryBudget(100)
+    data = b"--bound\r\nContent-Disposition: form-data; name=a; filename=a\r\n\r\n"
+    data += b"a" * 60 + b"\r\n--bound\r\n"
+    data += b"Content-Disposition: form-data; name=b; filename=b\r\n\r\n"
+    data += b"b" * 60 + b"\r\n--bound--"
+
+    with formparser.MultiPartParser(memory_budget=budget) as parser:
+        _, files = parser.parse(io.BytesIO(data), b"bound", None)
+
+    assert budget.in_use == 60
+    assert not files["a"].stream._on_disk
+    assert files["b"].stream._on_disk
+    assert files["b"].read() == b"b" * 60
+
+    for file in files.values():
+        file.close()
+
+    assert budget.in_use == 0
+    assert budget.high_water == 60
+
+
+def test_memory_budget_fields() -> None:
+    """Field data is counted while parsing, and raises an error if it does
+    not fit.
+    """
+    budget = formparser.MemoryBudget(10)
+    data = b"--bound\r\nContent-Disposition: form-data; name=a\r\n\r\n"
+    data += b"a" * 5 + b"\r\n--bound--"
+
+    with formparser.MultiPartParser(memory_budget=budget) as parser:
+        form, _ = parser.parse(io.BytesIO(data), b"bound", None)
+
+    assert form["a"] == "aaaaa"
+    assert budget.in_use == 0
+    assert budget.high_water == 5
+    assert budget.try_reserve(8)
+
+    with pytest.raises(ServiceUnavailable):
+        with formparser.MultiPartParser(memory_budget=budget) as parser:
+            parser.parse(io.BytesIO(data), b"bound", None)
+
+    assert budget.in_use == 8
+
+
+@pytest.mark.parametrize(
+    ("content_type", "data"),
+    [
+        (
+            "multipart/form-data; boundary=bound",
+            b"--bound\r\nContent-Disposition: form-data; name=a\r\n\r\n"
+            b"aaaaa\r\n--bound--",
+        ),
+        ("application/x-www-form-urlencoded", b"a=aaaaa"),
+    ],
+)
+def test_memory_budget_request_form(content_type, data) -> None:
+    """Parsed form fields stay reserved until the request is closed."""
+    budget = formparser.MemoryBudget(10)
+
+    class BudgetRequest(Request):
+        memory_budget = budget
+
+    with BudgetRequest.from_values(
+        method="POST", data=data, content_type=content_type
+    ) as request:
+        assert request.form["a"] == "aaaaa"
+        assert budget.in_use > 0
+
+    assert budget.in_use == 0
+    assert budget.try_reserve(8)
+    request = BudgetRequest.from_values(
+        method="POST", data=data, content_type=content_type
+    )
+
+    with pytest.raises(ServiceUnavailable):
+        request.form  # noqa: B018
+
+    assert budget.in_use == 8
@@ -1,4 +1,6 @@
 import base64
+import email.utils
+import random
 import urllib.parse
 from datetime import date
 from datetime import datetime
@@ -106,6 +108,21 @@ class TestHTTPUtility:
     def test_list_header(self, value, expect):
         assert http.parse_list_header(value) == expect
 
+    @pytest.mark.parametrize("seed", range(20))
+    def test_list_header_fuzz(self, seed):
+        rng = random.Random(seed)
+        alphabet = 'ab =,;"\\\n\t\u00e9'
+
+        for _ in range(500):
+            value = "".join(rng.choices(alphabet, k=rng.randrange(30)))
+            fast = http._split_list_header(value)
+            slow = http._split_list_header_slow(value)
+
+            if fast is None:
+                assert slow is None, value
+            else:
+                assert fast == slow, value
+
     @pytest.mark.parametrize(
         ("value", "expect"),
         [
@@ -118,6 +135,37 @@ class TestHTTPUtility:
     def test_dict_header(self, value, expect):
         assert http.parse_dict_header(value) == expect
 
+    def test_parse_cache(self):
+        http.clear_parse_cache()
+        value = "text/html; charset=utf-8"
+        assert http.parse_options_header(value) == http.parse_options_header(value)
+        info = http.parse_cache_info()["parse_options_header"]
+        assert info == {"hits": 1, "misses": 1, "maxsize": 512, "currsize": 1}
+        # Long values are not cached.
+        http.parse_list_header("a" * 2000)
+        assert http.parse_cache_info()["parse_list_header"]["misses"] == 0
+        http.clear_parse_cache()
+        assert http.parse_cache_info()["parse_options_header"]["hits"] == 0
+
+    def test_parse_cache_copies_mutable(self):
+        http.parse_options_header("text/html; charset=utf-8")[1]["a"] = "b"
+        assert http.parse_options_header("text/html; charset=utf-8")[1] == {
+            "charset": "utf-8"
+        }
+        http.parse_list_header("a, b").append("c")
+        assert http.parse_list_header("a, b") == ["a", "b"]
+        http.parse_dict_header("a=b").clear()
+        assert http.parse_dict_header("a=b") == {"a": "b"}
+        cc = ResponseCacheControl.from_header("max-age=10")
+        cc.max_age = 20
+        assert ResponseCacheControl.from_header("max-age=10").max_age == 10
+
+    def test_parse_cache_shares_accept(self):
+        a = MIMEAccept.from_header("text/html,*/*;q=0.8")
+        assert MIMEAccept.from_header("text/html,*/*;q=0.8") is a
+        b = LanguageAccept.from_header("text/html,*/*;q=0.8")
+        assert type(b) is LanguageAccept
+
     def test_cache_control_header(self):
         cc = RequestCacheControl.from_header("max-age=0, no-cache")
         assert cc.max_age == 0
@@ -598,6 +646,36 @@ class TestHTTPUtility:
         value = http.dump_cookie("foo", "bar", partitioned=True, secure=False)
         assert value == "foo=bar; Secure; Path=/; Partitioned"
 
+    def test_cookie_template(self, monkeypatch):
+        monkeypatch.setattr(http, "_time_now", lambda: 0)
+        template = http.CookieTemplate(
+            "foo", max_age=60, domain=".example.com", httponly=True, samesite="lax"
+        )
+        assert template.dump("bar", expires=0) == (
+            "foo=bar; Domain=example.com; Expires=Thu, 01 Jan 1970 00:00:00 GMT;"
+            " Max-Age=60; HttpOnly; Path=/; SameSite=Lax"
+        )
+        assert template.dump("a b", max_age=timedelta(seconds=1)) == (
+            'foo="a b"; Domain=example.com; Expires=Thu, 01 Jan 1970 00:00:01 GMT;'
+            " Max-Age=1; HttpOnly; Path=/; SameSite=Lax"
+        )
+
+        for value in ["", "bar", "a;b", "\u00fc", '"x"']:
+            assert template.dump(value) == http.dump_cookie(
+                "foo",
+                value,
+                max_age=60,
+                domain=".example.com",
+                httponly=True,
+                samesite="lax",
+            )
+
+    def test_cookie_template_maxsize(self):
+        template = http.CookieTemplate("foo", max_size=512)
+
+        with pytest.warns(UserWarning, match="the limit is 512 bytes"):
+            template.dump("w" * 501)
+
 
 class TestRange:
     def test_if_range_parsing(self):
@@ -784,6 +862,29 @@ def test_http_date(value, expect):
     assert http.http_date(value) == expect
 
 
+@pytest.mark.parametrize("seed", range(5))
+def test_date_matches_email_utils(seed):
+    rng = random.Random(seed)
+
+    for _ in range(200):
+        timestamp = rng.uniform(-1e10, 1e10)
+        value = email.utils.formatdate(timestamp, usegmt=True)
+        assert http.http_date(timestamp) == value
+        assert http.parse_date(value) == email.utils.parsedate_to_datetime(value)
+
+        # case and invalid days are handled the same as email.utils
+        value = value.upper().replace(value[5:7], str(rng.randint(0, 40)).zfill(2))
+        assert http.parse_date(value) == http.parse_date(f" {value}")
+
+
+def test_http_date_now_cached(monkeypatch):
+    monkeypatch.setattr(http, "_time_now", lambda: 784111777.5)
+    assert http.http_date() == "Sun, 06 Nov 1994 08:49:37 GMT"
+    assert http.http_date() is http.http_date()
+    monkeypatch.setattr(http, "_time_now", lambda: 784111778.0)
+    assert http.http_date() == "Sun, 06 Nov 1994 08:49:38 GMT"
+
+
 @pytest.mark.parametrize("value", [".5", "+0.5", "0.5_1", "🯰.🯵"])
 def test_accept_invalid_float(value):
     quoted = urllib.parse.quote(value)
@@ -803,6 +904,22 @@ def test_accept_valid_int_one_zero():
     assert Accept.from_header("en;q=5") == Accept.from_header("en;q=5.0")
 
 
+@pytest.mark.parametrize(
+    ("value", "expect"),
+    [
+        ("bytes=0-9", [(0, 10)]),
+        ("bytes=0-9,20-29,-10", [(0, 10), (20, 30), (90, 100)]),
+        ("bytes=0-9,10-19", [(0, 20)]),
+        ("bytes=80-89,-15", [(80, 100)]),
+        ("bytes=0-9,200-299", [(0, 10)]),
+        ("bytes=200-299,-500", None),
+        ("items=0-9", None),
+    ],
+)
+def test_range_ranges_for_length(value, expect):
+    assert Range.from_header(value).ranges_for_length(100) == expect
+
+
 @pytest.mark.parametrize("value", ["🯱🯲🯳", "+1-", "1-1_23"])
 def test_range_invalid_int(value):
     assert Range.from_header(value) is None
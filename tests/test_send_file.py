@@ -1,5 +1,7 @@
 import datetime
+import gzip
 import io
+import os
 import pathlib
 
 import pytest
@@ -7,6 +9,7 @@ import pytest
 from werkzeug.exceptions import NotFound
 from werkzeug.http import http_date
 from werkzeug.test import create_environ
+from werkzeug.utils import FileMetadataCache
 from werkzeug.utils import send_file
 from werkzeug.utils import send_from_directory
 
@@ -199,3 +202,156 @@ def test_max_age_callable():
     # This is a private API, it should only be used by Flask.
     with send_file(txt_path, environ, max_age=lambda p: 10) as rv:
         assert rv.cache_control.max_age == 10
+
+
+def test_precompressed(tmp_path):
+    path = tmp_path / "style.css"
+    path.write_text("body {}" * 100)
+    gz_path = tmp_path / "style.css.gz"
+    gz_path.write_bytes(gzip.compress(path.read_bytes()))
+    gz_environ = create_environ(headers={"Accept-Encoding": "gzip"})
+
+    rv = send_file(path, gz_environ, precompressed=True)
+    rv.direct_passthrough = False
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert rv.headers["Vary"] == "Accept-Encoding"
+    assert rv.content_length == gz_path.stat().st_size
+    assert rv.mimetype == "text/css"
+    assert rv.get_etag()[0].endswith("-gzip")
+    assert rv.data == gz_path.read_bytes()
+    rv.close()
+
+    rv = send_file(path, environ, precompressed=True)
+    assert "Content-Encoding" not in rv.headers
+    assert rv.headers["Vary"] == "Accept-Encoding"
+    rv.close()
+
+    rv = send_file(path, gz_environ, precompressed={"br": ".br"})
+    assert "Content-Encoding" not in rv.headers
+    assert "Vary" not in rv.headers
+    rv.close()
+
+
+def test_metadata_cache(tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_text("a")
+    cache = FileMetadataCache(revalidate_interval=60)
+    rv = send_file(path, environ, metadata_cache=cache)
+    rv.close()
+    assert len(cache) == 1
+    etag = rv.get_etag()[0]
+    assert rv.headers["Content-Disposition"] == "inline; filename=a.txt"
+
+    # The file isn't checked again within the interval.
+    stat_calls = []
+    real_stat = os.stat
+    monkeypatch.setattr(
+        "werkzeug.utils.os.stat", lambda p: stat_calls.append(p) or real_stat(p)
+    )
+    rv = send_file(path, environ, metadata_cache=cache)
+    rv.close()
+    assert rv.get_etag()[0] == etag
+    assert not stat_calls
+
+    # Different arguments are stored separately.
+    rv = send_file(path, environ, metadata_cache=cache, as_attachment=True)
+    rv.close()
+    assert rv.headers["Content-Disposition"] == "attachment; filename=a.txt"
+    assert len(cache) == 2
+
+    path.write_text("ab")
+    os.utime(path, (0, 0))
+    cache.revalidate_interval = 0
+    rv = send_file(path, environ, metadata_cache=cache)
+    rv.close()
+    assert rv.content_length == 2
+    assert rv.get_etag()[0] != etag
+
+
+def test_metadata_cache_changed_within_interval(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("a")
+    gz_path = tmp_path / "a.txt.gz"
+    gz_path.write_bytes(b"gz")
+    cache = FileMetadataCache(revalidate_interval=60)
+    gzip_environ = {**environ, "HTTP_ACCEPT_ENCODING": "gzip"}
+    rv = send_file(path, gzip_environ, metadata_cache=cache, precompressed=True)
+    rv.close()
+    assert rv.headers["Content-Encoding"] == "gzip"
+    etag = rv.get_etag()[0]
+
+    # The opened file is checked, so the headers match the data.
+    path.write_text("abc")
+    rv = send_file(path, environ, metadata_cache=cache, precompressed=True)
+    rv.direct_passthrough = False
+    assert rv.get_data() == b"abc"
+    assert rv.content_length == 3
+    assert rv.get_etag()[0] != etag
+    rv.close()
+
+    # A precompressed file that changed size is not used.
+    os.utime(gz_path, ns=(path.stat().st_mtime_ns,) * 2)
+    cache.clear()
+    send_file(path, gzip_environ, metadata_cache=cache, precompressed=True).close()
+    gz_path.write_bytes(b"gzip")
+    rv = send_file(path, gzip_environ, metadata_cache=cache, precompressed=True)
+    rv.direct_passthrough = False
+    assert "Content-Encoding" not in rv.headers
+    assert rv.get_data() == b"abc"
+    rv.close()
+
+
+def test_metadata_cache_became_directory(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("a")
+    cache = FileMetadataCache(revalidate_interval=60)
+    send_from_directory(tmp_path, "a.txt", environ, metadata_cache=cache).close()
+    path.unlink()
+    path.mkdir()
+
+    with pytest.raises(NotFound):
+        send_from_directory(tmp_path, "a.txt", environ, metadata_cache=cache)
+
+
+def test_metadata_cache_closes_file(tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_text("a")
+    cache = FileMetadataCache(revalidate_interval=60)
+    send_file(path, environ, metadata_cache=cache).close()
+    path.write_text("ab")
+    opened = []
+    monkeypatch.setattr(
+        "werkzeug.utils.open",
+        lambda *args: opened.append(open(*args)) or opened[-1],
+        raising=False,
+    )
+
+    get = cache._get
+
+    def fail(*args):
+        # Fail when checking again with the opened file's stat.
+        if len(args) == 6:
+            raise FileNotFoundError()
+
+        return get(*args)
+
+    monkeypatch.setattr(cache, "_get", fail)
+
+    with pytest.raises(FileNotFoundError):
+        send_file(path, environ, metadata_cache=cache)
+
+    assert opened[0].closed
+
+
+def test_metadata_cache_from_directory(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_text("a")
+    cache = FileMetadataCache()
+    rv = send_from_directory(tmp_path, "a.txt", environ, metadata_cache=cache)
+    rv.close()
+
+    with pytest.raises(NotFound):
+        send_from_directory(tmp_path, "sub", environ, metadata_cache=cache)
+
+    with pytest.raises(NotFound):
+        send_from_directory(tmp_path, "b.txt", environ, metadata_cache=cache)
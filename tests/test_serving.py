@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import base64
 import collections.abc as cabc
+import hashlib
 import http.client
 import json
 import os
 import shutil
 import socket
 import ssl
+import threading
 import typing as t
 from io import BytesIO
 from pathlib import Path
@@ -20,8 +23,10 @@ from werkzeug._reloader import _find_stat_paths
 from werkzeug._reloader import _find_watchdog_paths
 from werkzeug._reloader import WatchdogReloaderLoop
 from werkzeug.datastructures import FileStorage
+from werkzeug.serving import make_server
 from werkzeug.serving import make_ssl_devcert
 from werkzeug.test import stream_encode_multipart
+from werkzeug.wrappers import Response
 
 if t.TYPE_CHECKING:
     from conftest import DevServerClient
@@ -340,3 +345,41 @@ def test_host_with_ipv6_scope(dev_server: StartDevServer) -> None:
     assert r.status == 500
     assert b"Internal Server Error" in r.data
     assert "Logging error" not in client.read_log()
+
+
+def test_streaming_pipe_trailers() -> None:
+    """The development server sends trailers from a response pipe after
+    the last chunk.
+    """
+
+    def app(environ, start_response):
+        response = Response()
+        stream = response.open_stream(max_buffer_size=2, digest="sha-256")
+
+        def produce():
+            with stream:
+                for x in range(5):
+                    stream.write(f"{x}\n".encode())
+
+        threading.Thread(target=produce).start()
+        return response(environ, start_response)
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+
+    with socket.create_connection(server.server_address[:2]) as sock:
+        sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        data = b""
+
+        while chunk := sock.recv(4096):
+            data += chunk
+
+    thread.join(5)
+    server.server_close()
+    head, _, body = data.partition(b"\r\n\r\n")
+    assert b"Transfer-Encoding: chunked" in head
+    assert b"Trailer:" not in head
+    body_data = "".join(str(x) + "\n" for x in range(5)).encode()
+    digest = base64.b64encode(hashlib.sha256(body_data).digest())
+    assert body.endswith(b"0\r\nContent-Digest: sha-256=:" + digest + b":\r\n\r\n")
@@ -0,0 +1,121 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from werkzeug.serving import make_server
+from werkzeug.sse import EventStream
+from werkzeug.sse import format_event
+from werkzeug.test import Client
+from werkzeug.test import create_environ
+
+
+def start(stream):
+    return stream.response(create_environ(), lambda status, headers: None)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expect"),
+    [
+        ({"data": "a"}, b"data: a\n\n"),
+        ({"data": "a\nb\r\nc"}, b"data: a\ndata: b\ndata: c\n\n"),
+        (
+            {"data": "a", "event": "e", "id": "1", "retry": 10},
+            b"event: e\nid: 1\nretry: 10\ndata: a\n\n",
+        ),
+        ({"comment": "hi"}, b": hi\n\n"),
+    ],
+)
+def test_format_event(kwargs, expect):
+    assert format_event(**kwargs) == expect
+
+
+@pytest.mark.parametrize("kwargs", [{"event": "a\nb"}, {"id": "a\rb"}, {"id": "\0"}])
+def test_format_event_invalid(kwargs):
+    with pytest.raises(ValueError):
+        format_event(**kwargs)
+
+
+def test_response():
+    stream = EventStream()
+    response = stream.response
+    assert response.mimetype == "text/event-stream"
+    assert response.cache_control.no_cache
+    stream.send("a")
+    stream.send("b", event="e")
+    stream.close()
+    assert stream.send("c") is False
+    response = Client(response).get()
+    assert response.data == b"data: a\n\nevent: e\ndata: b\n\n"
+
+
+def test_batching_and_heartbeat():
+    stream = EventStream(heartbeat_interval=0.05)
+    app_iter = iter(start(stream))
+
+    for x in range(3):
+        stream.send(str(x))
+
+    # Events that are waiting are sent in one chunk.
+    assert next(app_iter) == b"data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert next(app_iter) == b":\n\n"
+
+    def send_later():
+        time.sleep(0.01)
+        stream.send("d")
+
+    threading.Thread(target=send_later).start()
+    assert next(app_iter) == b"data: d\n\n"
+    stream.close()
+    assert list(app_iter) == []
+
+
+def test_disconnect():
+    stream = EventStream()
+    closed = []
+    stream.call_on_close(lambda: closed.append(True))
+    app_iter = start(stream)
+    stream.send("a")
+    app_iter.close()
+    assert stream.closed
+    assert closed == [True]
+    assert stream.send("b") is False
+
+    # A function registered after closing is called immediately.
+    stream.call_on_close(lambda: closed.append(True))
+    assert closed == [True, True]
+
+
+def test_slow_client():
+    stream = EventStream(max_buffer_size=20)
+    closed = []
+    stream.call_on_close(lambda: closed.append(True))
+    assert stream.send("a")
+    assert not stream.send("b" * 20)
+    assert stream.closed
+    assert closed == [True]
+
+
+def test_server_disconnect():
+    stream = EventStream(heartbeat_interval=0.05)
+    closed = threading.Event()
+    stream.call_on_close(closed.set)
+    server = make_server("127.0.0.1", 0, stream.response, threaded=True)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+
+    with socket.create_connection(server.server_address[:2]) as sock:
+        sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        stream.send("a")
+        data = b""
+
+        while b"data: a" not in data:
+            chunk = sock.recv(4096)
+            assert chunk
+            data += chunk
+
+    # Writing a heartbeat fails after the client disconnects.
+    assert closed.wait(5)
+    thread.join(5)
+    server.server_close()
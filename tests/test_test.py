@@ -15,6 +15,7 @@ from werkzeug.test import Client
 from werkzeug.test import ClientRedirectError
 from werkzeug.test import create_environ
 from werkzeug.test import EnvironBuilder
+from werkzeug.test import MultipartStream
 from werkzeug.test import run_wsgi_app
 from werkzeug.test import stream_encode_multipart
 from werkzeug.test import TestResponse
@@ -379,6 +380,60 @@ def test_environ_builder_empty_file():
             files["f"].close()
 
 
+def test_multipart_stream_matches_encoded(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\r\n".join(b"line %d" % i for i in range(1000)))
+    empty = FileStorage(BytesIO(), "empty.txt")
+
+    with path.open("rb") as fp:
+        f = FileStorage(fp, "data.bin")
+        d = MultiDict([("s", "\N{SNOWMAN}"), ("f", f), ("e", empty), ("s", 1)])
+        stream = MultipartStream(d, boundary="b")
+        data = stream.read()
+
+        f.seek(0)
+        empty.seek(0)
+        assert stream.content_length == len(data)
+        assert stream_encode_multipart(d, boundary="b")[0].read() == data
+
+
+def test_multipart_stream_seek_and_partial_read():
+    f = FileStorage(BytesIO(b"abcdef" * 100), "data.bin")
+    stream = MultipartStream({"f": f, "s": "value"})
+    data = stream.read()
+    assert stream.seek(0, io.SEEK_END) == stream.content_length
+    stream.seek(0)
+    assert b"".join(iter(partial(stream.read, 7), b"")) == data
+    stream.seek(len(data) // 2)
+    assert stream.read() == data[len(data) // 2 :]
+
+
+def test_multipart_stream_unseekable_file():
+    class Unseekable(io.RawIOBase):
+        def __init__(self):
+            self.data = BytesIO(b"data")
+
+        def readable(self):
+            return True
+
+        def readinto(self, b):
+            return self.data.readinto(b)
+
+    stream = MultipartStream({"f": FileStorage(Unseekable(), "data.bin")})
+    assert stream.content_length == len(stream.read())
+
+
+def test_multipart_stream_client():
+    @Request.application
+    def app(request):
+        return Response(request.files["f"].read() + request.form["s"].encode())
+
+    f = FileStorage(BytesIO(b"data" * 1000), "data.bin")
+    stream = MultipartStream({"f": f, "s": "value"})
+    response = Client(app).post(input_stream=stream)
+    assert response.data == b"data" * 1000 + b"value"
+
+
 def test_create_environ():
     env = create_environ("/foo?bar=baz", "http://example.org/")
     expected = {
@@ -1,6 +1,10 @@
+import base64
 import contextlib
+import hashlib
 import json
 import os
+import threading
+import time
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -18,9 +22,13 @@ from werkzeug.datastructures import MultiDict
 from werkzeug.datastructures import WWWAuthenticate
 from werkzeug.exceptions import BadRequest
 from werkzeug.exceptions import RequestedRangeNotSatisfiable
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.exceptions import SecurityError
+from werkzeug.exceptions import ServiceUnavailable
 from werkzeug.exceptions import UnsupportedMediaType
+from werkzeug.formparser import MemoryBudget
 from werkzeug.http import COEP
+from werkzeug.http import CookieTemplate
 from werkzeug.http import COOP
 from werkzeug.http import generate_etag
 from werkzeug.test import Client
@@ -298,6 +306,38 @@ def test_base_response():
     assert len(closed) == 1
 
 
+def test_response_cookie_template():
+    template = CookieTemplate("foo", path="/blub", domain="example.org", secure=True)
+    response = wrappers.Response()
+    response.set_cookie(template, "bar", max_age=60, expires=0)
+    response.delete_cookie(template)
+    assert response.headers.getlist("Set-Cookie") == [
+        "foo=bar; Domain=example.org; Expires=Thu, 01 Jan 1970 00:00:00 GMT;"
+        " Max-Age=60; Secure; Path=/blub",
+        "foo=; Domain=example.org; Expires=Thu, 01 Jan 1970 00:00:00 GMT;"
+        " Max-Age=0; Secure; Path=/blub",
+    ]
+
+
+def test_response_cookie_template_max_size():
+    template = CookieTemplate("foo")
+    response = wrappers.Response()
+    response.max_cookie_size = 512
+
+    with pytest.warns(UserWarning, match="the limit is 512 bytes"):
+        response.set_cookie(template, "w" * 501)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"path": "/a"}, {"domain": "example.org"}, {"secure": True}]
+)
+def test_response_cookie_template_attributes(kwargs):
+    response = wrappers.Response()
+
+    with pytest.raises(TypeError):
+        response.set_cookie(CookieTemplate("foo"), "bar", **kwargs)
+
+
 @pytest.mark.parametrize(
     ("status_code", "expected_status"),
     [
@@ -467,6 +507,123 @@ def test_data_descriptor_triggers_parsing():
     assert req.form["foo"] == "Hello World"
 
 
+def test_get_data_memory_budget():
+    budget = MemoryBudget(10)
+
+    class BudgetRequest(wrappers.Request):
+        memory_budget = budget
+
+    with BudgetRequest.from_values(method="POST", data=b"a" * 6) as req:
+        assert req.get_data() == b"a" * 6
+        assert budget.in_use == 6
+
+        with BudgetRequest.from_values(method="POST", data=b"b" * 6) as other:
+            with pytest.raises(ServiceUnavailable):
+                other.get_data()
+
+        assert budget.in_use == 6
+
+    with BudgetRequest.from_values(method="POST", data=b"c" * 11) as req:
+        with pytest.raises(RequestEntityTooLarge):
+            req.get_data()
+
+    assert budget.in_use == 0
+    assert budget.high_water == 6
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+def test_iter_json_array(chunk_size):
+    items = [1, 23.5, "\N{SNOWMAN}]", {"a": [1, 2]}, [], None, True, -456]
+    data = json.dumps(items, indent=2).encode()
+    request = wrappers.Request.from_values(data=data, content_type="application/json")
+    assert list(request.iter_json(chunk_size=chunk_size)) == items
+
+
+def test_iter_json_array_large_item():
+    item = {"a": ["x" * 10_000, 'q\\"[{'] * 100, "b": [[1, 2]] * 1000}
+    data = json.dumps([item, 1]).encode()
+    request = wrappers.Request.from_values(data=data, content_type="application/json")
+    assert list(request.iter_json(chunk_size=1000)) == [item, 1]
+
+
+@pytest.mark.parametrize("data", [b'["' + b"a" * 100, b"[" + b"[" * 100, b"1" * 100])
+@pytest.mark.parametrize("lines", [False, True])
+def test_iter_json_max_item_size(data, lines):
+    request = wrappers.Request.from_values(
+        data=b"[1, " + data, content_type="application/json"
+    )
+
+    with pytest.raises(RequestEntityTooLarge):
+        list(request.iter_json(lines=lines, chunk_size=7, max_item_size=50))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+def test_iter_json_lines(chunk_size):
+    data = b'{"a": 1}\n\n[2, 3]\r\n"\xe2\x98\x83"\n4'
+    request = wrappers.Request.from_values(
+        data=data, content_type="application/x-ndjson"
+    )
+    assert list(request.iter_json(chunk_size=chunk_size)) == [{"a": 1}, [2, 3], "☃", 4]
+
+
+@pytest.mark.parametrize(
+    ("data", "content_type"),
+    [(b'[{"a": 1}, 2]', "application/json"), (b'{"a": 1}\n2', "application/jsonl")],
+)
+def test_iter_json_module(data, content_type):
+    loaded = []
+
+    class JSONModule:
+        @staticmethod
+        def loads(value):
+            loaded.append(value)
+            return json.loads(value)
+
+    class JSONRequest(wrappers.Request):
+        json_module = JSONModule
+
+    request = JSONRequest.from_values(data=data, content_type=content_type)
+    assert list(request.iter_json()) == [{"a": 1}, 2]
+    assert loaded == ['{"a": 1}', "2"]
+
+
+def test_iter_json_empty_array():
+    request = wrappers.Request.from_values(
+        data=b" [ ] ", content_type="application/json"
+    )
+    assert list(request.iter_json()) == []
+
+
+@pytest.mark.parametrize(
+    "data", [b'{"a": 1}', b"[1, 2", b"[1 2]", b"[1,]", b"[1] 2", b"", b"[1, {]"]
+)
+def test_iter_json_invalid(data):
+    request = wrappers.Request.from_values(data=data, content_type="application/json")
+
+    with pytest.raises(BadRequest):
+        list(request.iter_json())
+
+
+def test_iter_json_content_type():
+    request = wrappers.Request.from_values(data=b"[1]", content_type="text/plain")
+
+    with pytest.raises(UnsupportedMediaType):
+        list(request.iter_json())
+
+    request = wrappers.Request.from_values(data=b"[1]", content_type="text/plain")
+    assert list(request.iter_json(force=True)) == [1]
+
+
+def test_iter_json_max_content_length():
+    request = wrappers.Request.from_values(
+        data=b"[1, 2, 3]", content_type="application/json"
+    )
+    request.max_content_length = 4
+
+    with pytest.raises(RequestEntityTooLarge):
+        list(request.iter_json())
+
+
 def test_get_data_method_parsing_caching_behavior():
     data = b"foo=Hello+World"
     req = wrappers.Request.from_values(
@@ -657,6 +814,75 @@ def test_range_request_with_complete_file():
         assert response.data == fcontent
 
 
+def _parse_byteranges(response):
+    boundary = response.mimetype_params["boundary"].encode()
+    body = response.get_data()
+    assert body.endswith(b"\r\n--" + boundary + b"--\r\n")
+    assert len(body) == response.content_length
+    parts = []
+
+    for part in body.split(b"--" + boundary)[1:-1]:
+        head, _, data = part[2:].partition(b"\r\n\r\n")
+        headers = dict(line.split(": ", 1) for line in head.decode().split("\r\n"))
+        parts.append((headers, data.removesuffix(b"\r\n")))
+
+    return parts
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_multiple_range_request(seekable):
+    data = bytes(range(256)) * 4
+    env = create_environ(headers={"Range": "bytes=0-9,500-509,-10"})
+
+    if seekable:
+        response = wrappers.Response(wrap_file(env, BytesIO(data)))
+    else:
+        response = wrappers.Response(iter([data[:300], data[300:]]))
+
+    response.content_type = "application/octet-stream"
+    response.make_conditional(env, accept_ranges=True, complete_length=len(data))
+    assert response.status_code == 206
+    assert response.mimetype == "multipart/byteranges"
+    assert "Content-Range" not in response.headers
+    assert _parse_byteranges(response) == [
+        (
+            {
+                "Content-Type": "application/octet-stream",
+                "Content-Range": f"bytes {start}-{stop - 1}/1024",
+            },
+            data[start:stop],
+        )
+        for start, stop in [(0, 10), (500, 510), (1014, 1024)]
+    ]
+
+
+def test_multiple_range_request_merged():
+    data = bytes(range(256)) * 4
+    env = create_environ(headers={"Range": "bytes=900-999,-200"})
+    response = wrappers.Response(data)
+    response.make_conditional(env, accept_ranges=True, complete_length=len(data))
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == "bytes 824-1023/1024"
+    assert response.data == data[824:]
+
+
+def test_multiple_range_request_limited(monkeypatch):
+    data = bytes(range(256)) * 4
+    env = create_environ(headers={"Range": "bytes=0-9,500-509,-10"})
+    response = wrappers.Response(data)
+    monkeypatch.setattr(response, "max_ranges", 2)
+    response.make_conditional(env, accept_ranges=True, complete_length=len(data))
+    assert response.status_code == 200
+    assert response.data == data
+
+    # The parts would be larger than the full content.
+    env = create_environ(headers={"Range": "bytes=0-0,2-2"})
+    response = wrappers.Response(b"Hello World")
+    response.make_conditional(env, accept_ranges=True, complete_length=11)
+    assert response.status_code == 200
+    assert response.data == b"Hello World"
+
+
 @pytest.mark.parametrize("value", [None, 0])
 def test_range_request_without_complete_length(value):
     env = create_environ(headers={"Range": "bytes=0-10"})
@@ -680,6 +906,72 @@ def test_etag_response_freezing():
     assert response.get_etag() == (str(generate_etag(b"Hello World")), False)
 
 
+def test_add_etag_content_length():
+    response = Response(["Hello", " World"])
+    response.headers.pop("Content-Length", None)
+    response.add_etag()
+    assert response.get_etag() == (generate_etag(b"Hello World"), False)
+    assert response.headers["Content-Length"] == "11"
+
+
+@pytest.mark.parametrize("spool_size", [0, 100])
+def test_add_etag_spooled(spool_size):
+    consumed = []
+
+    def generate():
+        for _ in range(10):
+            consumed.append(1)
+            yield b"Hello World"
+
+    data = b"Hello World" * 10
+    response = Response(generate(), direct_passthrough=True)
+    response.add_etag(spool_size=spool_size)
+    assert len(consumed) == 10
+    assert not response.is_sequence
+    assert response.get_etag() == (generate_etag(data), False)
+    assert response.headers["Content-Length"] == str(len(data))
+
+    env = create_environ(headers={"If-None-Match": f'"{generate_etag(data)}"'})
+    response.make_conditional(env)
+    assert response.status_code == 304
+    response.status_code = 200
+    app_iter, status, headers = run_wsgi_app(response, create_environ())
+    assert b"".join(app_iter) == data
+    app_iter.close()
+    assert response.response.file.closed
+
+
+def test_not_modified():
+    calls = []
+
+    @wrappers.Request.application
+    def app(request):
+        rv = Response.not_modified(request, "v1", datetime(2026, 1, 1))
+
+        if rv is not None:
+            return rv
+
+        calls.append(1)
+        response = Response("Hello World")
+        response.set_etag("v1")
+        return response
+
+    client = Client(app)
+    response = client.get(headers={"If-None-Match": '"v1"'})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v1"'
+    assert response.data == b""
+    assert not calls
+
+    response = client.get(headers={"If-None-Match": '"v0"'})
+    assert response.status_code == 200
+    assert response.data == b"Hello World"
+    assert calls
+
+    response = client.get(headers={"If-Match": '"v0"'})
+    assert response.status_code == 412
+
+
 def test_authenticate():
     resp = wrappers.Response()
     resp.www_authenticate.realm = "Testing"
@@ -1062,6 +1354,135 @@ def test_auto_content_length():
     assert resp.get_wsgi_headers({})["Content-Length"] == "12"
 
 
+@pytest.mark.parametrize(
+    ("make_response", "method"),
+    [
+        (lambda: Response("Hello", headers={"X-Test": "a"}), "GET"),
+        (lambda: Response([b"Hello", b"World"], mimetype="application/json"), "GET"),
+        (lambda: Response(["Hello"]), "GET"),
+        (lambda: Response("Hello"), "HEAD"),
+        (lambda: Response("Hello", status=204), "GET"),
+        (lambda: Response("Hello", status=304, headers={"ETag": '"a"'}), "GET"),
+        (lambda: Response("Hello", headers={"Location": "/a"}), "GET"),
+        (lambda: Response("Hello", headers={"Content-Location": "/ä"}), "GET"),
+        (lambda: Response("Hello", headers={"Content-Length": "5"}), "GET"),
+    ],
+)
+def test_simple_wsgi_response(make_response, method):
+    environ = create_environ(method=method)
+    expect = make_response().get_wsgi_response(environ)
+    app_iter, status, headers = run_wsgi_app(make_response(), environ)
+    assert status == expect[1]
+    assert headers.to_wsgi_list() == expect[2]
+    assert b"".join(app_iter) == b"".join(expect[0])
+
+
+def test_simple_wsgi_response_fallback():
+    environ = create_environ()
+    response = Response("Hello")
+    closed = []
+    response.call_on_close(lambda: closed.append(True))
+    assert response._get_simple_wsgi_response(environ) is None
+    app_iter, _, _ = run_wsgi_app(response, environ)
+    app_iter.close()
+    assert closed
+
+    class MyResponse(Response):
+        def get_wsgi_headers(self, environ):
+            headers = super().get_wsgi_headers(environ)
+            headers["X-Custom"] = "a"
+            return headers
+
+    _, _, headers = run_wsgi_app(MyResponse("Hello"), environ)
+    assert headers["X-Custom"] == "a"
+
+    class ClosingResponse(Response):
+        def close(self):
+            super().close()
+            closed.append("subclass")
+
+    app_iter, _, _ = run_wsgi_app(ClosingResponse("Hello"), environ)
+    app_iter.close()
+    assert closed[-1] == "subclass"
+
+
+def test_response_pipe():
+    response = Response(mimetype="text/plain")
+    stream = response.open_stream(max_buffer_size=4, digest="sha-256")
+    written = []
+
+    def produce():
+        with stream:
+            for value in (b"ab", b"cd", b"ef", b"ghijkl"):
+                stream.write(value)
+                written.append(value)
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    app_iter, status, headers = run_wsgi_app(response, create_environ())
+    assert "Content-Length" not in headers
+    assert "Trailer" not in headers
+    app_iter = iter(app_iter)
+    assert next(app_iter) == b"ab"
+    # The writer is blocked until there is room in the buffer.
+    time.sleep(0.05)
+    assert len(written) <= 3
+    assert b"".join(app_iter) == b"cdefghijkl"
+    thread.join(5)
+    assert stream.tell() == 12
+    digest = base64.b64encode(hashlib.sha256(b"abcdefghijkl").digest()).decode()
+    assert response.response.trailers == [("Content-Digest", f"sha-256=:{digest}:")]
+
+
+def test_response_pipe_str():
+    response = Response()
+    stream = response.open_stream(digest="sha-256")
+
+    with stream:
+        assert stream.write("\N{SNOWMAN}") == 3
+
+    app_iter, _, _ = run_wsgi_app(response, create_environ())
+    assert list(app_iter) == ["\N{SNOWMAN}".encode()]
+    assert stream.tell() == 3
+
+
+def test_response_pipe_abort():
+    response = Response()
+    stream = response.open_stream()
+
+    with pytest.raises(ZeroDivisionError), stream:
+        stream.write(b"a")
+        _ = 1 / 0
+
+    app_iter = iter(response.response)
+    assert next(app_iter) == b"a"
+
+    with pytest.raises(ZeroDivisionError):
+        next(app_iter)
+
+    with pytest.raises(ValueError):
+        stream.write(b"b")
+
+
+def test_response_pipe_reader_closed():
+    response = Response()
+    stream = response.open_stream(max_buffer_size=1)
+    stream.write(b"a")
+    errors = []
+
+    def produce():
+        try:
+            stream.write(b"b")
+        except BrokenPipeError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    response.close()
+    thread.join(5)
+    assert errors
+
+
 def test_stream_content_length():
     resp = wrappers.Response()
     resp.stream.writelines(["foo", "bar", "baz"])